@@ -12,9 +12,12 @@ from concreteproperties.material import Concrete, Steel, SteelBar, SteelStrand
 
 # geometry
 from concreteproperties.pre import (
+    LumpedBar,
     add_bar,
     add_bar_circular_array,
     add_bar_rectangular_array,
+    add_bars,
+    create_lumped_bars,
 )
 from concreteproperties.prestressed_section import PrestressedSection
 
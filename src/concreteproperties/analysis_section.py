@@ -27,25 +27,36 @@ class AnalysisSection:
     def __init__(
         self,
         geometry: CPGeom,
+        mesh_nodes: np.ndarray | None = None,
+        mesh_elements: np.ndarray | None = None,
     ) -> None:
         """Inits the AnalysisSection class.
 
         Args:
             geometry: Geometry object
+            mesh_nodes: Coordinates of the nodes of an existing mesh of the geometry,
+                if provided (with ``mesh_elements``) the geometry is not meshed.
+                Defaults to ``None``.
+            mesh_elements: Node indices of the elements of an existing mesh of the
+                geometry. Defaults to ``None``.
         """
         self.geometry = geometry
         self.material = geometry.material
 
-        # create simple mesh
-        tri = {}  # create tri dictionary
-        tri["vertices"] = geometry.points  # set point
-        tri["segments"] = geometry.facets  # set facets
+        if mesh_nodes is not None and mesh_elements is not None:
+            # use the existing mesh
+            self.mesh = {"vertices": mesh_nodes, "triangles": mesh_elements}
+        else:
+            # create simple mesh
+            tri = {}  # create tri dictionary
+            tri["vertices"] = geometry.points  # set point
+            tri["segments"] = geometry.facets  # set facets
 
-        if geometry.holes:
-            tri["holes"] = geometry.holes  # set holes
+            if geometry.holes:
+                tri["holes"] = geometry.holes  # set holes
 
-        # coarse mesh
-        self.mesh = triangle.triangulate(tri, "p")
+            # coarse mesh
+            self.mesh = triangle.triangulate(tri, "p")
 
         # extract mesh data
         self.mesh_nodes = np.array(self.mesh["vertices"], dtype=np.dtype(float))
@@ -120,26 +131,15 @@ class AnalysisSection:
             Elastic stresses, net force and distance from neutral axis to point of force
             action
         """
-        # intialise stress results
-        sig = np.zeros(len(self.mesh_nodes))
-
-        # loop through nodes
-        for idx, node in enumerate(self.mesh_nodes):
-            x = node[0] - cx
-            y = node[1] - cy
-
-            # axial stress
-            sig[idx] += n * self.material.elastic_modulus / e_a
-
-            # bending moment
-            sig[idx] += self.material.elastic_modulus * (
-                -(e_ixy * m_x) / (e_ixx * e_iyy - e_ixy**2) * x
-                + (e_iyy * m_x) / (e_ixx * e_iyy - e_ixy**2) * y
-            )
-            sig[idx] += self.material.elastic_modulus * (
-                +(e_ixx * m_y) / (e_ixx * e_iyy - e_ixy**2) * x
-                - (e_ixy * m_y) / (e_ixx * e_iyy - e_ixy**2) * y
-            )
+        # stresses at all nodes
+        x = self.mesh_nodes[:, 0] - cx
+        y = self.mesh_nodes[:, 1] - cy
+        det = e_ixx * e_iyy - e_ixy**2
+        sig = self.material.elastic_modulus * (
+            n / e_a
+            + (-e_ixy * m_x + e_ixx * m_y) / det * x
+            + (e_iyy * m_x - e_ixy * m_y) / det * y
+        )
 
         # initialise section actions
         n_sec = 0
@@ -173,6 +173,68 @@ class AnalysisSection:
 
         return sig, n_sec, d_x, d_y
 
+    def get_elastic_stress_basis(
+        self,
+        e_a: float,
+        cx: float,
+        cy: float,
+        e_ixx: float,
+        e_iyy: float,
+        e_ixy: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculates elastic stresses and actions for unit section actions.
+
+        As the elastic stress is linear in the applied actions, the stresses and
+        actions for any combination of axial force and bending moments can be found by
+        multiplying the returned basis by the vector of actions (``n``, ``m_x``,
+        ``m_y``).
+
+        Args:
+            e_a: Axial rigidity
+            cx: x-Centroid
+            cy: y-Centroid
+            e_ixx: Flexural rigidity about the x-axis
+            e_iyy: Flexural rigidity about the y-axis
+            e_ixy: Flexural rigidity about the xy-axis
+
+        Returns:
+            Nodal stresses for a unit axial force and unit bending moments about the x
+            and y axes [nodes x 3], and the net force and moments about the x and y axes
+            (rows) for each unit action (columns) [3 x 3]
+        """
+        x = self.mesh_nodes[:, 0] - cx
+        y = self.mesh_nodes[:, 1] - cy
+        e = self.material.elastic_modulus
+        det = e_ixx * e_iyy - e_ixy**2
+
+        # nodal stresses for unit n, m_x and m_y
+        sig = np.column_stack(
+            [
+                np.full_like(x, e / e_a),
+                e * (-e_ixy * x + e_iyy * y) / det,
+                e * (e_ixx * x - e_ixy * y) / det,
+            ]
+        )
+
+        # net actions for unit n, m_x and m_y
+        actions = np.zeros((3, 3))
+
+        for idx, (n, m_x, m_y) in enumerate(np.eye(3)):
+            for el in self.elements:
+                actions[:, idx] += el.calculate_elastic_actions(
+                    n=n,
+                    m_x=m_x,
+                    m_y=m_y,
+                    e_a=e_a,
+                    cx=cx,
+                    cy=cy,
+                    e_ixx=e_ixx,
+                    e_iyy=e_iyy,
+                    e_ixy=e_ixy,
+                )
+
+        return sig, actions
+
     def service_analysis(
         self,
         ecf: tuple[float, float],
@@ -249,22 +311,17 @@ class AnalysisSection:
             Service stresses, net force and distance from centroid to point of force
             action
         """
-        # intialise stress results
-        sig = np.zeros(len(self.mesh_nodes))
-
-        # loop through nodes and calculate stress at nodes
-        for idx, node in enumerate(self.mesh_nodes):
-            # get strain at node
-            strain = utils.get_service_strain(
-                point=(node[0], node[1]),
-                ecf=ecf,
-                eps0=eps0,
-                theta=theta,
-                kappa=kappa,
-            )
+        # get strain at all nodes
+        strain = utils.get_service_strain(
+            point=(self.mesh_nodes[:, 0], self.mesh_nodes[:, 1]),
+            ecf=ecf,
+            eps0=eps0,
+            theta=theta,
+            kappa=kappa,
+        )
 
-            # get stress at node
-            sig[idx] = self.material.stress_strain_profile.get_stress(strain=strain)
+        # get stress at all nodes
+        sig = self.material.stress_strain_profile.get_stresses(strains=strain)
 
         # calculate total force
         n_sec, m_x_sec, m_y_sec, _, _ = self.service_analysis(
@@ -351,30 +408,25 @@ class AnalysisSection:
             Ultimate stresses net force and distance from neutral axis to point of force
             action
         """
-        # intialise stress results
-        sig = np.zeros(len(self.mesh_nodes))
-
-        # loop through nodes
-        for idx, node in enumerate(self.mesh_nodes):
-            # get strain at node
-            if isinf(d_n):
-                strain = ultimate_strain
-            else:
-                strain = utils.get_ultimate_strain(
-                    point=(node[0], node[1]),
-                    point_na=point_na,
-                    d_n=d_n,
-                    theta=theta,
-                    ultimate_strain=ultimate_strain,
-                )
+        # get strain at all nodes
+        if isinf(d_n):
+            strain = np.full(len(self.mesh_nodes), ultimate_strain)
+        else:
+            strain = utils.get_ultimate_strain(
+                point=(self.mesh_nodes[:, 0], self.mesh_nodes[:, 1]),
+                point_na=point_na,
+                d_n=d_n,
+                theta=theta,
+                ultimate_strain=ultimate_strain,
+            )
 
-            # get stress at node
-            if isinstance(self.material, Concrete):
-                sig[idx] = self.material.ultimate_stress_strain_profile.get_stress(
-                    strain=strain
-                )
-            else:
-                sig[idx] = self.material.stress_strain_profile.get_stress(strain=strain)
+        # get stress at all nodes
+        if isinstance(self.material, Concrete):
+            sig = self.material.ultimate_stress_strain_profile.get_stresses(
+                strains=strain
+            )
+        else:
+            sig = self.material.stress_strain_profile.get_stresses(strains=strain)
 
         # calculate total force
         n_sec, m_x_sec, m_y_sec = self.ultimate_analysis(
@@ -0,0 +1,352 @@
+"""Contains a process pool runner for batches of analyses."""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import json
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from concreteproperties.utils import AnalysisError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+    from concreteproperties.concrete_section import ConcreteSection
+
+
+class BatchTimeoutError(Exception):
+    """Exception raised when a job in a batch exceeds its time limit."""
+
+    pass
+
+
+@dataclass
+class BatchJob:
+    """Class for a job in a batch of analyses.
+
+    Args:
+        section: Concrete section to analyse, or a function returning the concrete
+            section. Functions are called in the worker process, i.e. the concrete
+            section is not sent to the worker, and must be picklable, e.g. a
+            module-level function or a ``functools.partial`` object. Jobs in the same
+            chunk that share a function share the concrete section.
+        method: Name of the method to call, e.g. ``"moment_interaction_diagram"`` or
+            ``"calculate_cracked_properties"``
+        kwargs: Keyword arguments passed to the method. Progress bars are disabled
+            unless ``progress_bar`` is provided. Defaults to ``{}``.
+        job_id: Identifier of the job, if not provided the position of the job in the
+            batch is used. Defaults to ``None``.
+    """
+
+    section: ConcreteSection | Callable[[], ConcreteSection]
+    method: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    job_id: Hashable | None = None
+
+
+@dataclass
+class BatchResult:
+    """Class for the result of a job in a batch of analyses.
+
+    Args:
+        job_id: Identifier of the job
+        index: Position of the job in the batch
+        method: Name of the method called
+        result: Value returned by the method, ``None`` if the job failed
+        error: Error message if the job failed, ``None`` otherwise
+        elapsed: Time taken to run the job (in seconds)
+    """
+
+    job_id: Hashable
+    index: int
+    method: str
+    result: Any = None
+    error: str | None = None
+    elapsed: float = 0
+
+    @property
+    def success(self) -> bool:
+        """Returns ``True`` if the job succeeded.
+
+        Returns:
+            Whether the job succeeded
+        """
+        return self.error is None
+
+
+class NpzSink:
+    """Output sink saving the results of a batch to a directory.
+
+    Results with a ``to_npz`` method (see :ref:`label-results`) are saved to
+    ``<job_id>.npz``. A JSON line describing each job, i.e. its identifier, method,
+    error message, elapsed time and file name, is appended to ``jobs.jsonl``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+    ) -> None:
+        """Inits the NpzSink class.
+
+        Args:
+            directory: Output directory, created if it does not exist
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __call__(
+        self,
+        batch_result: BatchResult,
+    ) -> None:
+        """Saves the result of a job.
+
+        Args:
+            batch_result: Result of a job
+        """
+        file_name = None
+
+        if batch_result.success and hasattr(batch_result.result, "to_npz"):
+            file_name = f"{batch_result.job_id}.npz"
+            batch_result.result.to_npz(self.directory / file_name)
+
+        record = {
+            "job_id": str(batch_result.job_id),
+            "index": batch_result.index,
+            "method": batch_result.method,
+            "error": batch_result.error,
+            "elapsed": batch_result.elapsed,
+            "file": file_name,
+        }
+
+        with open(self.directory / "jobs.jsonl", "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def iter_batch(
+    jobs: Iterable[BatchJob],
+    max_workers: int | None = None,
+    chunk_size: int = 8,
+    timeout: float | None = None,
+    isolate: tuple[type[Exception], ...] = (AnalysisError,),
+) -> Iterator[BatchResult]:
+    """Runs a batch of analyses across a process pool.
+
+    Jobs are read lazily from ``jobs`` and sent to the workers in chunks, results are
+    yielded as each chunk completes, i.e. not necessarily in the order of the jobs.
+
+    Args:
+        jobs: Jobs to run, may be a generator
+        max_workers: Number of worker processes, if ``None`` the number of CPUs is
+            used. If set to ``0``, the jobs are run in the current process. Defaults to
+            ``None``.
+        chunk_size: Number of jobs sent to a worker at a time. Defaults to ``8``.
+        timeout: Time limit (in seconds) for each job, excluding the creation of the
+            concrete section, if exceeded the job fails with a
+            :class:`BatchTimeoutError`. Time limits are only enforced on platforms
+            supporting ``SIGALRM``. Defaults to ``None``.
+        isolate: Exceptions that cause a job to fail without stopping the batch, any
+            other exception is raised. Defaults to ``(AnalysisError,)``.
+
+    Raises:
+        ValueError: If ``chunk_size`` is less than one
+
+    Yields:
+        Result of each job
+    """
+    if chunk_size < 1:
+        msg = f"chunk_size must be at least one, not {chunk_size}."
+        raise ValueError(msg)
+
+    isolate = (*isolate, BatchTimeoutError)
+    indexed_jobs = enumerate(jobs)
+    chunks = iter(lambda: list(islice(indexed_jobs, chunk_size)), [])
+
+    if max_workers == 0:
+        for chunk in chunks:
+            yield from _run_chunk(chunk=chunk, timeout=timeout, isolate=isolate)
+
+        return
+
+    n_workers = max_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=n_workers)
+
+    try:
+        pending = set()
+
+        for chunk in chunks:
+            pending.add(
+                executor.submit(
+                    _run_chunk, chunk=chunk, timeout=timeout, isolate=isolate
+                )
+            )
+
+            # limit the number of chunks in flight, so that jobs are read lazily
+            if len(pending) >= 2 * n_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield from future.result()
+
+        for future in as_completed(pending):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    sink: Callable[[BatchResult], None],
+    max_workers: int | None = None,
+    chunk_size: int = 8,
+    timeout: float | None = None,
+    isolate: tuple[type[Exception], ...] = (AnalysisError,),
+) -> tuple[int, int]:
+    """Runs a batch of analyses, passing each result to ``sink`` as it completes.
+
+    See :func:`iter_batch` for a description of the arguments.
+
+    Args:
+        jobs: Jobs to run, may be a generator
+        sink: Function called with the result of each job, e.g. a :class:`NpzSink`
+        max_workers: Number of worker processes. Defaults to ``None``.
+        chunk_size: Number of jobs sent to a worker at a time. Defaults to ``8``.
+        timeout: Time limit (in seconds) for each job. Defaults to ``None``.
+        isolate: Exceptions that cause a job to fail without stopping the batch.
+            Defaults to ``(AnalysisError,)``.
+
+    Returns:
+        Number of successful and failed jobs
+    """
+    n_success = 0
+    n_failed = 0
+
+    for batch_result in iter_batch(
+        jobs=jobs,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        timeout=timeout,
+        isolate=isolate,
+    ):
+        sink(batch_result)
+
+        if batch_result.success:
+            n_success += 1
+        else:
+            n_failed += 1
+
+    return n_success, n_failed
+
+
+def _run_chunk(
+    chunk: list[tuple[int, BatchJob]],
+    timeout: float | None,
+    isolate: tuple[type[Exception], ...],
+) -> list[BatchResult]:
+    """Runs a chunk of jobs, in a worker process.
+
+    Args:
+        chunk: Position in the batch and job
+        timeout: Time limit (in seconds) for each job
+        isolate: Exceptions that cause a job to fail
+
+    Returns:
+        Result of each job
+    """
+    # sections shared by jobs in the chunk are only created once
+    sections: dict[int, Any] = {}
+    batch_results = []
+
+    for index, job in chunk:
+        job_id = index if job.job_id is None else job.job_id
+        start = time.perf_counter()
+
+        try:
+            # the time limit only applies to the analysis, not to creating the section
+            section = sections.get(id(job.section))
+
+            if section is None:
+                section = job.section() if callable(job.section) else job.section
+                sections[id(job.section)] = section
+
+            with _time_limit(timeout=timeout):
+                method = getattr(section, job.method)
+                kwargs = dict(job.kwargs)
+
+                if "progress_bar" in inspect.signature(method).parameters:
+                    kwargs.setdefault("progress_bar", False)
+
+                result = method(**kwargs)
+        except isolate as exc:
+            # an interrupted analysis may leave the section partially updated, so it
+            # is created again for the next job
+            if isinstance(exc, BatchTimeoutError):
+                sections.pop(id(job.section), None)
+
+            batch_results.append(
+                BatchResult(
+                    job_id=job_id,
+                    index=index,
+                    method=job.method,
+                    error=f"{type(exc).__name__}: {exc}",
+                    elapsed=time.perf_counter() - start,
+                )
+            )
+        else:
+            batch_results.append(
+                BatchResult(
+                    job_id=job_id,
+                    index=index,
+                    method=job.method,
+                    result=result,
+                    elapsed=time.perf_counter() - start,
+                )
+            )
+
+    return batch_results
+
+
+@contextlib.contextmanager
+def _time_limit(timeout: float | None) -> Iterator[None]:
+    """Raises a :class:`BatchTimeoutError` if the block exceeds the time limit.
+
+    The time limit is only enforced in the main thread on platforms supporting
+    ``SIGALRM``.
+
+    Args:
+        timeout: Time limit (in seconds)
+
+    Raises:
+        BatchTimeoutError: If the time limit is exceeded
+
+    Yields:
+        None
+    """
+    if (
+        timeout is None
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def handler(signum: int, frame: Any) -> None:
+        msg = f"Job exceeded the time limit of {timeout} s."
+        raise BatchTimeoutError(msg)
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
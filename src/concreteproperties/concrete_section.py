@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import sys
 import warnings
+from dataclasses import dataclass, field, fields
+from functools import partial
+from itertools import pairwise
 from math import inf, isinf
-from typing import TYPE_CHECKING
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
 
 import matplotlib.patches as mpatches
 import numpy as np
@@ -12,17 +19,27 @@ import sectionproperties.pre.geometry as sp_geom
 import sectionproperties.pre.pre as sp_pre
 from rich.live import Live
 from scipy.optimize import brentq
+from shapely import Polygon, intersects_xy
 
 import concreteproperties.results as res
 import concreteproperties.utils as utils
 from concreteproperties.analysis_section import AnalysisSection
 from concreteproperties.material import Concrete, SteelStrand
 from concreteproperties.post import DEFAULT_UNITS, plotting_context
-from concreteproperties.pre import CPGeom, CPGeomConcrete
+from concreteproperties.pre import (
+    CPGeom,
+    CPGeomConcrete,
+    CPPointBar,
+    LumpedBar,
+    PointBars,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import matplotlib.axes
 
+    from concreteproperties.material import Material
     from concreteproperties.post import UnitDisplay
 
 
@@ -31,16 +48,19 @@ class ConcreteSection:
 
     def __init__(
         self,
-        geometry: sp_geom.CompoundGeometry,
+        geometry: sp_geom.CompoundGeometry | sp_geom.Geometry,
         moment_centroid: tuple[float, float] | None = None,
         geometric_centroid_override: bool = False,
         default_units: UnitDisplay | None = None,
+        lumped_bars: list[LumpedBar] | None = None,
+        trusted: bool = False,
     ) -> None:
         """Inits the ConcreteSection class.
 
         Args:
             geometry: ``sectionproperties`` ``CompoundGeometry`` object describing the
-                reinforced concrete section
+                reinforced concrete section. A single ``Geometry`` object is also
+                accepted, e.g. when all reinforcement is provided as ``lumped_bars``.
             moment_centroid: If specified, all moments for service and ultimate
                 analyses are calculated about this point. If not specified, all moments
                 are calculated about the gross cross-section centroid, i.e. no material
@@ -50,11 +70,26 @@ class ConcreteSection:
                 composite section analysis). Defaults to ``False``.
             default_units: Default unit system to use for formatting results. Defaults
                 to ``None``.
+            lumped_bars: List of lumped bar records (see
+                :func:`~concreteproperties.pre.create_lumped_bars`) describing point
+                bars that are added to the section without any polygon geometry. The
+                concrete displaced by a point bar placed within a concrete geometry is
+                deducted at the bar. Defaults to ``None``.
+            trusted: If set to True, the geometry is assumed to be valid, i.e. the
+                check for overlapping regions is skipped and the polygon coordinates
+                are not rounded. The overlap check can be performed later by calling
+                :meth:`check_geometry_overlaps`. The gross properties of a trusted
+                section are calculated on first access, i.e. with the materials at
+                that time. Defaults to ``False``.
 
         Raises:
             ValueError: If steel strand materials are detected, use a
                 ``PrestressedSection`` instead
         """
+        # a single geometry is permitted, e.g. plain concrete with point bars
+        if not isinstance(geometry, sp_geom.CompoundGeometry):
+            geometry = sp_geom.CompoundGeometry(geoms=[geometry])
+
         self.compound_geometry = geometry
 
         # assign unitless unit if no default_unit applied
@@ -62,25 +97,26 @@ class ConcreteSection:
         self.default_units = units
 
         # check overlapping regions
-        polygons = [sec_geom.geom for sec_geom in self.compound_geometry.geoms]
-        overlapped_regions = sp_geom.check_geometry_overlaps(polygons)
-        if overlapped_regions:
-            msg = "The provided geometry contains overlapping regions, results may be"
-            msg += " incorrect."
-            warnings.warn(msg, stacklevel=1)
+        if not trusted:
+            self.check_geometry_overlaps()
+
+        # trusted geometry is used as provided
+        tol = None if trusted else 6
 
         # sort into concrete, reinforcement (meshed and lumped) and strand geometries
-        self.all_geometries: list[CPGeomConcrete | CPGeom] = []
+        self.all_geometries: list[CPGeomConcrete | CPGeom | CPPointBar] = []
         self.meshed_geometries: list[CPGeomConcrete | CPGeom] = []
         self.concrete_geometries: list[CPGeomConcrete] = []
         self.reinf_geometries_meshed: list[CPGeom] = []
-        self.reinf_geometries_lumped: list[CPGeom] = []
-        self.strand_geometries: list[CPGeom] = []
+        self.reinf_geometries_lumped: list[CPGeom | CPPointBar] = []
+        self.strand_geometries: list[CPGeom | CPPointBar] = []
 
         # sort geometry into appropriate list
         for geom in self.compound_geometry.geoms:
             if isinstance(geom.material, Concrete):
-                cp_geom = CPGeomConcrete(geom=geom.geom, material=geom.material)
+                cp_geom = CPGeomConcrete(
+                    geom=geom.geom, material=geom.material, tol=tol
+                )
                 self.concrete_geometries.append(cp_geom)
                 self.meshed_geometries.append(cp_geom)
             elif isinstance(geom.material, SteelStrand):
@@ -90,7 +126,7 @@ class ConcreteSection:
                     msg += "instead."
                     raise ValueError(msg)
                 else:
-                    cp_geom = CPGeom(geom=geom.geom, material=geom.material)
+                    cp_geom = CPGeom(geom=geom.geom, material=geom.material, tol=tol)
                     self.strand_geometries.append(cp_geom)
             else:
                 if isinstance(geom.material, sp_pre.Material):
@@ -98,7 +134,7 @@ class ConcreteSection:
                     msg += "not a sectionproperties Material object."
                     raise RuntimeError(msg)
 
-                cp_geom = CPGeom(geom=geom.geom, material=geom.material)
+                cp_geom = CPGeom(geom=geom.geom, material=geom.material, tol=tol)
 
                 if cp_geom.material.meshed:
                     self.reinf_geometries_meshed.append(cp_geom)
@@ -108,25 +144,281 @@ class ConcreteSection:
 
             self.all_geometries.append(cp_geom)
 
-        # calculate gross properties
-        self.gross_properties = res.GrossProperties(default_units=self.default_units)
-        self.calculate_gross_area_properties()
+        # add point bars, no polygon geometry is created
+        self.point_bars = PointBars.from_records(
+            bars=lumped_bars or [], concrete_geometries=self.concrete_geometries
+        )
 
-        # set moment centroid
-        if moment_centroid:
-            self.moment_centroid = moment_centroid
-        else:
-            self.moment_centroid = (
-                self.gross_properties.cx_gross,
-                self.gross_properties.cy_gross,
+        for bar in self.point_bars.geometries:
+            if isinstance(bar.material, SteelStrand):
+                if type(self) is ConcreteSection:
+                    msg = "SteelStrand material detected. Use PrestressedSection "
+                    msg += "instead."
+                    raise ValueError(msg)
+
+                self.strand_geometries.append(bar)
+            else:
+                self.reinf_geometries_lumped.append(bar)
+
+            self.all_geometries.append(bar)
+
+        # cache the convex hull of the section for extreme fibre queries
+        self.hull_points = utils.calculate_convex_hull(
+            points=np.vstack(
+                [
+                    np.reshape(self.compound_geometry.points, (-1, 2)),
+                    np.column_stack([self.point_bars.x, self.point_bars.y]),
+                ]
             )
+        )
+
+        # gross properties (and hence the moment centroid) are calculated on first
+        # access for trusted sections
+        self._gross_properties: res.GrossProperties | None = None
+        self._moment_centroid = moment_centroid
+        self._geometric_centroid_override = geometric_centroid_override
+        self._uncracked_stress_basis: res.ElasticStressBasis | None = None
+
+        if not trusted:
+            self.calculate_gross_properties()
+
+    @property
+    def gross_properties(self) -> res.GrossProperties:
+        """Gross section properties.
+
+        Calculated on construction, or on first access for a trusted section. The
+        second moments of area and section moduli are calculated on first access of the
+        respective properties.
+
+        Returns:
+            Gross concrete properties object
+        """
+        if self._gross_properties is None:
+            self.calculate_gross_properties()
+
+        return self._gross_properties  # pyright: ignore [reportReturnType]
 
+    def calculate_gross_properties(self) -> None:
+        """Calculates and stores the gross section properties.
+
+        The elastic moduli of the materials are captured when this method is called,
+        i.e. modifying the materials later does not change the gross properties, even
+        those calculated on first access.
+        """
+        self._gross_properties = res.GrossProperties(default_units=self.default_units)
+        self.calculate_gross_area_properties()
+
+    @property
+    def moment_centroid(self) -> tuple[float, float]:
+        """Point about which all moments are calculated.
+
+        Returns:
+            Moment centroid (``x``, ``y``)
+        """
         # if moment centroid overriden
-        if geometric_centroid_override:
-            self.moment_centroid = self.gross_properties.cx, self.gross_properties.cy
+        if self._geometric_centroid_override:
+            return self.gross_properties.cx, self.gross_properties.cy
+
+        if self._moment_centroid:
+            return self._moment_centroid
+
+        return self.gross_properties.cx_gross, self.gross_properties.cy_gross
+
+    @moment_centroid.setter
+    def moment_centroid(
+        self,
+        moment_centroid: tuple[float, float],
+    ) -> None:
+        self._moment_centroid = moment_centroid
+        self._geometric_centroid_override = False
+
+    def check_geometry_overlaps(self) -> bool:
+        """Checks the geometry for overlapping regions.
+
+        A warning is raised if overlapping regions are found. This check is performed
+        on construction unless the section is ``trusted``.
+
+        Returns:
+            True if the geometry contains overlapping regions
+        """
+        polygons = [sec_geom.geom for sec_geom in self.compound_geometry.geoms]
+        overlapped_regions = sp_geom.check_geometry_overlaps(polygons)
+
+        if overlapped_regions:
+            msg = "The provided geometry contains overlapping regions, results may be"
+            msg += " incorrect."
+            warnings.warn(msg, stacklevel=1)
+
+        return overlapped_regions
+
+    def create_material_variant(
+        self,
+        concrete_material: Callable[[Concrete], Concrete] | None = None,
+        lumped_material: Callable[[Material], Material] | None = None,
+    ) -> ConcreteSection:
+        """Creates a copy of the section with modified materials.
+
+        The copy shares the geometry, convex hull and gross properties with this
+        section, only the materials of the concrete and lumped reinforcement geometries
+        are replaced. Note that the gross properties (and therefore the moment
+        centroid) remain those calculated with the materials of this section.
+
+        Args:
+            concrete_material: Function returning the material to assign to a concrete
+                geometry given its current material. If ``None``, the concrete
+                materials are not modified. Defaults to ``None``.
+            lumped_material: Function returning the material to assign to a lumped
+                reinforcement geometry given its current material. If ``None``, the
+                lumped reinforcement materials are not modified. Defaults to ``None``.
+
+        Returns:
+            Concrete section with modified materials
+        """
+        variant = copy.copy(self)
+
+        # gross properties are shared with this section
+        variant._gross_properties = self.gross_properties
+        variant._uncracked_stress_basis = None
+
+        # map from the id of an original geometry to its replacement
+        replaced: dict[int, CPGeomConcrete | CPGeom | CPPointBar] = {}
+
+        def replace_material(
+            geom: CPGeomConcrete | CPGeom | CPPointBar,
+            material_function: Callable,
+        ) -> CPGeomConcrete | CPGeom | CPPointBar:
+            new_geom = copy.copy(geom)
+            new_geom.material = material_function(geom.material)
+            replaced[id(geom)] = new_geom
+
+            return new_geom
+
+        if concrete_material is not None:
+            variant.concrete_geometries = [
+                replace_material(geom=geom, material_function=concrete_material)  # pyright: ignore [reportAttributeAccessIssue]
+                for geom in self.concrete_geometries
+            ]
+
+        if lumped_material is not None:
+            for geom in self.reinf_geometries_lumped:
+                replace_material(geom=geom, material_function=lumped_material)
+
+        # point bars displace the replaced concrete materials
+        if concrete_material is not None:
+            concrete_map = {
+                id(geom.material): new_geom.material
+                for geom, new_geom in zip(
+                    self.concrete_geometries, variant.concrete_geometries, strict=True
+                )
+            }
+
+            for bar in self.point_bars.geometries:
+                if id(bar.displaced_material) in concrete_map:
+                    new_bar = replaced.get(id(bar)) or copy.copy(bar)
+                    new_bar.displaced_material = concrete_map[  # pyright: ignore [reportAttributeAccessIssue]
+                        id(bar.displaced_material)
+                    ]
+                    replaced[id(bar)] = new_bar
+
+        # update the remaining geometry lists with the replaced geometries
+        variant.reinf_geometries_lumped = [
+            replaced.get(id(geom), geom)  # pyright: ignore [reportAttributeAccessIssue]
+            for geom in self.reinf_geometries_lumped
+        ]
+        variant.all_geometries = [
+            replaced.get(id(geom), geom) for geom in self.all_geometries
+        ]
+        variant.meshed_geometries = [
+            replaced.get(id(geom), geom)  # pyright: ignore [reportAttributeAccessIssue]
+            for geom in self.meshed_geometries
+        ]
+        variant.strand_geometries = [
+            replaced.get(id(geom), geom) for geom in self.strand_geometries
+        ]
+        bars = [replaced.get(id(bar), bar) for bar in self.point_bars.geometries]
+        variant.point_bars = PointBars(
+            x=self.point_bars.x,
+            y=self.point_bars.y,
+            area=self.point_bars.area,
+            materials=[bar.material for bar in bars],  # pyright: ignore [reportArgumentType]
+            geometries=bars,  # pyright: ignore [reportArgumentType]
+        )
+
+        return variant
+
+    def snapshot(self) -> SectionSnapshot:
+        """Creates a compact, picklable snapshot of the section.
+
+        The gross properties are calculated (if not already calculated) and stored in
+        the snapshot, see :class:`SectionSnapshot`.
+
+        Returns:
+            Snapshot of the section
+        """
+        rings = []
+        n_rings = []
+        geometry_materials = []
+        materials: list[Material] = []
+        material_idx: dict[int, int] = {}
+
+        def get_material_idx(material: Material) -> int:
+            if id(material) not in material_idx:
+                material_idx[id(material)] = len(materials)
+                materials.append(material)
+
+            return material_idx[id(material)]
+
+        # polygon geometries, in the order of the compound geometry
+        for geom in self.all_geometries:
+            if isinstance(geom, CPPointBar):
+                continue
+
+            rings.append(np.asarray(geom.geom.exterior.coords, dtype=float))
+            rings.extend(
+                np.asarray(interior.coords, dtype=float)
+                for interior in geom.geom.interiors
+            )
+            n_rings.append(1 + len(geom.geom.interiors))
+            geometry_materials.append(get_material_idx(material=geom.material))
+
+        gross_props = self.gross_properties
+        gross_props.calculate_deferred()
+        gross_names = [f.name for f in fields(gross_props) if f.name != "default_units"]
+
+        arrays = {
+            "coords": np.concatenate(rings) if rings else np.zeros((0, 2)),
+            "ring_offsets": np.cumsum([0] + [len(ring) for ring in rings]),
+            "geometry_offsets": np.cumsum([0, *n_rings]),
+            "geometry_materials": np.array(geometry_materials, dtype=int),
+            "bar_x": np.array(self.point_bars.x, dtype=float),
+            "bar_y": np.array(self.point_bars.y, dtype=float),
+            "bar_area": np.array(self.point_bars.area, dtype=float),
+            "bar_materials": np.array(
+                [get_material_idx(material=mat) for mat in self.point_bars.materials],
+                dtype=int,
+            ),
+            "gross_properties": np.array(
+                [getattr(gross_props, name) for name in gross_names], dtype=float
+            ),
+        }
+
+        return SectionSnapshot(
+            section_class=type(self),
+            arrays=arrays,
+            materials=materials,
+            gross_property_names=gross_names,
+            moment_centroid=self._moment_centroid,
+            geometric_centroid_override=self._geometric_centroid_override,
+            default_units=self.default_units,
+        )
 
     def calculate_gross_area_properties(self) -> None:
-        """Calculates and stores gross section area properties."""
+        """Calculates and stores gross section area properties.
+
+        Areas, first moments of area, centroids and the ultimate concrete strain are
+        calculated immediately. The calculation of the second moments of area and the
+        section moduli is deferred until these properties are first accessed.
+        """
         # loop through all geometries
         for geom in self.all_geometries:
             # area and centroid of geometry
@@ -149,6 +441,23 @@ class ConcreteSection:
         for conc_geom in self.concrete_geometries:
             self.gross_properties.concrete_area += conc_geom.calculate_area()
 
+        # deduct the concrete displaced by point bars
+        for bar in self.point_bars.geometries:
+            if bar.displaced_material is None:
+                continue
+
+            area = bar.calculate_area()
+            e_c = bar.displaced_material.elastic_modulus
+
+            self.gross_properties.total_area -= area
+            self.gross_properties.concrete_area -= area
+            self.gross_properties.e_a -= area * e_c
+            self.gross_properties.mass -= area * bar.displaced_material.density
+            self.gross_properties.e_qx -= area * e_c * bar.y
+            self.gross_properties.e_qy -= area * e_c * bar.x
+            self.gross_properties.qx_gross -= area * bar.y
+            self.gross_properties.qy_gross -= area * bar.x
+
         # sum reinforcement meshed areas
         for meshed_geom in self.reinf_geometries_meshed:
             self.gross_properties.reinf_meshed_area += meshed_geom.calculate_area()
@@ -174,33 +483,108 @@ class ConcreteSection:
             self.gross_properties.qx_gross / self.gross_properties.total_area
         )
 
+        # store ultimate concrete strain (get smallest from all concrete geometries)
+        conc_ult_strain = 0
+
+        for idx, conc_geom in enumerate(self.concrete_geometries):
+            conc_ult_ssp = conc_geom.material.ultimate_stress_strain_profile
+            ult_strain = conc_ult_ssp.get_ultimate_compressive_strain()
+            if idx == 0:
+                conc_ult_strain = ult_strain
+            else:
+                conc_ult_strain = min(conc_ult_strain, ult_strain)
+
+        self.gross_properties.conc_ultimate_strain = conc_ult_strain
+
+        # defer second moments of area and section moduli, capturing the current
+        # elastic moduli (net of any displaced concrete)
+        elastic_moduli = {
+            id(geom): geom.material.elastic_modulus
+            - geom.get_displaced_elastic_modulus()
+            for geom in self.all_geometries
+        }
+        self.gross_properties.defer_group(
+            group="second_moments",
+            calculate=partial(
+                self.calculate_gross_second_moments, elastic_moduli=elastic_moduli
+            ),
+        )
+        self.gross_properties.defer_group(
+            group="section_moduli", calculate=self.calculate_gross_section_moduli
+        )
+
+    def calculate_net_concrete_area(
+        self,
+        conc_geom: CPGeomConcrete,
+    ) -> float:
+        """Calculates the area of a concrete geometry net of any point bars.
+
+        Point bars do not create holes in the concrete geometry, the area of the point
+        bars placed within the concrete geometry is deducted.
+
+        Args:
+            conc_geom: Concrete geometry
+
+        Returns:
+            Net area of the concrete geometry
+        """
+        area = conc_geom.calculate_area()
+
+        if not self.point_bars.geometries:
+            return area
+
+        within = intersects_xy(conc_geom.geom, self.point_bars.x, self.point_bars.y)
+
+        for bar, bar_within in zip(
+            self.point_bars.geometries, within.tolist(), strict=True
+        ):
+            if bar_within and bar.displaced_material is conc_geom.material:
+                area -= bar.area
+
+        return area
+
+    def calculate_gross_second_moments(
+        self,
+        elastic_moduli: dict[int, float] | None = None,
+    ) -> None:
+        """Calculates and stores gross section second moments of area.
+
+        Args:
+            elastic_moduli: Elastic modulus (net of any displaced concrete) of each
+                geometry, keyed by the ``id`` of the geometry. If ``None``, the elastic
+                moduli of the current materials are used. Defaults to ``None``.
+        """
+
+        def get_elastic_modulus(geom: CPGeom | CPPointBar) -> float:
+            if elastic_moduli is not None:
+                return elastic_moduli[id(geom)]
+
+            return geom.material.elastic_modulus - geom.get_displaced_elastic_modulus()
+
         # global second moments of area
-        # meshed geometries
+        # meshed geometries - closed-form polygon moments, no meshing required
         for geom in self.meshed_geometries:
-            sec = AnalysisSection(geometry=geom)
+            _, _, _, ixx_g, iyy_g, ixy_g = utils.calculate_polygon_moments(geom=geom)
+            e = get_elastic_modulus(geom=geom)
+            self.gross_properties.e_ixx_g += e * ixx_g
+            self.gross_properties.e_iyy_g += e * iyy_g
+            self.gross_properties.e_ixy_g += e * ixy_g
 
-            for el in sec.elements:
-                el_e_ixx_g, el_e_iyy_g, el_e_ixy_g = el.second_moments_of_area()
-                self.gross_properties.e_ixx_g += el_e_ixx_g
-                self.gross_properties.e_iyy_g += el_e_iyy_g
-                self.gross_properties.e_ixy_g += el_e_ixy_g
-
-        # lumped geometries - treat as lumped circles
+        # lumped geometries - treat as lumped circles, net of any displaced concrete
         for geom in self.reinf_geometries_lumped + self.strand_geometries:
             # area, diameter and centroid of geometry
             area = geom.calculate_area()
             diam = np.sqrt(4 * area / np.pi)
             centroid = geom.calculate_centroid()
+            e = get_elastic_modulus(geom=geom)
 
-            self.gross_properties.e_ixx_g += geom.material.elastic_modulus * (
+            self.gross_properties.e_ixx_g += e * (
                 np.pi * pow(diam, 4) / 64 + area * centroid[1] * centroid[1]
             )
-            self.gross_properties.e_iyy_g += geom.material.elastic_modulus * (
+            self.gross_properties.e_iyy_g += e * (
                 np.pi * pow(diam, 4) / 64 + area * centroid[0] * centroid[0]
             )
-            self.gross_properties.e_ixy_g += geom.material.elastic_modulus * (
-                area * centroid[0] * centroid[1]
-            )
+            self.gross_properties.e_ixy_g += e * (area * centroid[0] * centroid[1])
 
         # centroidal second moments of area
         self.gross_properties.e_ixx_c = (
@@ -242,6 +626,8 @@ class ConcreteSection:
                 self.gross_properties.e_ixy_c,
             )
 
+    def calculate_gross_section_moduli(self) -> None:
+        """Calculates and stores gross section moduli."""
         # centroidal section moduli
         x_min, x_max, y_min, y_max = self.compound_geometry.calculate_extents()
         self.gross_properties.e_zxx_plus = self.gross_properties.e_ixx_c / abs(
@@ -271,27 +657,18 @@ class ConcreteSection:
         self.gross_properties.e_z22_plus = self.gross_properties.e_i22 / abs(x11_max)
         self.gross_properties.e_z22_minus = self.gross_properties.e_i22 / abs(x11_min)
 
-        # store ultimate concrete strain (get smallest from all concrete geometries)
-        conc_ult_strain = 0
-
-        for idx, conc_geom in enumerate(self.concrete_geometries):
-            conc_ult_ssp = conc_geom.material.ultimate_stress_strain_profile
-            ult_strain = conc_ult_ssp.get_ultimate_compressive_strain()
-            if idx == 0:
-                conc_ult_strain = ult_strain
-            else:
-                conc_ult_strain = min(conc_ult_strain, ult_strain)
-
-        self.gross_properties.conc_ultimate_strain = conc_ult_strain
-
     def get_gross_properties(
         self,
     ) -> res.GrossProperties:
         """Returns the gross section properties of the reinforced concrete section.
 
+        All deferred gross properties are calculated.
+
         Returns:
             Gross concrete properties object
         """
+        self.gross_properties.calculate_deferred()
+
         return self.gross_properties
 
     def get_transformed_gross_properties(
@@ -335,9 +712,7 @@ class ConcreteSection:
 
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = utils.calculate_extreme_fibre(points=self.hull_points, theta=theta)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = d_t  # neutral axis at extreme tensile fibre
 
@@ -358,11 +733,207 @@ class ConcreteSection:
             msg += "https://github.com/robbievanleeuwen/concrete-properties/issues"
             raise utils.AnalysisError(msg) from exc
 
+        # split the section once at the converged neutral axis
+        cracked_results.cracked_geometries = self.create_cracked_geometries(
+            d_nc=cracked_results.d_nc, theta=theta
+        )
+
         # calculate cracked section properties
         self.cracked_section_properties(cracked_results=cracked_results)
 
         return cracked_results
 
+    def cracked_properties_sweep(
+        self,
+        thetas: list[float] | np.ndarray,
+    ) -> res.CrackedSweepResults:
+        r"""Calculates cracked section properties for many neutral axis angles.
+
+        Geometry data that does not depend on the neutral axis angle (point arrays,
+        reinforcement properties) is computed once and shared between angles, and each
+        cracked neutral axis search is warm-started from the solution at the previous
+        angle. For best performance, ``thetas`` should be ordered.
+
+        Args:
+            thetas: Angles (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Raises:
+            AnalysisError: If the analysis fails
+
+        Returns:
+            Cracked sweep results object
+        """
+        thetas = np.atleast_1d(np.asarray(thetas, dtype=float))
+        cos_t = np.cos(thetas)
+        sin_t = np.sin(thetas)
+
+        # project the section convex hull onto the local v-axis for every angle
+        ecf, d_t = utils.calculate_extreme_fibres(
+            points=self.hull_points, thetas=thetas
+        )
+        v_max = ecf[:, 1] * cos_t - ecf[:, 0] * sin_t
+
+        # rotated gross second moments of area
+        e_ixx = self.gross_properties.e_ixx_c
+        e_iyy = self.gross_properties.e_iyy_c
+        e_ixy = self.gross_properties.e_ixy_c
+        e_iuu = e_iyy * sin_t**2 + e_ixx * cos_t**2 - 2 * e_ixy * sin_t * cos_t
+
+        # cracking moments (see calculate_cracking_moment())
+        c_v = self.gross_properties.cy * cos_t - self.gross_properties.cx * sin_t
+        m_cr = np.zeros_like(thetas)
+
+        for idx, conc_geom in enumerate(self.concrete_geometries):
+            conc_pts = np.array(conc_geom.points)
+            v_conc = np.outer(conc_pts[:, 1], cos_t) - np.outer(conc_pts[:, 0], sin_t)
+            d = np.maximum((c_v - v_conc).max(axis=0), 0)
+            f_t = conc_geom.material.flexural_tensile_strength
+            m_c_geom = (f_t / conc_geom.material.elastic_modulus) * np.divide(
+                e_iuu, d, out=np.zeros_like(d), where=d > 0
+            )
+            m_c_new = m_c_geom if idx == 0 else np.minimum(m_cr, m_c_geom)
+            m_cr = np.where(d > 0, m_c_new, m_cr)
+
+        # reinforcement properties, independent of the neutral axis
+        reinf_props = np.zeros(6)  # ea, e_qx, e_qy, e_ixx_g, e_iyy_g, e_ixy_g
+
+        for geom in self.reinf_geometries_meshed:
+            reinf_props += geom.material.elastic_modulus * np.array(
+                utils.calculate_polygon_moments(geom=geom)
+            )
+
+        # concrete displaced by lumped bars, deducted on the compressive side only
+        disp_props = np.zeros((len(self.reinf_geometries_lumped), 6))
+        disp_v = np.zeros((len(self.reinf_geometries_lumped), len(thetas)))
+
+        for bar_idx, geom in enumerate(self.reinf_geometries_lumped):
+            area = geom.calculate_area()
+            i_bar = area * area / (4 * np.pi)  # pi * d^4 / 64 for a circular bar
+            x, y = geom.calculate_centroid()
+            bar_props = np.array(
+                [
+                    area,
+                    area * y,
+                    area * x,
+                    i_bar + area * y * y,
+                    i_bar + area * x * x,
+                    area * x * y,
+                ]
+            )
+            reinf_props += geom.material.elastic_modulus * bar_props
+            disp_props[bar_idx] = geom.get_displaced_elastic_modulus() * bar_props
+            disp_v[bar_idx] = y * cos_t - x * sin_t
+
+        def cracked_props(
+            d_nc: float,
+            idx: int,
+        ) -> np.ndarray:
+            # modulus weighted properties of the cracked section at angle idx
+            v_na = v_max[idx] - d_nc
+            props = reinf_props - disp_props[disp_v[:, idx] >= v_na].sum(axis=0)
+
+            for conc_geom in self.concrete_geometries:
+                props += conc_geom.material.elastic_modulus * np.array(
+                    utils.calculate_polygon_moments(
+                        geom=conc_geom, theta=thetas[idx], v_na=v_na
+                    )
+                )
+
+            return props
+
+        def convergence(
+            d_nc: float,
+            idx: int,
+        ) -> float:
+            # first moment of area about the trial neutral axis
+            props = cracked_props(d_nc=d_nc, idx=idx)
+            v_na = v_max[idx] - d_nc
+
+            return props[1] * cos_t[idx] - props[2] * sin_t[idx] - props[0] * v_na
+
+        # find cracked neutral axis for each angle
+        props_list = []
+        d_nc = np.zeros_like(thetas)
+        d_nc_ratio = None
+
+        for idx in range(len(thetas)):
+            a = 1e-6 * d_t[idx]  # sufficiently small depth of compressive zone
+            b = d_t[idx]  # neutral axis at extreme tensile fibre
+
+            # warm start bracket from the previous solution
+            if d_nc_ratio is not None:
+                guess = d_nc_ratio * d_t[idx]
+                step = 0.05 * d_t[idx]
+
+                if convergence(d_nc=guess, idx=idx) > 0:
+                    lower = max(a, guess - step)
+                    if convergence(d_nc=lower, idx=idx) <= 0:
+                        a, b = lower, guess
+                    else:
+                        b = lower
+                else:
+                    upper = min(b, guess + step)
+                    if convergence(d_nc=upper, idx=idx) >= 0:
+                        a, b = guess, upper
+                    else:
+                        a = upper
+
+            try:
+                d_nc[idx] = brentq(
+                    f=convergence,
+                    a=a,
+                    b=b,
+                    args=(idx,),
+                    xtol=1e-3,
+                    rtol=1e-6,  # pyright: ignore [reportArgumentType]
+                    disp=False,
+                )
+            except ValueError as exc:
+                msg = "Analysis failed. Please raise an issue at "
+                msg += "https://github.com/robbievanleeuwen/concrete-properties/issues"
+                raise utils.AnalysisError(msg) from exc
+
+            d_nc_ratio = d_nc[idx] / d_t[idx]
+            props_list.append(cracked_props(d_nc=d_nc[idx], idx=idx))
+
+        # cracked section properties
+        e_a, e_qx, e_qy, e_ixx_g, e_iyy_g, e_ixy_g = np.array(props_list).T
+        e_ixx_c = e_ixx_g - e_qx**2 / e_a
+        e_iyy_c = e_iyy_g - e_qy**2 / e_a
+        e_ixy_c = e_ixy_g - e_qx * e_qy / e_a
+
+        e_iuu_cr = e_iyy_c * sin_t**2 + e_ixx_c * cos_t**2 - 2 * e_ixy_c * sin_t * cos_t
+
+        # principal 2nd moments of area about the centroidal xy axis
+        delta = (((e_ixx_c - e_iyy_c) / 2) ** 2 + e_ixy_c**2) ** 0.5
+        e_i11 = (e_ixx_c + e_iyy_c) / 2 + delta
+        e_i22 = (e_ixx_c + e_iyy_c) / 2 - delta
+
+        # principal axis angle
+        phi = np.where(
+            abs(e_ixx_c - e_i11) < 1e-12 * e_i11,
+            0,
+            np.arctan2(e_ixx_c - e_i11, e_ixy_c),
+        )
+
+        return res.CrackedSweepResults(
+            default_units=self.default_units,
+            theta=thetas,
+            m_cr=m_cr,
+            d_nc=d_nc,
+            e_a_cr=e_a,
+            cx=e_qy / e_a,
+            cy=e_qx / e_a,
+            e_ixx_c_cr=e_ixx_c,
+            e_iyy_c_cr=e_iyy_c,
+            e_ixy_c_cr=e_ixy_c,
+            e_iuu_cr=e_iuu_cr,
+            e_i11_cr=e_i11,
+            e_i22_cr=e_i22,
+            phi_cr=phi,
+        )
+
     def calculate_cracking_moment(
         self,
         theta: float,
@@ -436,7 +1007,7 @@ class ConcreteSection:
         """
         # calculate extreme fibre in global coordinates
         extreme_fibre, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=cracked_results.theta
+            points=self.hull_points, theta=cracked_results.theta
         )
 
         # validate d_nc input
@@ -457,26 +1028,23 @@ class ConcreteSection:
             theta=cracked_results.theta, x=point_na[0], y=point_na[1]
         )
 
-        # split concrete geometries above and below d_nc, discard below
-        cracked_geoms: list[CPGeomConcrete | CPGeom] = []
+        # determine moment of area equilibrium about neutral axis
+        e_qu = 0  # initialise first moment of area
 
+        # concrete geometries - clip to the compressive side of the neutral axis
         for conc_geom in self.concrete_geometries:
-            top_geoms, _ = conc_geom.split_section(
-                point=point_na,
-                theta=cracked_results.theta,
+            area, qx, qy, _, _, _ = utils.calculate_polygon_moments(
+                geom=conc_geom, theta=cracked_results.theta, v_na=na_local[1]
             )
 
-            # save compression geometries
-            cracked_geoms.extend(top_geoms)
-
-        # add reinforcement geometries to list
-        cracked_geoms.extend(self.reinf_geometries_meshed)
-        cracked_geoms.extend(self.reinf_geometries_lumped)
-
-        # determine moment of area equilibrium about neutral axis
-        e_qu = 0  # initialise first moment of area
+            # first moment of area about the neutral axis (local v-direction)
+            q_v = qx * np.cos(cracked_results.theta) - qy * np.sin(
+                cracked_results.theta
+            )
+            e_qu += conc_geom.material.elastic_modulus * (q_v - area * na_local[1])
 
-        for geom in cracked_geoms:
+        # reinforcement geometries
+        for geom in self.reinf_geometries_meshed + self.reinf_geometries_lumped:
             ea = geom.calculate_area() * geom.material.elastic_modulus
             centroid = geom.calculate_centroid()
 
@@ -485,13 +1053,101 @@ class ConcreteSection:
                 theta=cracked_results.theta, x=centroid[0], y=centroid[1]
             )
 
+            # deduct concrete displaced by the bar on the compressive side
+            if c_v >= na_local[1]:
+                ea -= geom.calculate_area() * geom.get_displaced_elastic_modulus()
+
             # calculate first moment of area
             e_qu += ea * (c_v - na_local[1])
 
-        cracked_results.cracked_geometries = cracked_geoms
-
         return e_qu
 
+    def create_cracked_geometries(
+        self,
+        d_nc: float,
+        theta: float,
+    ) -> list[CPGeomConcrete | CPGeom | CPPointBar]:
+        r"""Creates the geometries that remain after cracking.
+
+        Splits the concrete geometries at the cracked neutral axis, discarding the
+        tensile concrete, and adds the reinforcement geometries. Point bars on the
+        tensile side no longer displace any concrete.
+
+        Args:
+            d_nc: Cracked neutral axis depth
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Returns:
+            Cracked geometries
+        """
+        # find point on neutral axis by shifting by d_nc
+        extreme_fibre, _ = utils.calculate_extreme_fibre(
+            points=self.hull_points, theta=theta
+        )
+        point_na = utils.point_on_neutral_axis(
+            extreme_fibre=extreme_fibre, d_n=d_nc, theta=theta
+        )
+
+        # split concrete geometries above and below d_nc, discard below
+        cracked_geoms: list[CPGeomConcrete | CPGeom | CPPointBar] = []
+
+        for conc_geom in self.concrete_geometries:
+            top_geoms, _ = conc_geom.split_section(point=point_na, theta=theta)
+
+            # save compression geometries
+            cracked_geoms.extend(top_geoms)
+
+        # add reinforcement geometries to list
+        cracked_geoms.extend(self.reinf_geometries_meshed)
+        cracked_geoms.extend(
+            self.get_cracked_lumped_geometries(
+                lumped_geometries=self.reinf_geometries_lumped,
+                point_na=point_na,
+                theta=theta,
+            )
+        )
+
+        return cracked_geoms
+
+    def get_cracked_lumped_geometries(
+        self,
+        lumped_geometries: list[CPGeom | CPPointBar],
+        point_na: tuple[float, float],
+        theta: float,
+    ) -> list[CPGeom | CPPointBar]:
+        r"""Returns the lumped geometries that remain after cracking.
+
+        The concrete displaced by a point bar on the tensile side of the neutral axis
+        is cracked, i.e. such bars are copied without a displaced material.
+
+        Args:
+            lumped_geometries: List of lumped geometries
+            point_na: Point on the neutral axis
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Returns:
+            Cracked lumped geometries
+        """
+        _, v_na = utils.global_to_local(theta=theta, x=point_na[0], y=point_na[1])
+        cracked_geoms: list[CPGeom | CPPointBar] = []
+
+        for geom in lumped_geometries:
+            if isinstance(geom, CPPointBar) and geom.displaced_material is not None:
+                _, c_v = utils.global_to_local(theta=theta, x=geom.x, y=geom.y)
+
+                # tensile side, no concrete is displaced
+                if c_v < v_na:
+                    cracked_bar = copy.copy(geom)
+                    cracked_bar.displaced_material = None
+                    cracked_geoms.append(cracked_bar)
+                    continue
+
+            cracked_geoms.append(geom)
+
+        return cracked_geoms
+
     def cracked_section_properties(
         self,
         cracked_results: res.CrackedResults,
@@ -507,18 +1163,15 @@ class ConcreteSection:
         # reset results
         cracked_results.reset_results()
 
-        # axial rigidity & first moments of area
+        # axial rigidity & first moments of area (net of displaced concrete)
         for geom in cracked_results.cracked_geometries:
             area = geom.calculate_area()
             centroid = geom.calculate_centroid()
+            e = geom.material.elastic_modulus - geom.get_displaced_elastic_modulus()
 
-            cracked_results.e_a_cr += area * geom.material.elastic_modulus
-            cracked_results.e_qx_cr += (
-                area * geom.material.elastic_modulus * centroid[1]
-            )
-            cracked_results.e_qy_cr += (
-                area * geom.material.elastic_modulus * centroid[0]
-            )
+            cracked_results.e_a_cr += area * e
+            cracked_results.e_qx_cr += area * e * centroid[1]
+            cracked_results.e_qy_cr += area * e * centroid[0]
 
         # centroids
         cracked_results.cx = cracked_results.e_qy_cr / cracked_results.e_a_cr
@@ -526,31 +1179,29 @@ class ConcreteSection:
 
         # global second moments of area
         for geom in cracked_results.cracked_geometries:
-            # if meshed
+            # if meshed - closed-form polygon moments, no meshing required
             if geom.material.meshed:
-                sec = AnalysisSection(geometry=geom)
-
-                for el in sec.elements:
-                    el_e_ixx_g, el_e_iyy_g, el_e_ixy_g = el.second_moments_of_area()
-                    cracked_results.e_ixx_g_cr += el_e_ixx_g
-                    cracked_results.e_iyy_g_cr += el_e_iyy_g
-                    cracked_results.e_ixy_g_cr += el_e_ixy_g
+                _, _, _, ixx_g, iyy_g, ixy_g = utils.calculate_polygon_moments(
+                    geom=geom
+                )
+                cracked_results.e_ixx_g_cr += geom.material.elastic_modulus * ixx_g
+                cracked_results.e_iyy_g_cr += geom.material.elastic_modulus * iyy_g
+                cracked_results.e_ixy_g_cr += geom.material.elastic_modulus * ixy_g
             # if lumped
             else:
                 # area, diameter and centroid of geometry
                 area = geom.calculate_area()
                 diam = np.sqrt(4 * area / np.pi)
                 centroid = geom.calculate_centroid()
+                e = geom.material.elastic_modulus - geom.get_displaced_elastic_modulus()
 
-                cracked_results.e_ixx_g_cr += geom.material.elastic_modulus * (
+                cracked_results.e_ixx_g_cr += e * (
                     np.pi * pow(diam, 4) / 64 + area * centroid[1] * centroid[1]
                 )
-                cracked_results.e_iyy_g_cr += geom.material.elastic_modulus * (
+                cracked_results.e_iyy_g_cr += e * (
                     np.pi * pow(diam, 4) / 64 + area * centroid[0] * centroid[0]
                 )
-                cracked_results.e_ixy_g_cr += geom.material.elastic_modulus * (
-                    area * centroid[0] * centroid[1]
-                )
+                cracked_results.e_ixy_g_cr += e * (area * centroid[0] * centroid[1])
 
         # centroidal second moments of area
         cracked_results.e_ixx_c_cr = (
@@ -642,6 +1293,9 @@ class ConcreteSection:
             default_units=self.default_units, theta=theta, n_target=n
         )
 
+        # converged strain at the extreme compressive fibre for each step
+        eps0s: list[float] = []
+
         # function that performs moment curvature analysis
         def mcurve(kappa_inc=kappa_inc, progress=None):
             iteration = 0
@@ -702,6 +1356,7 @@ class ConcreteSection:
                     moment_curvature.convergence.append(
                         moment_curvature._failure_convergence
                     )
+                    eps0s.append(moment_curvature._eps0_i)
                     iteration += 1
 
             # find kappa corresponding to failure strain:
@@ -744,6 +1399,7 @@ class ConcreteSection:
             moment_curvature.m_y.append(moment_curvature._m_y_i)
             moment_curvature.m_xy.append(m_xy)
             moment_curvature.convergence.append(moment_curvature._failure_convergence)
+            eps0s.append(moment_curvature._eps0_i)
 
         # create progress bar
         if progress_bar:
@@ -766,6 +1422,12 @@ class ConcreteSection:
         else:
             mcurve()
 
+        # store the converged strain state of each step
+        ecf, _ = utils.calculate_extreme_fibre(points=self.hull_points, theta=theta)
+        moment_curvature.eps0 = np.array(eps0s)
+        moment_curvature.ecf = np.array(ecf, dtype=float)
+        moment_curvature.failure_ratio = np.array(moment_curvature.convergence)
+
         return moment_curvature
 
     def service_normal_force_convergence(
@@ -792,7 +1454,7 @@ class ConcreteSection:
 
         # get global coordinates of extreme compressive fibre
         ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=moment_curvature.theta
+            points=self.hull_points, theta=moment_curvature.theta
         )
 
         # create splits in meshed geometries at points in stress-strain profiles
@@ -868,6 +1530,9 @@ class ConcreteSection:
                 kappa=kappa,
             )
 
+            # stress in the concrete displaced by the lump
+            displaced_stress = lumped_geom.get_displaced_stress(strain=strain)
+
             # add initial prestress strain
             if isinstance(lumped_geom.material, SteelStrand):
                 eps_pe = -lumped_geom.material.get_prestress_strain()
@@ -888,11 +1553,11 @@ class ConcreteSection:
             # tensile failure
             failure_convergence = max(strain / ult_tens_strain, failure_convergence)
 
-            # calculate stress and force
+            # calculate stress and force (net of the displaced concrete)
             stress = lumped_geom.material.stress_strain_profile.get_stress(
                 strain=strain
             )
-            force = stress * area
+            force = (stress - displaced_stress) * area
 
             n += force
 
@@ -901,6 +1566,7 @@ class ConcreteSection:
             m_y += force * (centroid[0] - self.moment_centroid[0])
 
         moment_curvature._kappa = kappa
+        moment_curvature._eps0_i = eps0
         moment_curvature._n_i = n
         moment_curvature._m_x_i = m_x
         moment_curvature._m_y_i = m_y
@@ -943,9 +1609,7 @@ class ConcreteSection:
         """
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = utils.calculate_extreme_fibre(points=self.hull_points, theta=theta)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = 6 * d_t  # neutral axis at sufficiently large tensile fibre
 
@@ -1030,7 +1694,7 @@ class ConcreteSection:
 
         # calculate extreme fibre in global coordinates
         extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
+            points=self.hull_points, theta=ultimate_results.theta
         )
 
         # extreme fibre in local coordinates
@@ -1109,16 +1773,21 @@ class ConcreteSection:
                     ultimate_strain=self.gross_properties.conc_ultimate_strain,
                 )
 
-                # add initial prestress strain (N.B. ignore eps_ce)
-                if isinstance(lumped_geom.material, SteelStrand):
-                    eps_pe = -lumped_geom.material.get_prestress_strain()
-                    strain += eps_pe
+            # stress in the concrete displaced by the lump
+            displaced_stress = lumped_geom.get_displaced_stress(
+                strain=strain, ultimate=True
+            )
+
+            # add initial prestress strain (N.B. ignore eps_ce)
+            if not isinf(d_n) and isinstance(lumped_geom.material, SteelStrand):
+                eps_pe = -lumped_geom.material.get_prestress_strain()
+                strain += eps_pe
 
-            # calculate stress and force
+            # calculate stress and force (net of the displaced concrete)
             stress = lumped_geom.material.stress_strain_profile.get_stress(
                 strain=strain
             )
-            force = stress * area
+            force = (stress - displaced_stress) * area
             n += force
 
             # convert centroid to local coordinates
@@ -1230,9 +1899,7 @@ class ConcreteSection:
             control_points = [("kappa0", 0.0), ("fy", 1.0), ("N", 0.0)]
 
         # compute extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = utils.calculate_extreme_fibre(points=self.hull_points, theta=theta)
 
         # validate limits length
         if len(limits) != 2:
@@ -1545,98 +2212,448 @@ class ConcreteSection:
         e_iyy = self.gross_properties.e_iyy_c
         e_ixy = self.gross_properties.e_ixy_c
 
-        # calculate neutral axis rotation
-        grad = (e_ixy * m_x - e_ixx * m_y) / (e_iyy * m_x - e_ixy * m_y)
+        # calculate neutral axis rotation (vertical for pure m_y bending)
+        with np.errstate(divide="ignore"):
+            grad = np.divide(e_ixy * m_x - e_ixx * m_y, e_iyy * m_x - e_ixy * m_y)
         theta = np.arctan2(grad, 1)
 
-        if np.isclose(theta, 0):
-            theta = 0
+        if np.isclose(theta, 0):
+            theta = 0
+
+        # point on neutral axis is centroid
+        point_na = (cx, cy)
+
+        # split meshed geometries above and below neutral axis
+        split_meshed_geoms = []
+
+        for meshed_geom in self.meshed_geometries:
+            top_geoms, bot_geoms = meshed_geom.split_section(
+                point=point_na,
+                theta=theta,
+            )
+
+            split_meshed_geoms.extend(top_geoms)
+            split_meshed_geoms.extend(bot_geoms)
+
+        # loop through all meshed geometries and calculate stress
+        for meshed_geom in split_meshed_geoms:
+            analysis_section = AnalysisSection(geometry=meshed_geom)
+
+            # calculate stress, force and point of action
+            sig, n_sec, d_x, d_y = analysis_section.get_elastic_stress(
+                n=n,
+                m_x=m_x,
+                m_y=m_y,
+                e_a=e_a,
+                cx=cx,
+                cy=cy,
+                e_ixx=e_ixx,
+                e_iyy=e_iyy,
+                e_ixy=e_ixy,
+            )
+
+            # save results
+            if isinstance(meshed_geom, CPGeomConcrete):
+                conc_sigs.append(sig)
+                conc_forces.append((n_sec, d_x, d_y))
+                conc_sections.append(analysis_section)
+            else:
+                meshed_reinf_sigs.append(sig)
+                meshed_reinf_forces.append((n_sec, d_x, d_y))
+                meshed_reinf_sections.append(analysis_section)
+
+        # loop through all lumped geometries and calculate stress
+        for lumped_geom in self.reinf_geometries_lumped:
+            # initialise stress and position
+            sig = 0
+            centroid = lumped_geom.calculate_centroid()
+            x = centroid[0] - cx
+            y = centroid[1] - cy
+
+            # axial stress
+            sig += n * lumped_geom.material.elastic_modulus / e_a
+
+            # bending moment stress
+            sig += lumped_geom.material.elastic_modulus * (
+                -(e_ixy * m_x) / (e_ixx * e_iyy - e_ixy**2) * x
+                + (e_iyy * m_x) / (e_ixx * e_iyy - e_ixy**2) * y
+            )
+            sig += lumped_geom.material.elastic_modulus * (
+                +(e_ixx * m_y) / (e_ixx * e_iyy - e_ixy**2) * x
+                - (e_ixy * m_y) / (e_ixx * e_iyy - e_ixy**2) * y
+            )
+
+            strain = sig / lumped_geom.material.elastic_modulus
+
+            # net force (net of the displaced concrete) and point of action
+            n_lumped = (
+                sig - lumped_geom.get_displaced_elastic_modulus() * strain
+            ) * lumped_geom.calculate_area()
+            lumped_reinf_sigs.append(sig)
+            lumped_reinf_strains.append(strain)
+            lumped_reinf_forces.append((n_lumped, x, y))
+            lumped_reinf_geoms.append(lumped_geom)
+
+        return res.StressResult(
+            default_units=self.default_units,
+            concrete_section=self,
+            concrete_analysis_sections=conc_sections,
+            concrete_stresses=conc_sigs,
+            concrete_forces=conc_forces,
+            meshed_reinforcement_sections=meshed_reinf_sections,
+            meshed_reinforcement_stresses=meshed_reinf_sigs,
+            meshed_reinforcement_forces=meshed_reinf_forces,
+            lumped_reinforcement_geometries=lumped_reinf_geoms,
+            lumped_reinforcement_stresses=lumped_reinf_sigs,
+            lumped_reinforcement_strains=lumped_reinf_strains,
+            lumped_reinforcement_forces=lumped_reinf_forces,
+        )
+
+    @property
+    def uncracked_stress_basis(self) -> res.ElasticStressBasis:
+        """Uncracked stress basis, calculated on first access.
+
+        Stores the stresses and net actions for a unit axial force and unit bending
+        moments about the x and y axes, see
+        :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_uncracked_stresses`.
+
+        Returns:
+            Uncracked stress basis object
+        """
+        if self._uncracked_stress_basis is None:
+            self._uncracked_stress_basis = self.calculate_uncracked_stress_basis()
+
+        return self._uncracked_stress_basis
+
+    def calculate_uncracked_stress_basis(self) -> res.ElasticStressBasis:
+        """Calculates the uncracked stress basis.
+
+        Meshes the (unsplit) meshed geometries and calculates the stresses and net
+        actions resulting from a unit axial force and unit bending moments about the x
+        and y axes using the gross section properties.
+
+        Returns:
+            Uncracked stress basis object
+        """
+        return self.calculate_elastic_stress_basis(
+            meshed_geometries=self.meshed_geometries,
+            lumped_geometries=self.reinf_geometries_lumped,
+            e_a=self.gross_properties.e_a,
+            cx=self.gross_properties.cx,
+            cy=self.gross_properties.cy,
+            e_ixx=self.gross_properties.e_ixx_c,
+            e_iyy=self.gross_properties.e_iyy_c,
+            e_ixy=self.gross_properties.e_ixy_c,
+        )
+
+    def calculate_elastic_stress_basis(
+        self,
+        meshed_geometries: list[CPGeom | CPGeomConcrete],
+        lumped_geometries: list[CPGeom | CPPointBar],
+        e_a: float,
+        cx: float,
+        cy: float,
+        e_ixx: float,
+        e_iyy: float,
+        e_ixy: float,
+    ) -> res.ElasticStressBasis:
+        """Calculates an elastic stress basis given section properties.
+
+        Meshes the meshed geometries and calculates the stresses and net actions
+        resulting from a unit axial force and unit bending moments about the x and y
+        axes.
+
+        Args:
+            meshed_geometries: List of meshed geometries to include in the basis
+            lumped_geometries: List of lumped geometries to include in the basis
+            e_a: Axial rigidity
+            cx: x-Centroid
+            cy: y-Centroid
+            e_ixx: Flexural rigidity about the x-axis
+            e_iyy: Flexural rigidity about the y-axis
+            e_ixy: Flexural rigidity about the xy-axis
+
+        Returns:
+            Elastic stress basis object
+        """
+        conc_sections = []
+        conc_sigs = []
+        conc_actions = []
+        meshed_reinf_sections = []
+        meshed_reinf_sigs = []
+        meshed_reinf_actions = []
+
+        # loop through all meshed geometries and calculate unit stresses
+        for meshed_geom in meshed_geometries:
+            analysis_section = AnalysisSection(geometry=meshed_geom)
+            sig, actions = analysis_section.get_elastic_stress_basis(
+                e_a=e_a,
+                cx=cx,
+                cy=cy,
+                e_ixx=e_ixx,
+                e_iyy=e_iyy,
+                e_ixy=e_ixy,
+            )
+
+            if isinstance(meshed_geom, CPGeomConcrete):
+                conc_sections.append(analysis_section)
+                conc_sigs.append(sig)
+                conc_actions.append(actions)
+            else:
+                meshed_reinf_sections.append(analysis_section)
+                meshed_reinf_sigs.append(sig)
+                meshed_reinf_actions.append(actions)
+
+        # unit stresses in the lumped geometries
+        positions = np.array(
+            [geom.calculate_centroid() for geom in lumped_geometries], dtype=float
+        ).reshape(-1, 2) - np.array([cx, cy])
+        areas = np.array(
+            [geom.calculate_area() for geom in lumped_geometries], dtype=float
+        )
+        moduli = np.array(
+            [geom.material.elastic_modulus for geom in lumped_geometries], dtype=float
+        )
+        displaced_moduli = np.array(
+            [geom.get_displaced_elastic_modulus() for geom in lumped_geometries],
+            dtype=float,
+        )
+        det = e_ixx * e_iyy - e_ixy**2
+        x = positions[:, 0]
+        y = positions[:, 1]
+        lumped_sigs = moduli[:, np.newaxis] * np.column_stack(
+            [
+                np.full_like(x, 1 / e_a),
+                (-e_ixy * x + e_iyy * y) / det,
+                (e_ixx * x - e_ixy * y) / det,
+            ]
+        )
+
+        return res.ElasticStressBasis(
+            concrete_analysis_sections=conc_sections,
+            concrete_stresses=conc_sigs,
+            concrete_actions=np.array(conc_actions, dtype=float).reshape(-1, 3, 3),
+            meshed_reinforcement_sections=meshed_reinf_sections,
+            meshed_reinforcement_stresses=meshed_reinf_sigs,
+            meshed_reinforcement_actions=np.array(
+                meshed_reinf_actions, dtype=float
+            ).reshape(-1, 3, 3),
+            lumped_reinforcement_geometries=list(lumped_geometries),
+            lumped_reinforcement_stresses=lumped_sigs,
+            lumped_reinforcement_positions=positions,
+            lumped_reinforcement_areas=areas,
+            lumped_reinforcement_elastic_moduli=moduli,
+            lumped_reinforcement_displaced_moduli=displaced_moduli,
+        )
+
+    def calculate_uncracked_stresses(
+        self,
+        load_cases: np.ndarray | list[tuple[float, float, float]],
+    ) -> res.ElasticStressResults:
+        """Calculates uncracked stresses for many load cases.
+
+        As the uncracked stress is linear in the applied actions, the stresses for all
+        load cases are found by superposition of the
+        :attr:`~concreteproperties.concrete_section.ConcreteSection.uncracked_stress_basis`,
+        which is calculated once per section. The results are identical to those of
+        :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_uncracked_stress`,
+        except that the meshed geometries are not split at the neutral axis.
+
+        Args:
+            load_cases: Array of load cases, each row containing the axial force and
+                bending moments about the x and y axes (``n``, ``m_x``, ``m_y``)
+
+        Raises:
+            ValueError: If ``load_cases`` does not have three columns
+
+        Returns:
+            Elastic stress results object for all load cases
+        """
+        actions = np.atleast_2d(np.asarray(load_cases, dtype=float))
+
+        if actions.ndim != 2 or actions.shape[1] != 3:
+            msg = "load_cases must be an array with three columns (n, m_x, m_y)."
+            raise ValueError(msg)
+
+        return self.superpose_elastic_stresses(
+            basis=self.uncracked_stress_basis, actions=actions
+        )
+
+    def superpose_elastic_stresses(
+        self,
+        basis: res.ElasticStressBasis,
+        actions: np.ndarray,
+        cracked_results: res.CrackedResults | None = None,
+    ) -> res.ElasticStressResults:
+        """Calculates elastic stresses for many load cases from a stress basis.
+
+        Args:
+            basis: Elastic stress basis object
+            actions: Array of load cases, each row containing the axial force and
+                bending moments about the x and y axes (``n``, ``m_x``, ``m_y``)
+            cracked_results: Cracked results the basis was calculated for, ``None``
+                for an uncracked basis. Defaults to ``None``.
+
+        Returns:
+            Elastic stress results object for all load cases
+        """
+        # lumped reinforcement, forces are net of the displaced concrete
+        lumped_sigs = actions @ basis.lumped_reinforcement_stresses.T
+        lumped_strains = lumped_sigs / basis.lumped_reinforcement_elastic_moduli
+        lumped_forces = np.empty((*lumped_sigs.shape, 3))
+        lumped_forces[..., 0] = (
+            lumped_sigs - basis.lumped_reinforcement_displaced_moduli * lumped_strains
+        ) * basis.lumped_reinforcement_areas
+        lumped_forces[..., 1:] = basis.lumped_reinforcement_positions
+
+        return res.ElasticStressResults(
+            default_units=self.default_units,
+            concrete_section=self,
+            basis=basis,
+            actions=actions,
+            concrete_stresses=[actions @ sig.T for sig in basis.concrete_stresses],
+            concrete_actions=np.einsum("kj,sij->ksi", actions, basis.concrete_actions),
+            meshed_reinforcement_stresses=[
+                actions @ sig.T for sig in basis.meshed_reinforcement_stresses
+            ],
+            meshed_reinforcement_actions=np.einsum(
+                "kj,sij->ksi", actions, basis.meshed_reinforcement_actions
+            ),
+            lumped_reinforcement_stresses=lumped_sigs,
+            lumped_reinforcement_strains=lumped_strains,
+            lumped_reinforcement_forces=lumped_forces,
+            cracked_results=cracked_results,
+        )
+
+    def get_cracked_stress_properties(
+        self,
+        cracked_results: res.CrackedResults,
+    ) -> tuple[dict[str, float], float, float]:
+        """Returns the cracked properties used in a cracked stress analysis.
+
+        Args:
+            cracked_results: Cracked results objects
+
+        Returns:
+            Cracked section properties (``e_a``, ``cx``, ``cy``, ``e_ixx``, ``e_iyy``,
+            ``e_ixy``) and the bending moments about the x and y axes resulting from a
+            unit bending moment about the bending axis stored in ``cracked_results``
+        """
+        # get cracked section properties
+        e_a = cracked_results.e_a_cr
+        cx = cracked_results.cx
+        cy = cracked_results.cy
+        e_ixx = cracked_results.e_ixx_c_cr
+        e_iyy = cracked_results.e_iyy_c_cr
+        e_ixy = cracked_results.e_ixy_c_cr
+
+        # correct small e_ixy sign error
+        if abs(e_ixy / cracked_results.e_i11_cr) < 1e-12:
+            e_ixy = 0
+
+        # get bending angle
+        theta = cracked_results.theta
+
+        # handle cardinal points (avoid divide by zeros)
+        tan_theta = np.tan(theta)
+        with np.errstate(divide="ignore"):
+            c = (e_ixx - e_ixy * tan_theta) / (e_ixy - e_iyy * tan_theta)
+
+        # calculate bending moment about each axis (figure out signs)
+        sign = 0
+        if theta <= 0:
+            if c < 0:
+                sign = -1
+            elif c > 0:
+                sign = 1
+        else:
+            sign = 1 if c < 0 else -1
+
+        m_x = sign * np.sqrt(1 / (1 + 1 / (c * c)))
+        m_y = m_x / c
 
-        # point on neutral axis is centroid
-        point_na = (cx, cy)
+        props = {
+            "e_a": e_a,
+            "cx": cx,
+            "cy": cy,
+            "e_ixx": e_ixx,
+            "e_iyy": e_iyy,
+            "e_ixy": e_ixy,
+        }
 
-        # split meshed geometries above and below neutral axis
-        split_meshed_geoms = []
+        return props, m_x, m_y
 
-        for meshed_geom in self.meshed_geometries:
-            top_geoms, bot_geoms = meshed_geom.split_section(
-                point=point_na,
-                theta=theta,
-            )
+    def get_cracked_stress_basis(
+        self,
+        cracked_results: res.CrackedResults,
+    ) -> res.ElasticStressBasis:
+        """Returns the cracked stress basis, cached on ``cracked_results``.
 
-            split_meshed_geoms.extend(top_geoms)
-            split_meshed_geoms.extend(bot_geoms)
+        The basis is calculated on first call, meshing the meshed cracked geometries
+        once. The basis depends only on the cracked geometry and hence on the bending
+        angle ``theta``.
 
-        # loop through all meshed geometries and calculate stress
-        for meshed_geom in split_meshed_geoms:
-            analysis_section = AnalysisSection(geometry=meshed_geom)
+        Args:
+            cracked_results: Cracked results objects
 
-            # calculate stress, force and point of action
-            sig, n_sec, d_x, d_y = analysis_section.get_elastic_stress(
-                n=n,
-                m_x=m_x,
-                m_y=m_y,
-                e_a=e_a,
-                cx=cx,
-                cy=cy,
-                e_ixx=e_ixx,
-                e_iyy=e_iyy,
-                e_ixy=e_ixy,
+        Returns:
+            Cracked stress basis object
+        """
+        if cracked_results.stress_basis is None:
+            props, _, _ = self.get_cracked_stress_properties(
+                cracked_results=cracked_results
+            )
+            cracked_results.stress_basis = self.calculate_elastic_stress_basis(
+                meshed_geometries=[
+                    geom
+                    for geom in cracked_results.cracked_geometries
+                    if geom.material.meshed
+                ],
+                lumped_geometries=[
+                    geom
+                    for geom in cracked_results.cracked_geometries
+                    if not geom.material.meshed
+                ],
+                **props,
             )
 
-            # save results
-            if isinstance(meshed_geom, CPGeomConcrete):
-                conc_sigs.append(sig)
-                conc_forces.append((n_sec, d_x, d_y))
-                conc_sections.append(analysis_section)
-            else:
-                meshed_reinf_sigs.append(sig)
-                meshed_reinf_forces.append((n_sec, d_x, d_y))
-                meshed_reinf_sections.append(analysis_section)
-
-        # loop through all lumped geometries and calculate stress
-        for lumped_geom in self.reinf_geometries_lumped:
-            # initialise stress and position
-            sig = 0
-            centroid = lumped_geom.calculate_centroid()
-            x = centroid[0] - cx
-            y = centroid[1] - cy
+        return cracked_results.stress_basis
 
-            # axial stress
-            sig += n * lumped_geom.material.elastic_modulus / e_a
+    def calculate_cracked_stresses(
+        self,
+        cracked_results: res.CrackedResults,
+        m: float | np.ndarray,
+        n: float | np.ndarray = 0,
+    ) -> res.ElasticStressResults:
+        """Calculates cracked stresses for many bending moments.
+
+        Uses cracked area section properties to determine concrete and reinforcement
+        stresses given axial forces ``n`` and bending moments ``m`` about the bending
+        axis stored in ``cracked_results``. The stresses for all load cases are found by
+        superposition of the cracked stress basis, which is calculated once and cached
+        on ``cracked_results``. The results are identical to those of
+        :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_cracked_stress`.
 
-            # bending moment stress
-            sig += lumped_geom.material.elastic_modulus * (
-                -(e_ixy * m_x) / (e_ixx * e_iyy - e_ixy**2) * x
-                + (e_iyy * m_x) / (e_ixx * e_iyy - e_ixy**2) * y
-            )
-            sig += lumped_geom.material.elastic_modulus * (
-                +(e_ixx * m_y) / (e_ixx * e_iyy - e_ixy**2) * x
-                - (e_ixy * m_y) / (e_ixx * e_iyy - e_ixy**2) * y
-            )
+        Args:
+            cracked_results: Cracked results objects
+            m: Bending moments
+            n: Axial forces, a single value or one per bending moment. Defaults to
+                ``0``.
 
-            strain = sig / lumped_geom.material.elastic_modulus
+        Returns:
+            Elastic stress results object for all load cases
+        """
+        basis = self.get_cracked_stress_basis(cracked_results=cracked_results)
+        _, m_x_unit, m_y_unit = self.get_cracked_stress_properties(
+            cracked_results=cracked_results
+        )
 
-            # net force and point of action
-            n_lumped = sig * lumped_geom.calculate_area()
-            lumped_reinf_sigs.append(sig)
-            lumped_reinf_strains.append(strain)
-            lumped_reinf_forces.append((n_lumped, x, y))
-            lumped_reinf_geoms.append(lumped_geom)
+        m_abs = np.abs(np.atleast_1d(np.asarray(m, dtype=float)))
+        n_arr = np.broadcast_to(np.asarray(n, dtype=float), m_abs.shape)
+        actions = np.column_stack([n_arr, m_x_unit * m_abs, m_y_unit * m_abs])
 
-        return res.StressResult(
-            default_units=self.default_units,
-            concrete_section=self,
-            concrete_analysis_sections=conc_sections,
-            concrete_stresses=conc_sigs,
-            concrete_forces=conc_forces,
-            meshed_reinforcement_sections=meshed_reinf_sections,
-            meshed_reinforcement_stresses=meshed_reinf_sigs,
-            meshed_reinforcement_forces=meshed_reinf_forces,
-            lumped_reinforcement_geometries=lumped_reinf_geoms,
-            lumped_reinforcement_stresses=lumped_reinf_sigs,
-            lumped_reinforcement_strains=lumped_reinf_strains,
-            lumped_reinforcement_forces=lumped_reinf_forces,
+        return self.superpose_elastic_stresses(
+            basis=basis, actions=actions, cracked_results=cracked_results
         )
 
     def calculate_cracked_stress(
@@ -1672,38 +2689,18 @@ class ConcreteSection:
         lumped_reinf_strains = []
         lumped_reinf_forces = []
 
-        # get cracked section properties
-        e_a = cracked_results.e_a_cr
-        cx = cracked_results.cx
-        cy = cracked_results.cy
-        e_ixx = cracked_results.e_ixx_c_cr
-        e_iyy = cracked_results.e_iyy_c_cr
-        e_ixy = cracked_results.e_ixy_c_cr
-
-        # correct small e_ixy sign error
-        if abs(e_ixy / cracked_results.e_i11_cr) < 1e-12:
-            e_ixy = 0
-
-        # get bending angle
-        theta = cracked_results.theta
-
-        # handle cardinal points (avoid divide by zeros)
-        tan_theta = np.tan(theta)
-        with np.errstate(divide="ignore"):
-            c = (e_ixx - e_ixy * tan_theta) / (e_ixy - e_iyy * tan_theta)
-
-        # calculate bending moment about each axis (figure out signs)
-        sign = 0
-        if theta <= 0:
-            if c < 0:
-                sign = -1
-            elif c > 0:
-                sign = 1
-        else:
-            sign = 1 if c < 0 else -1
-
-        m_x = sign * np.sqrt(m * m / (1 + 1 / (c * c)))
-        m_y = m_x / c
+        # get cracked section properties and bending moment about each axis
+        props, m_x_unit, m_y_unit = self.get_cracked_stress_properties(
+            cracked_results=cracked_results
+        )
+        e_a = props["e_a"]
+        cx = props["cx"]
+        cy = props["cy"]
+        e_ixx = props["e_ixx"]
+        e_iyy = props["e_iyy"]
+        e_ixy = props["e_ixy"]
+        m_x = m_x_unit * abs(m)
+        m_y = m_y_unit * abs(m)
 
         # loop through all meshed geometries and calculate stress
         for geom in cracked_results.cracked_geometries:
@@ -1733,8 +2730,14 @@ class ConcreteSection:
                     meshed_reinf_forces.append((n_sec, d_x, d_y))
                     meshed_reinf_sections.append(analysis_section)
 
-        # loop through all lumped geometries and calculate stress
-        for lumped_geom in self.reinf_geometries_lumped:
+        # loop through all cracked lumped geometries and calculate stress
+        lumped_geoms = [
+            geom
+            for geom in cracked_results.cracked_geometries
+            if not geom.material.meshed
+        ]
+
+        for lumped_geom in lumped_geoms:
             # initialise stress and position of bar
             sig = 0
             centroid = lumped_geom.calculate_centroid()
@@ -1755,8 +2758,10 @@ class ConcreteSection:
             )
             strain = sig / lumped_geom.material.elastic_modulus
 
-            # net force and point of action
-            n_lumped = sig * lumped_geom.calculate_area()
+            # net force (net of the displaced concrete) and point of action
+            n_lumped = (
+                sig - lumped_geom.get_displaced_elastic_modulus() * strain
+            ) * lumped_geom.calculate_area()
 
             lumped_reinf_sigs.append(sig)
             lumped_reinf_strains.append(strain)
@@ -1807,24 +2812,148 @@ class ConcreteSection:
             # get curvature
             kappa = moment_curvature_results.get_curvature(moment=m)
 
-        # get theta
-        theta = moment_curvature_results.theta
+        # warm start from the converged moment-curvature strains
+        eps0_guesses = moment_curvature_results.get_eps0_estimates(
+            kappa=np.array([kappa])
+        )
+        eps0 = self.solve_service_eps0(
+            moment_curvature_results=moment_curvature_results,
+            kappa=kappa,
+            eps0_guess=None if eps0_guesses is None else eps0_guesses[0],
+        )
+
+        return self.get_service_stress_result(
+            theta=moment_curvature_results.theta, eps0=eps0, kappa=kappa
+        )
+
+    def calculate_service_stresses(
+        self,
+        moment_curvature_results: res.MomentCurvatureResults,
+        m: np.ndarray | list[float] | None = None,
+        kappa: np.ndarray | list[float] | None = None,
+        compact: bool = False,
+    ) -> res.ServiceStressResults:
+        """Calculates service stresses for many bending moments.
+
+        Curvatures are interpolated from the moment-curvature results for all moments
+        at once. The converged extreme fibre strains stored during the
+        moment-curvature analysis are used as warm starts when solving for the
+        equilibrium of each load case.
+
+        Args:
+            moment_curvature_results: Moment-curvature results objects
+            m: Bending moments. Defaults to ``None``.
+            kappa: Curvatures, if provided overrides the supplied bending moments and
+                calculates the stresses at the given curvatures. Defaults to ``None``.
+            compact: If set to True, each stress result is compacted as it is
+                calculated, see
+                :meth:`~concreteproperties.results.StressResult.compact`. Identical
+                meshes are shared between the stress results. Defaults to ``False``.
+
+        Raises:
+            ValueError: If neither ``m`` nor ``kappa`` is provided
+            AnalysisError: If the stress analysis fails
+
+        Returns:
+            Service stress results object
+        """
+        if kappa is None:
+            if m is None:
+                msg = "Either m or kappa must be provided."
+                raise ValueError(msg)
+
+            kappas = moment_curvature_results.get_curvatures(
+                moments=np.atleast_1d(np.asarray(m, dtype=float))
+            )
+        else:
+            kappas = np.atleast_1d(np.asarray(kappa, dtype=float))
+
+        # warm starts from the converged moment-curvature strains
+        eps0_guesses = moment_curvature_results.get_eps0_estimates(kappa=kappas)
+        eps0s = np.zeros_like(kappas)
+        stress_results = []
+        mesh_cache = {}
+
+        for idx, kappa_i in enumerate(kappas):
+            eps0s[idx] = self.solve_service_eps0(
+                moment_curvature_results=moment_curvature_results,
+                kappa=float(kappa_i),
+                eps0_guess=None if eps0_guesses is None else eps0_guesses[idx],
+            )
+            stress_result = self.get_service_stress_result(
+                theta=moment_curvature_results.theta,
+                eps0=eps0s[idx],
+                kappa=float(kappa_i),
+            )
+
+            if compact:
+                stress_result.compact(mesh_cache=mesh_cache)
+
+            stress_results.append(stress_result)
+
+        return res.ServiceStressResults(
+            default_units=self.default_units,
+            moment_curvature_results=moment_curvature_results,
+            kappa=kappas,
+            eps0=eps0s,
+            stress_results=stress_results,
+        )
+
+    def solve_service_eps0(
+        self,
+        moment_curvature_results: res.MomentCurvatureResults,
+        kappa: float,
+        eps0_guess: float | None = None,
+    ) -> float:
+        """Finds the extreme fibre strain giving axial force equilibrium.
+
+        Args:
+            moment_curvature_results: Moment-curvature results objects
+            kappa: Curvature
+            eps0_guess: Estimate of the strain at the extreme compressive fibre, used
+                to narrow the initial bracket of the root finder. Defaults to ``None``.
+
+        Raises:
+            AnalysisError: If the analysis fails
+
+        Returns:
+            Strain at the extreme compressive fibre
+        """
+        # replay a converged curvature step directly
+        step = moment_curvature_results.get_step(kappa=kappa)
+
+        if step is not None:
+            return float(moment_curvature_results.eps0[step])
 
         # initialise variables
         mk = res.MomentCurvatureResults(
             default_units=self.default_units,
-            theta=theta,
+            theta=moment_curvature_results.theta,
             n_target=moment_curvature_results.n_target,
         )
 
+        # try a narrow bracket about the estimate first
+        if eps0_guess is not None:
+            delta = max(0.05 * abs(eps0_guess), 1e-5)
+
+            try:
+                return brentq(
+                    f=self.service_normal_force_convergence,
+                    a=eps0_guess - delta,
+                    b=eps0_guess + delta,
+                    args=(kappa, mk),
+                    disp=False,
+                )
+            except ValueError:
+                pass
+
         # find neutral axis that gives convergence of the axial force
         try:
-            eps0, r = brentq(
+            eps0 = brentq(
                 f=self.service_normal_force_convergence,
                 a=-0.1,
                 b=0.1,
                 args=(kappa, mk),
-                full_output=True,
                 disp=False,
             )
         except ValueError as exc:
@@ -1832,6 +2961,48 @@ class ConcreteSection:
             msg += "within the range of the moment-curvature analysis."
             raise utils.AnalysisError(msg) from exc
 
+        return eps0
+
+    def get_moment_curvature_stress(
+        self,
+        moment_curvature_results: res.MomentCurvatureResults,
+        step: int,
+    ) -> res.StressResult:
+        """Calculates the stresses at a step of a moment-curvature analysis.
+
+        The converged strain state stored for the step is replayed directly, i.e.
+        without solving for equilibrium.
+
+        Args:
+            moment_curvature_results: Moment-curvature results objects
+            step: Index of the curvature step
+
+        Returns:
+            Stress results object
+        """
+        return self.get_service_stress_result(
+            theta=moment_curvature_results.theta,
+            eps0=float(moment_curvature_results.eps0[step]),
+            kappa=moment_curvature_results.kappa[step],
+        )
+
+    def get_service_stress_result(
+        self,
+        theta: float,
+        eps0: float,
+        kappa: float,
+    ) -> res.StressResult:
+        r"""Calculates service stresses given a converged strain state.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+            eps0: Strain at the extreme compressive fibre
+            kappa: Curvature
+
+        Returns:
+            Stress results object
+        """
         # initialise stress results
         conc_sections = []
         conc_sigs = []
@@ -1845,9 +3016,7 @@ class ConcreteSection:
         lumped_reinf_forces = []
 
         # get global coordinates of extreme compressive fibre
-        ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        ecf, _ = utils.calculate_extreme_fibre(points=self.hull_points, theta=theta)
 
         # create splits in meshed geometries at points in stress-strain profiles
         meshed_split_geoms: list[CPGeom | CPGeomConcrete] = []
@@ -1900,9 +3069,12 @@ class ConcreteSection:
                 kappa=kappa,
             )
 
-            # calculate stress, force and point of action
+            # calculate stress, force (net of the displaced concrete) and point of
+            # action
             sig = lumped_geom.material.stress_strain_profile.get_stress(strain=strain)
-            n_lumped = sig * lumped_geom.calculate_area()
+            n_lumped = (
+                sig - lumped_geom.get_displaced_stress(strain=strain)
+            ) * lumped_geom.calculate_area()
 
             lumped_reinf_sigs.append(sig)
             lumped_reinf_strains.append(strain)
@@ -1944,7 +3116,7 @@ class ConcreteSection:
         """
         # depth of neutral axis at extreme tensile fibre
         extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
+            points=self.hull_points, theta=ultimate_results.theta
         )
 
         # find point on neutral axis by shifting by d_n
@@ -2026,9 +3198,12 @@ class ConcreteSection:
                     ultimate_strain=self.gross_properties.conc_ultimate_strain,
                 )
 
-            # calculate stress, force and point of action
+            # calculate stress, force (net of the displaced concrete) and point of
+            # action
             sig = lumped_geom.material.stress_strain_profile.get_stress(strain=strain)
-            n_lumped = sig * lumped_geom.calculate_area()
+            n_lumped = (
+                sig - lumped_geom.get_displaced_stress(strain=strain, ultimate=True)
+            ) * lumped_geom.calculate_area()
 
             lumped_reinf_sigs.append(sig)
             lumped_reinf_strains.append(strain)
@@ -2078,7 +3253,7 @@ class ConcreteSection:
 
         # calculate extreme fibre in local coordinates
         extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
+            points=self.hull_points, theta=theta
         )
         _, ef_v = utils.global_to_local(
             theta=theta, x=extreme_fibre[0], y=extreme_fibre[1]
@@ -2249,3 +3424,206 @@ class ConcreteSection:
                 )
 
         return ax
+
+
+@dataclass(eq=False)
+class SectionSnapshot:
+    """Class for a compact, picklable snapshot of a concrete section.
+
+    The geometry is stored as flat coordinate arrays, the materials in a table indexed
+    by the geometries and bars, and the gross properties are precomputed. The snapshot
+    is therefore quick to send to worker processes, where the section is rehydrated by
+    calling the snapshot (or :meth:`to_section`), e.g. a snapshot may be used as the
+    ``section`` of a :class:`~concreteproperties.batch.BatchJob`.
+
+    Calling :meth:`share` copies the arrays to a shared memory block, after which only
+    the name of the block and the layout of the arrays are pickled.
+
+    Args:
+        section_class: Class of the concrete section
+        arrays: Coordinates (``coords``) and offsets of the rings (``ring_offsets``) and
+            polygon geometries (``geometry_offsets``), positions and areas of the point
+            bars (``bar_x``, ``bar_y``, ``bar_area``), material indices
+            (``geometry_materials``, ``bar_materials``) and gross properties
+            (``gross_properties``)
+        materials: Material table
+        gross_property_names: Names of the values in the ``gross_properties`` array
+        moment_centroid: Moment centroid provided to the section, if any
+        geometric_centroid_override: Whether the moment centroid is the geometric
+            centroid
+        default_units: Default units of the section
+    """
+
+    section_class: type[ConcreteSection]
+    arrays: dict[str, np.ndarray]
+    materials: list[Material]
+    gross_property_names: list[str]
+    moment_centroid: tuple[float, float] | None
+    geometric_centroid_override: bool
+    default_units: UnitDisplay
+    _shared_memory: SharedMemory | None = field(default=None, repr=False)
+
+    def __call__(self) -> ConcreteSection:
+        """Rehydrates the concrete section, see :meth:`to_section`.
+
+        Returns:
+            Concrete section
+        """
+        return self.to_section()
+
+    def to_section(self) -> ConcreteSection:
+        """Rehydrates the concrete section.
+
+        The section is created as ``trusted``, i.e. the geometry is not checked or
+        rounded, and the gross properties are not recalculated.
+
+        Returns:
+            Concrete section
+        """
+        arrays = self.arrays
+        coords = arrays["coords"]
+        ring_offsets = arrays["ring_offsets"].tolist()
+        geometry_offsets = arrays["geometry_offsets"].tolist()
+        rings = [coords[a:b] for a, b in pairwise(ring_offsets)]
+        geoms = [
+            sp_geom.Geometry(
+                geom=Polygon(shell=rings[a], holes=rings[a + 1 : b]),
+                material=self.materials[mat_idx],  # pyright: ignore [reportArgumentType]
+            )
+            for (a, b), mat_idx in zip(
+                pairwise(geometry_offsets),
+                arrays["geometry_materials"].tolist(),
+                strict=True,
+            )
+        ]
+        bars = [
+            LumpedBar(x=x, y=y, area=area, material=self.materials[mat_idx])  # pyright: ignore [reportArgumentType]
+            for x, y, area, mat_idx in zip(
+                arrays["bar_x"].tolist(),
+                arrays["bar_y"].tolist(),
+                arrays["bar_area"].tolist(),
+                arrays["bar_materials"].tolist(),
+                strict=True,
+            )
+        ]
+        section = self.section_class(
+            geometry=sp_geom.CompoundGeometry(geoms=geoms),
+            moment_centroid=self.moment_centroid,
+            geometric_centroid_override=self.geometric_centroid_override,
+            default_units=self.default_units,
+            lumped_bars=bars,
+            trusted=True,
+        )
+        section._gross_properties = res.GrossProperties(
+            default_units=self.default_units,
+            **dict(
+                zip(
+                    self.gross_property_names,
+                    arrays["gross_properties"].tolist(),
+                    strict=True,
+                )
+            ),
+        )
+
+        return section
+
+    def share(self) -> SharedMemory:
+        """Copies the arrays of the snapshot to a shared memory block.
+
+        The arrays of the snapshot are replaced by views into the block, and pickling
+        the snapshot only stores the name of the block and the layout of the arrays.
+        The caller owns the block and must close and unlink it once the snapshot is no
+        longer required, see :class:`multiprocessing.shared_memory.SharedMemory`.
+
+        Returns:
+            Shared memory block
+        """
+        layout = _shared_memory_layout(arrays=self.arrays)
+        size = max([offset + arr.nbytes for arr, offset in layout.values()] + [1])
+        shm = SharedMemory(create=True, size=size)
+
+        for name, (arr, offset) in layout.items():
+            view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)
+            view[...] = arr
+            self.arrays[name] = view
+
+        self._shared_memory = shm
+
+        return shm
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state to pickle, without the arrays if they are shared."""
+        state = self.__dict__.copy()
+        shm = state.pop("_shared_memory")
+
+        if shm is not None:
+            state["arrays"] = {
+                name: (arr.dtype.str, arr.shape, offset)
+                for name, (arr, offset) in _shared_memory_layout(
+                    arrays=self.arrays
+                ).items()
+            }
+            state["_shared_memory_name"] = shm.name
+
+        return state
+
+    def __setstate__(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        """Restores the pickled state, attaching to the shared memory if required."""
+        name = state.pop("_shared_memory_name", None)
+        self.__dict__.update(state)
+        self._shared_memory = None
+
+        if name is not None:
+            shm = _attach_shared_memory(name=name)
+            self._shared_memory = shm
+            self.arrays = {
+                key: np.ndarray(
+                    shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+                )
+                for key, (dtype, shape, offset) in state["arrays"].items()
+            }
+
+
+def _shared_memory_layout(
+    arrays: dict[str, np.ndarray],
+) -> dict[str, tuple[np.ndarray, int]]:
+    """Determines the byte offsets of arrays in a shared memory block.
+
+    Args:
+        arrays: Arrays to store
+
+    Returns:
+        Contiguous array and its offset (aligned to 8 bytes) for each array
+    """
+    layout = {}
+    offset = 0
+
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        layout[name] = (arr, offset)
+        offset += -(-arr.nbytes // 8) * 8
+
+    return layout
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """Attaches to an existing shared memory block, without tracking it.
+
+    The process that created the block is responsible for unlinking it.
+
+    Args:
+        name: Name of the shared memory block
+
+    Returns:
+        Shared memory block
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    shm = SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")  # pyright: ignore
+
+    return shm
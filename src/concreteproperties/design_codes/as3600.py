@@ -2,26 +2,52 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+from dataclasses import dataclass
 from math import inf
 from typing import TYPE_CHECKING
 
 import numpy as np
 from rich.live import Live
 from scipy.interpolate import interp1d
-from scipy.optimize import brentq
 
 import concreteproperties.results as res
 import concreteproperties.stress_strain_profile as ssp
 from concreteproperties.design_codes.design_code import DesignCode
 from concreteproperties.material import Concrete, SteelBar
 from concreteproperties.post import DEFAULT_UNITS, si_n_mm
-from concreteproperties.utils import AnalysisError, create_known_progress
+from concreteproperties.utils import (
+    AnalysisError,
+    calculate_extreme_fibre,
+    create_known_progress,
+)
 
 if TYPE_CHECKING:
     from concreteproperties.concrete_section import ConcreteSection
 
 
+@dataclass
+class InteractionAnchors:
+    """Class for storing the significant points of an AS 3600 interaction diagram.
+
+    All results are unfactored and relate to a single neutral axis angle.
+
+    Args:
+        k_uo: Neutral axis parameter at pure bending
+        n_ub: Axial force at balanced point
+        squash: Squash load result
+        decomp: Decompression point result
+        pure: Pure bending result
+        tensile: Tensile load result
+    """
+
+    k_uo: float
+    n_ub: float
+    squash: res.UltimateBendingResults
+    decomp: res.UltimateBendingResults
+    pure: res.UltimateBendingResults
+    tensile: res.UltimateBendingResults
+
+
 class AS3600(DesignCode):
     """Design code class for Australian standard AS 3600:2018.
 
@@ -38,6 +64,12 @@ class AS3600(DesignCode):
         """Inits the AS3600 class."""
         super().__init__()
 
+        # interaction diagram anchors and factored capacity curves for each theta
+        self._anchors: dict[float, InteractionAnchors] = {}
+        self._capacity_curves: dict[
+            tuple[float, str, int, float], tuple[np.ndarray, np.ndarray]
+        ] = {}
+
     def assign_concrete_section(
         self,
         concrete_section: ConcreteSection,
@@ -51,6 +83,8 @@ class AS3600(DesignCode):
             ValueError: If there is meshed reinforcement within the concrete_section
         """
         self.concrete_section = concrete_section
+        self._anchors = {}
+        self._capacity_curves = {}
 
         # check to make sure there are no meshed reinforcement regions
         if self.concrete_section.reinf_geometries_meshed:
@@ -212,8 +246,10 @@ class AS3600(DesignCode):
 
         # loop through all concrete geometries
         for conc_geom in self.concrete_section.concrete_geometries:
-            # calculate area
-            area = conc_geom.calculate_area()
+            # calculate area (net of any point bars)
+            area = self.concrete_section.calculate_net_concrete_area(
+                conc_geom=conc_geom
+            )
 
             # calculate alpha_squash
             comp_strength = (
@@ -256,16 +292,17 @@ class AS3600(DesignCode):
 
     def capacity_reduction_factor(
         self,
-        n_u: float,
+        n_u: float | np.ndarray,
         n_ub: float,
         n_uot: float,
-        k_uo: float,
+        k_uo: float | np.ndarray,
         phi_0: float,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Returns the AS 3600 capacity reduction factor (Table 2.2.2).
 
         ``n_ub`` and ``phi_0`` only required for compression, ``n_uot`` only required
-        for tension.
+        for tension. ``n_u`` and ``k_uo`` may be arrays, in which case an array of
+        capacity reduction factors is returned.
 
         Args:
             n_u: Axial force in member
@@ -277,57 +314,127 @@ class AS3600(DesignCode):
         Returns:
             Capacity reduction factor
         """
-        # pure bending phi
-        if self.reinforcement_class == "N":
-            phi = 1.24 - 13 * k_uo / 12
-            phi = min(phi, 0.85)
-            phi = max(phi, 0.65)
-        else:
-            phi = 0.65
+        n_u = np.asarray(n_u, dtype=float)
+        phi_b = self.pure_bending_factor(k_uo=k_uo)
 
-        # compression
-        if n_u > 0:
-            if n_u >= n_ub:
-                return phi_0
-            else:
-                return phi_0 + (phi - phi_0) * (1 - n_u / n_ub)
-        # tension
-        else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # compression
+            phi_c = np.where(
+                n_u >= n_ub, phi_0, phi_0 + (phi_b - phi_0) * (1 - n_u / n_ub)
+            )
+
+            # tension
             if self.reinforcement_class == "N":
-                return phi + (0.85 - phi) * (n_u / n_uot)
+                phi_t = phi_b + (0.85 - phi_b) * (n_u / n_uot)
             else:
-                return 0.65
+                phi_t = np.full_like(n_u, 0.65)
 
-    def get_k_uo(
+        phi = np.where(n_u > 0, phi_c, phi_t)
+
+        return float(phi) if phi.ndim == 0 else phi
+
+    def pure_bending_factor(
         self,
-        theta: float,
-    ) -> float:
-        r"""Returns k_uo for the reinforced concrete cross-section given ``theta``.
+        k_uo: float | np.ndarray,
+    ) -> np.ndarray:
+        """Returns the AS 3600 capacity reduction factor for pure bending.
 
         Args:
-            theta: Angle (in radians) the neutral axis makes with the horizontal axis
-                (:math:`-\pi \leq \theta \leq \pi`)
+            k_uo: Neutral axis parameter at pure bending
 
         Returns:
-            Bending parameter ``k_uo``
+            Capacity reduction factor for pure bending
         """
-        pure_res = self.concrete_section.ultimate_bending_capacity(theta=theta)
+        if self.reinforcement_class == "N":
+            return np.clip(1.24 - 13 * np.asarray(k_uo, dtype=float) / 12, 0.65, 0.85)
 
-        return pure_res.k_u
+        return np.full_like(np.asarray(k_uo, dtype=float), 0.65)
 
-    def get_n_ub(
+    def design_capacity_reduction_factor(
+        self,
+        n_design: float | np.ndarray,
+        n_ub: float,
+        n_uot: float,
+        k_uo: float | np.ndarray,
+        phi_0: float,
+    ) -> float | np.ndarray:
+        r"""Returns the capacity reduction factor for a design axial force.
+
+        Solves :math:`\phi = \phi(N^{*} / \phi)` in closed form. Within each branch
+        of Table 2.2.2 the relation is a quadratic in :math:`\phi`, the root within
+        the range of capacity reduction factors is returned. ``n_design`` and
+        ``k_uo`` may be arrays, in which case an array of capacity reduction factors
+        is returned.
+
+        Args:
+            n_design: Design axial force, N*
+            n_ub: Axial force at balanced point
+            n_uot: Axial force at ultimate tension load
+            k_uo: Neutral axis parameter at pure bending
+            phi_0: Capacity reduction factor for dominant compression
+
+        Returns:
+            Capacity reduction factor
+        """
+        n_design = np.asarray(n_design, dtype=float)
+        phi_b = self.pure_bending_factor(k_uo=k_uo)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # compression, phi^2 - phi_b * phi + (phi_b - phi_0) * N* / n_ub = 0
+            disc_c = phi_b**2 - 4 * (phi_b - phi_0) * n_design / n_ub
+            phi_c = np.where(
+                n_design >= phi_0 * n_ub,
+                phi_0,
+                (phi_b + np.sqrt(np.maximum(disc_c, 0))) / 2,
+            )
+
+            # tension, phi^2 - phi_b * phi - (0.85 - phi_b) * N* / n_uot = 0
+            if self.reinforcement_class == "N":
+                disc_t = phi_b**2 + 4 * (0.85 - phi_b) * n_design / n_uot
+                phi_t = (phi_b + np.sqrt(np.maximum(disc_t, 0))) / 2
+            else:
+                phi_t = np.full_like(n_design, 0.65)
+
+        phi = np.where(n_design > 0, phi_c, phi_t)
+
+        return float(phi) if phi.ndim == 0 else phi
+
+    def get_interaction_anchors(
         self,
         theta: float,
-    ) -> float:
-        r"""Returns n_ub for the reinforced concrete cross-section given ``theta``.
+    ) -> InteractionAnchors:
+        r"""Returns the significant points of the interaction diagram given ``theta``.
+
+        The anchors are calculated once for each ``theta`` and cached on the design
+        code object.
 
         Args:
             theta: Angle (in radians) the neutral axis makes with the horizontal axis
                 (:math:`-\pi \leq \theta \leq \pi`)
 
         Returns:
-            Balanced axial force ``n_ub``
+            Unfactored interaction diagram anchors
         """
+        if theta in self._anchors:
+            return self._anchors[theta]
+
+        units = self.concrete_section.default_units
+
+        # pure bending
+        pure = self.concrete_section.ultimate_bending_capacity(theta=theta)
+        theta = pure.theta
+
+        # decompression point, i.e. neutral axis at the extreme tensile fibre
+        _, d_t = calculate_extreme_fibre(
+            points=self.concrete_section.hull_points, theta=theta
+        )
+        decomp = self.concrete_section.calculate_ultimate_section_actions(
+            d_n=d_t,
+            ultimate_results=res.UltimateBendingResults(
+                default_units=units, theta=theta
+            ),
+        )
+
         # get depth to extreme tensile bar and its yield strain
         d_0, eps_sy = self.concrete_section.extreme_bar(theta=theta)
 
@@ -341,11 +448,55 @@ class AS3600(DesignCode):
         balanced_res = self.concrete_section.calculate_ultimate_section_actions(
             d_n=d_nb,
             ultimate_results=res.UltimateBendingResults(
-                default_units=self.concrete_section.default_units, theta=theta
+                default_units=units, theta=theta
+            ),
+        )
+
+        anchors = InteractionAnchors(
+            k_uo=pure.k_u,
+            n_ub=balanced_res.n,
+            squash=res.UltimateBendingResults(
+                default_units=units, theta=theta, d_n=inf, n=self.squash_load
+            ),
+            decomp=decomp,
+            pure=pure,
+            tensile=res.UltimateBendingResults(
+                default_units=units, theta=theta, n=self.tensile_load
             ),
         )
+        self._anchors[theta] = anchors
+
+        return anchors
+
+    def get_k_uo(
+        self,
+        theta: float,
+    ) -> float:
+        r"""Returns k_uo for the reinforced concrete cross-section given ``theta``.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
 
-        return balanced_res.n
+        Returns:
+            Bending parameter ``k_uo``
+        """
+        return self.get_interaction_anchors(theta=theta).k_uo
+
+    def get_n_ub(
+        self,
+        theta: float,
+    ) -> float:
+        r"""Returns n_ub for the reinforced concrete cross-section given ``theta``.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Returns:
+            Balanced axial force ``n_ub``
+        """
+        return self.get_interaction_anchors(theta=theta).n_ub
 
     def ultimate_bending_capacity(  # pyright: ignore [reportIncompatibleMethodOverride]
         self,
@@ -371,47 +522,33 @@ class AS3600(DesignCode):
             reduction factor (``factored_results``, ``unfactored_results``, ``phi``)
         """
         # get parameters to determine phi
+        anchors = self.get_interaction_anchors(theta=theta)
         n_uot = self.tensile_load
-        k_uo = self.get_k_uo(theta=theta)
-        n_ub = self.get_n_ub(theta=theta)
+        k_uo = anchors.k_uo
+        n_ub = anchors.n_ub
 
-        # non-linear calculation of phi
-        def non_linear_phi(phi_guess):
-            phi = self.capacity_reduction_factor(
-                n_u=n_design / phi_guess,
-                n_ub=n_ub,
-                n_uot=n_uot,
-                k_uo=k_uo,
-                phi_0=phi_0,
-            )
-
-            return phi - phi_guess
-
-        phi, _ = brentq(
-            f=non_linear_phi,
-            a=phi_0,
-            b=0.85,
-            xtol=1e-3,
-            rtol=1e-6,  # pyright: ignore [reportArgumentType]
-            full_output=True,
-            disp=False,
+        # capacity reduction factor for the design axial force
+        phi = self.design_capacity_reduction_factor(
+            n_design=n_design, n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
         )
 
-        # generate basic moment interaction diagram
-        f_mi_res, _, _ = self.moment_interaction_diagram(
-            theta=theta,
-            control_points=[
-                ("N", 0.0),
-            ],
-            n_points=2,
+        # factor significant points of the interaction diagram
+        points = [anchors.squash, anchors.decomp, anchors.pure, anchors.tensile]
+        phis = self.capacity_reduction_factor(
+            n_u=np.array([ult_res.n for ult_res in points]),
+            n_ub=n_ub,
+            n_uot=n_uot,
+            k_uo=k_uo,
             phi_0=phi_0,
-            progress_bar=False,
+        )
+        squash, decomp, pure, tensile = (
+            ult_res.scale(factor=f) for ult_res, f in zip(points, phis, strict=True)
         )
 
         # get significant axial loads
-        n_squash = f_mi_res.results[0].n
-        n_decomp = f_mi_res.results[1].n
-        n_tensile = f_mi_res.results[-1].n
+        n_squash = squash.n
+        n_decomp = decomp.n
+        n_tensile = tensile.n
 
         # DETERMINE where we are on interaction diagram
         # if we are above the squash load or tensile load
@@ -425,8 +562,6 @@ class AS3600(DesignCode):
         # compression linear interpolation
         elif n_design > n_decomp:
             factor = (n_design - n_decomp) / (n_squash - n_decomp)
-            squash = f_mi_res.results[0]
-            decomp = f_mi_res.results[1]
             ult_res = res.UltimateBendingResults(
                 default_units=self.concrete_section.default_units,
                 theta=theta,
@@ -445,7 +580,6 @@ class AS3600(DesignCode):
         # tensile linear interpolation
         else:
             factor = n_design / n_tensile
-            pure = f_mi_res.results[-2]
             ult_res = res.UltimateBendingResults(
                 default_units=self.concrete_section.default_units,
                 theta=theta,
@@ -458,11 +592,7 @@ class AS3600(DesignCode):
             )
 
         # factor ultimate results
-        f_ult_res = deepcopy(ult_res)
-        f_ult_res.n *= phi
-        f_ult_res.m_x *= phi
-        f_ult_res.m_y *= phi
-        f_ult_res.m_xy *= phi
+        f_ult_res = ult_res.scale(factor=phi)
 
         return f_ult_res, ult_res, phi
 
@@ -573,27 +703,22 @@ class AS3600(DesignCode):
             )
         )
 
-        # make a copy of the results to factor
-        f_mi_res = deepcopy(mi_res)
-
-        # list to store phis
-        phis = []
-
         # get required constants for phi
         n_uot = self.tensile_load
         k_uo = self.get_k_uo(theta=theta)
         n_ub = self.get_n_ub(theta=theta)
 
+        # capacity reduction factor for each result
+        phis = self.capacity_reduction_factor(
+            n_u=mi_res.get_column(name="n"),
+            n_ub=n_ub,
+            n_uot=n_uot,
+            k_uo=k_uo,
+            phi_0=phi_0,
+        ).tolist()
+
         # factor results
-        for ult_res in f_mi_res.results:
-            phi = self.capacity_reduction_factor(
-                n_u=ult_res.n, n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
-            )
-            ult_res.n *= phi
-            ult_res.m_x *= phi
-            ult_res.m_y *= phi
-            ult_res.m_xy *= phi
-            phis.append(phi)
+        f_mi_res = mi_res.scale(factors=phis)
 
         return f_mi_res, mi_res, phis
 
@@ -670,3 +795,166 @@ class AS3600(DesignCode):
         phis.append(phis[0])
 
         return f_bb_res, phis
+
+    def check_load_cases(
+        self,
+        load_cases: np.ndarray | list[tuple[float, float, float]],
+        n_points: int = 24,
+        phi_0: float = 0.6,
+        refine_band: float = 0.1,
+    ) -> res.LoadCaseResults:
+        r"""Checks many load cases against the factored capacity of the section.
+
+        The factored moment interaction diagrams for bending about each axis are
+        generated once (and cached), capacities are then linearly interpolated at the
+        design axial force of each load case. Load cases with a utilisation within
+        ``refine_band`` of unity have their capacities calculated exactly using
+        :meth:`ultimate_bending_capacity`.
+
+        Biaxial bending is checked in accordance with Cl. 10.6.4, i.e. the combined
+        utilisation is :math:`(u_x^{\alpha_n} + u_y^{\alpha_n})^{1 / \alpha_n}`, where
+        :math:`u_x = M^{*}_x / \phi M_{ux}` and :math:`u_y = M^{*}_y / \phi M_{uy}`.
+        Load cases with an axial force outside the factored squash and tensile loads
+        have an infinite utilisation.
+
+        Args:
+            load_cases: Array of load cases, one row per load case, each row
+                containing the design axial force and bending moments
+                (:math:`N^{*}`, :math:`M^{*}_x`, :math:`M^{*}_y`)
+            n_points: Number of points used to generate each moment interaction
+                diagram. Defaults to ``24``.
+            phi_0: Compression dominant capacity reduction factor, see Table 2.2.2(d).
+                Defaults to ``0.6``.
+            refine_band: Load cases with a utilisation between ``1 - refine_band``
+                and ``1 + refine_band`` are calculated exactly. Defaults to ``0.1``.
+
+        Raises:
+            ValueError: If ``load_cases`` does not have three columns
+
+        Returns:
+            Load case results object
+        """
+        cases = np.atleast_2d(np.asarray(load_cases, dtype=float))
+
+        if cases.ndim != 2 or cases.shape[1] != 3:
+            msg = "load_cases must be an array with three columns (N*, Mx*, My*)."
+            raise ValueError(msg)
+
+        n_design, m_x, m_y = cases.T.copy()
+        phi_m_ux = np.zeros(len(cases))
+        phi_m_uy = np.zeros(len(cases))
+
+        # neutral axis angles resulting in bending about each axis, positive and
+        # negative moments
+        for theta, axis, moment, capacity, sign in [
+            (0.0, "m_x", m_x, phi_m_ux, 1),
+            (np.pi, "m_x", m_x, phi_m_ux, -1),
+            (-np.pi / 2, "m_y", m_y, phi_m_uy, 1),
+            (np.pi / 2, "m_y", m_y, phi_m_uy, -1),
+        ]:
+            mask = sign * moment > 0
+
+            if mask.any():
+                n_curve, m_curve = self.get_capacity_curve(
+                    theta=theta, moment=axis, n_points=n_points, phi_0=phi_0
+                )
+                capacity[mask] = np.interp(
+                    n_design[mask], n_curve, m_curve, left=0, right=0
+                )
+
+        # biaxial bending exponent, Cl. 10.6.4
+        alpha_n = np.clip(0.7 + 1.7 * n_design / (0.6 * self.squash_load), 1, 2)
+
+        def utilisation(
+            idx: np.ndarray | slice,
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                u_x = np.where(m_x[idx] == 0, 0, np.abs(m_x[idx]) / phi_m_ux[idx])
+                u_y = np.where(m_y[idx] == 0, 0, np.abs(m_y[idx]) / phi_m_uy[idx])
+                a = alpha_n[idx]
+                u = (u_x**a + u_y**a) ** (1 / a)
+
+            return u_x, u_y, u
+
+        util_x, util_y, util = utilisation(idx=slice(None))
+
+        # axial force outside the factored squash and tensile loads
+        n_curve, _ = self.get_capacity_curve(theta=0.0, n_points=n_points, phi_0=phi_0)
+        outside = (n_design > n_curve[-1]) | (n_design < n_curve[0])
+        util[outside] = inf
+
+        # exact capacities near the capacity boundary
+        refined = np.isfinite(util) & (np.abs(util - 1) <= refine_band)
+
+        for idx in np.flatnonzero(refined):
+            if m_x[idx] != 0:
+                f_ult_res, _, _ = self.ultimate_bending_capacity(
+                    theta=0.0 if m_x[idx] > 0 else np.pi,
+                    n_design=n_design[idx],
+                    phi_0=phi_0,
+                )
+                phi_m_ux[idx] = abs(f_ult_res.m_x)
+
+            if m_y[idx] != 0:
+                f_ult_res, _, _ = self.ultimate_bending_capacity(
+                    theta=-np.pi / 2 if m_y[idx] > 0 else np.pi / 2,
+                    n_design=n_design[idx],
+                    phi_0=phi_0,
+                )
+                phi_m_uy[idx] = abs(f_ult_res.m_y)
+
+        if refined.any():
+            util_x[refined], util_y[refined], util[refined] = utilisation(idx=refined)
+
+        return res.LoadCaseResults(
+            default_units=self.concrete_section.default_units,
+            case=np.arange(len(cases)),
+            n=n_design,
+            m_x=m_x,
+            m_y=m_y,
+            phi_m_ux=phi_m_ux,
+            phi_m_uy=phi_m_uy,
+            alpha_n=alpha_n,
+            util_x=util_x,
+            util_y=util_y,
+            utilisation=util,
+            refined=refined,
+        )
+
+    def get_capacity_curve(
+        self,
+        theta: float,
+        moment: str = "m_x",
+        n_points: int = 24,
+        phi_0: float = 0.6,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        r"""Returns the factored moment capacity as a function of the axial force.
+
+        The curve is generated from the factored moment interaction diagram. Curves
+        are cached on the design code object.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+            moment: Which moment to return as the capacity (absolute value),
+                ``"m_x"``, ``"m_y"`` or ``"m_xy"``. Defaults to ``"m_x"``.
+            n_points: Number of points used to generate the moment interaction diagram.
+                Defaults to ``24``.
+            phi_0: Compression dominant capacity reduction factor, see Table 2.2.2(d).
+                Defaults to ``0.6``.
+
+        Returns:
+            Factored axial forces (increasing) and factored moment capacities
+        """
+        key = (theta, moment, n_points, phi_0)
+
+        if key not in self._capacity_curves:
+            f_mi_res, _, _ = self.moment_interaction_diagram(
+                theta=theta, n_points=n_points, phi_0=phi_0, progress_bar=False
+            )
+            n_curve = f_mi_res.get_column(name="n")
+            m_curve = np.abs(f_mi_res.get_column(name=moment))
+            order = np.argsort(n_curve, kind="stable")
+            self._capacity_curves[key] = n_curve[order], m_curve[order]
+
+        return self._capacity_curves[key]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -15,9 +14,11 @@ import concreteproperties.utils as utils
 from concreteproperties.design_codes.design_code import DesignCode
 from concreteproperties.material import Concrete, SteelBar
 from concreteproperties.post import si_n_mm
+from concreteproperties.pre import CPPointBar
 
 if TYPE_CHECKING:
     from concreteproperties.concrete_section import ConcreteSection
+    from concreteproperties.material import Material
 
 
 class NZS3101(DesignCode):
@@ -96,11 +97,14 @@ class NZS3101(DesignCode):
             ValueError: If section type for the analysis of the concrete section is not
                 valid
         """
-        # assign concrete sections relevant to each analysis type
+        # assign concrete section, the sections relevant to the other analysis types
+        # are created on first use
         self.concrete_section = concrete_section
-        self.os_concrete_section = self.create_os_section()
-        self.prob_concrete_section = self.create_prob_section()
-        self.prob_os_concrete_section = self.create_prob_section(os_design=True)
+        self._section_variants: dict[str, ConcreteSection] = {}
+
+        # unfactored neutral axis sweeps, shared by analysis types using the same
+        # section
+        self._sweeps: dict[tuple[str, float, int], np.ndarray] = {}
 
         # assign section type
         self.section_type = section_type
@@ -128,6 +132,42 @@ class NZS3101(DesignCode):
             msg += f"{self.analysis_code} code analysis"
             raise ValueError(msg)
 
+    @property
+    def os_concrete_section(self) -> ConcreteSection:
+        """Overstrength concrete section, created on first access.
+
+        Returns:
+            Concrete section with overstrength material properties
+        """
+        if "os" not in self._section_variants:
+            self._section_variants["os"] = self.create_os_section()
+
+        return self._section_variants["os"]
+
+    @property
+    def prob_concrete_section(self) -> ConcreteSection:
+        """Probable strength concrete section, created on first access.
+
+        Returns:
+            Concrete section with probable strength material properties
+        """
+        if "prob" not in self._section_variants:
+            self._section_variants["prob"] = self.create_prob_section()
+
+        return self._section_variants["prob"]
+
+    @property
+    def prob_os_concrete_section(self) -> ConcreteSection:
+        """Probable overstrength concrete section, created on first access.
+
+        Returns:
+            Concrete section with probable overstrength material properties
+        """
+        if "prob_os" not in self._section_variants:
+            self._section_variants["prob_os"] = self.create_prob_section(os_design=True)
+
+        return self._section_variants["prob_os"]
+
     def assign_analysis_section(
         self,
         analysis_type: str = "nom_chk",
@@ -463,6 +503,11 @@ class NZS3101(DesignCode):
                 compressive_strength += add_compressive_strength
 
             if self.section_type.lower() in ["column"]:
+                # deduct the area of any point bars
+                concrete_area = self.concrete_section.calculate_net_concrete_area(
+                    conc_geom=conc_geom
+                )
+
                 # calculate cumulative net concrete force
                 force += (
                     self.alpha_1(compressive_strength)
@@ -472,6 +517,10 @@ class NZS3101(DesignCode):
             elif self.section_type.lower() in ["wall", "wall_sr_s", "wall_sr_m"]:
                 # calculate gross concrete area (area of concrete & reinforcement)
                 for steel_geom in self.concrete_section.reinf_geometries_lumped:
+                    # point bars do not create holes in the concrete geometry
+                    if isinstance(steel_geom, CPPointBar):
+                        continue
+
                     for bar_hole in conc_geom.geom.interiors:
                         if steel_geom.geom.exterior.equals(bar_hole):
                             concrete_area += steel_geom.calculate_area()
@@ -1440,67 +1489,63 @@ class NZS3101(DesignCode):
             likely maximum material strengths to enable an overstrength based analysis
             to be undertaken
         """
-        # create copy of concrete section to modify materials to overstrength properties
-        os_concrete_section = deepcopy(self.concrete_section)
+        # check all materials are SteelBarNZ, else following code will fail
+        for steel_geom in self.concrete_section.reinf_geometries_lumped:
+            if not isinstance(steel_geom.material, self.SteelBarNZ):
+                msg = "Material must be a SteelBarNZ"
+                raise ValueError(msg)
 
-        # loop through all concrete geometries and update to overstrength properties
-        for conc_geom in os_concrete_section.concrete_geometries:
+        def os_concrete(
+            material: Concrete,
+        ) -> Concrete:
             # retrieve previous nominal/characteristic material properties
             prev_compressive_strength = (
-                conc_geom.material.ultimate_stress_strain_profile.__getattribute__(
+                material.ultimate_stress_strain_profile.__getattribute__(
                     "compressive_strength"
                 )
             )
             prev_ultimate_strain = (
-                conc_geom.material.ultimate_stress_strain_profile.__getattribute__(
+                material.ultimate_stress_strain_profile.__getattribute__(
                     "ultimate_strain"
                 )
             )
-            prev_density = conc_geom.material.density
-            prev_colour_conc = conc_geom.material.colour
 
-            # update concrete material to new material with overstrength properties
-            conc_geom.material = self.create_concrete_material(
+            # new concrete material with overstrength properties
+            return self.create_concrete_material(
                 compressive_strength=prev_compressive_strength
                 + add_compressive_strength,
                 ultimate_strain=prev_ultimate_strain,
-                density=prev_density * 1e9,
-                colour=prev_colour_conc,
+                density=material.density * 1e9,
+                colour=material.colour,
             )
 
-        # loop through all steel geometries and update to overstrength properties
-        for steel_geom in os_concrete_section.reinf_geometries_lumped:
-            # check all materials are SteelBarNZ, else following code will fail
-            if not isinstance(steel_geom.material, self.SteelBarNZ):
-                msg = "Material must be a SteelBarNZ"
-                raise ValueError(msg)
-
+        def os_steel(
+            material: Material,
+        ) -> Material:
             # retrieve previous nominal/characteristic material properties
-            prev_steel_grade = steel_geom.material.steel_grade
-            prev_yield_strength = (
-                steel_geom.material.stress_strain_profile.__getattribute__(
-                    "yield_strength"
-                )
+            prev_steel_grade = material.steel_grade  # pyright: ignore [reportAttributeAccessIssue]
+            prev_yield_strength = material.stress_strain_profile.__getattribute__(
+                "yield_strength"
             )
-            prev_fracture_strain = (
-                steel_geom.material.stress_strain_profile.__getattribute__(
-                    "fracture_strain"
-                )
+            prev_fracture_strain = material.stress_strain_profile.__getattribute__(
+                "fracture_strain"
             )
-            prev_phi_os = steel_geom.material.phi_os
-            prev_colour_steel = steel_geom.material.colour
+            prev_phi_os = material.phi_os  # pyright: ignore [reportAttributeAccessIssue]
 
-            # update steel reinforcement material to new material with overstrength
-            # properties
-            steel_geom.material = self.create_steel_material(
+            # new steel reinforcement material with overstrength properties
+            return self.create_steel_material(
                 steel_grade=prev_steel_grade,
                 yield_strength=prev_yield_strength * prev_phi_os,
                 fracture_strain=prev_fracture_strain,
                 phi_os=prev_phi_os,
-                colour=prev_colour_steel,
+                colour=material.colour,
             )
 
-        return os_concrete_section
+        # create a view of the concrete section with overstrength materials, geometry
+        # is shared with the nominal section
+        return self.concrete_section.create_material_variant(
+            concrete_material=os_concrete, lumped_material=os_steel
+        )
 
     def create_prob_section(
         self,
@@ -1531,68 +1576,61 @@ class NZS3101(DesignCode):
             enable a probable strength or probable overstrength based analysis
             to be undertaken
         """
-        # create copy of concrete section to modify materials to probable strength
-        # properties
-        prob_concrete_section = deepcopy(self.concrete_section)
+        # check all materials are SteelBarNZ, else following code will fail
+        for steel_geom in self.concrete_section.reinf_geometries_lumped:
+            if not isinstance(steel_geom.material, self.SteelBarNZ):
+                msg = "Material must be a SteelBarNZ"
+                raise ValueError(msg)
 
-        # loop through all concrete geometries & update to probable strength properties
-        for conc_geom in prob_concrete_section.concrete_geometries:
+        def prob_concrete(
+            material: Concrete,
+        ) -> Concrete:
             # retrieve previous nominal/characteristic material properties
             prev_compressive_strength = (
-                conc_geom.material.ultimate_stress_strain_profile.__getattribute__(
+                material.ultimate_stress_strain_profile.__getattribute__(
                     "compressive_strength"
                 )
             )
             prev_ultimate_strain = (
-                conc_geom.material.ultimate_stress_strain_profile.__getattribute__(
+                material.ultimate_stress_strain_profile.__getattribute__(
                     "ultimate_strain"
                 )
             )
-            prev_density = conc_geom.material.density
-            prev_colour_conc = conc_geom.material.colour
 
-            # update concrete material to new material with probable strength properties
+            # new concrete material with probable strength properties
             prob_compressive_strength = self.prob_compressive_strength(
                 prev_compressive_strength
             )
-            conc_geom.material = self.create_concrete_material(
+            prob_material = self.create_concrete_material(
                 compressive_strength=prob_compressive_strength,
                 ultimate_strain=prev_ultimate_strain,
-                density=prev_density * 1e9,
-                colour=prev_colour_conc,
+                density=material.density * 1e9,
+                colour=material.colour,
             )
 
             # update concrete tensile strength to probable strength based value
-            conc_geom.material.flexural_tensile_strength = (
-                self.concrete_tensile_strength(
-                    prev_compressive_strength,
-                    prob_design=True,
-                )
+            prob_material.flexural_tensile_strength = self.concrete_tensile_strength(
+                prev_compressive_strength,
+                prob_design=True,
             )
+
+            return prob_material
+
         # populate list with predefined probable strength based steel grades
         _, _, prob_properties = self.predefined_steel_materials()
 
-        # loop through all steel geometries and update to probable strength properties
-        for steel_geom in prob_concrete_section.reinf_geometries_lumped:
-            # check all materials are SteelBarNZ, else following code will fail
-            if not isinstance(steel_geom.material, self.SteelBarNZ):
-                msg = "Material must be a SteelBarNZ"
-                raise ValueError(msg)
-
+        def prob_steel(
+            material: Material,
+        ) -> Material:
             # retrieve previous nominal/characteristic material properties
-            prev_steel_grade = steel_geom.material.steel_grade
-            prev_yield_strength = (
-                steel_geom.material.stress_strain_profile.__getattribute__(
-                    "yield_strength"
-                )
+            prev_steel_grade = material.steel_grade  # pyright: ignore [reportAttributeAccessIssue]
+            prev_yield_strength = material.stress_strain_profile.__getattribute__(
+                "yield_strength"
             )
-            prev_fracture_strain = (
-                steel_geom.material.stress_strain_profile.__getattribute__(
-                    "fracture_strain"
-                )
+            prev_fracture_strain = material.stress_strain_profile.__getattribute__(
+                "fracture_strain"
             )
-            prev_phi_os = steel_geom.material.phi_os
-            prev_colour_steel = steel_geom.material.colour
+            prev_phi_os = material.phi_os  # pyright: ignore [reportAttributeAccessIssue]
 
             # determine appropriate scaling factor for yield strength depending on
             # defined material and analysis type
@@ -1605,17 +1643,20 @@ class NZS3101(DesignCode):
             else:
                 mult_prob_strength = 1.0
 
-            # update steel reinforcement material to new material with probable strength
-            # properties
-            steel_geom.material = self.create_steel_material(
+            # new steel reinforcement material with probable strength properties
+            return self.create_steel_material(
                 steel_grade=prev_steel_grade,
                 yield_strength=prev_yield_strength * mult_prob_strength,
                 fracture_strain=prev_fracture_strain,
                 phi_os=prev_phi_os,
-                colour=prev_colour_steel,
+                colour=material.colour,
             )
 
-        return prob_concrete_section
+        # create a view of the concrete section with probable strength materials,
+        # geometry is shared with the nominal section
+        return self.concrete_section.create_material_variant(
+            concrete_material=prob_concrete, lumped_material=prob_steel
+        )
 
     def ultimate_bending_capacity(  # pyright: ignore [reportIncompatibleMethodOverride]
         self,
@@ -1675,11 +1716,7 @@ class NZS3101(DesignCode):
         )
 
         # factor ultimate results
-        f_ult_res = deepcopy(ult_res)
-        f_ult_res.n *= phi
-        f_ult_res.m_x *= phi
-        f_ult_res.m_y *= phi
-        f_ult_res.m_xy *= phi
+        f_ult_res = ult_res.scale(factor=phi)
 
         return f_ult_res, ult_res, phi
 
@@ -1785,19 +1822,9 @@ class NZS3101(DesignCode):
             progress_bar=progress_bar,
         )
 
-        # make a copy of the results to factor
-        f_mi_res = deepcopy(mi_res)
-
-        # list to store phis
-        phis = []
-
-        # factor results
-        for ult_res in f_mi_res.results:
-            ult_res.n *= phi
-            ult_res.m_x *= phi
-            ult_res.m_y *= phi
-            ult_res.m_xy *= phi
-            phis.append(phi)
+        # factor results, the capacity reduction factor is constant
+        phis = [phi] * len(mi_res.results)
+        f_mi_res = mi_res.scale(factors=phi)
 
         return f_mi_res, mi_res, phis
 
@@ -1901,3 +1928,239 @@ class NZS3101(DesignCode):
         phis.append(phis[0])
 
         return f_bb_res, phis
+
+    def get_unfactored_sweep(
+        self,
+        analysis_type: str = "nom_chk",
+        theta: float = 0,
+        n_points: int = 24,
+    ) -> np.ndarray:
+        r"""Returns an unfactored neutral axis sweep for an analysis type.
+
+        The sweep is the unfactored moment interaction diagram of the section
+        analysed for ``analysis_type``, ranging from zero curvature to pure tension.
+        Analysis types that use the same section (e.g. ``"nom_chk"`` and
+        ``"cpe_chk"``) share a sweep, sweeps are cached on the design code object.
+
+        Args:
+            analysis_type: The type of cross section analysis to undertake on the
+                defined concrete section, refer to
+                :meth:`NZS3101.capacity_reduction_factor` for further information on
+                analysis types.
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+            n_points: Number of equally spaced neutral axes in the sweep
+
+        Returns:
+            Array of unfactored actions, one row per point (``n``, ``m_x``, ``m_y``),
+            sorted by increasing axial force
+        """
+        # analysis types that share a section
+        section_keys = {
+            "nom_chk": "nom",
+            "cpe_chk": "nom",
+            "os_chk": "os",
+            "prob_chk": "prob",
+            "prob_os_chk": "prob_os",
+        }
+        analysis_section = self.assign_analysis_section(analysis_type)
+        key = (section_keys[analysis_type.lower()], theta, n_points)
+
+        if key not in self._sweeps:
+            mi_res = analysis_section.moment_interaction_diagram(
+                theta=theta,
+                limits=[("kappa0", 0.0), ("d_n", 1e-6)],
+                control_points=[("fy", 1.0), ("fy", 0.5), ("fy", 0.0), ("N", 0.0)],
+                n_points=n_points,
+                progress_bar=False,
+            )
+            sweep = np.column_stack(
+                [mi_res.get_column(name=name) for name in ("n", "m_x", "m_y")]
+            )
+            self._sweeps[key] = sweep[np.argsort(sweep[:, 0], kind="stable")]
+
+        return self._sweeps[key]
+
+    def check_load_cases(
+        self,
+        load_cases: np.ndarray | list[tuple[float, float, float]],
+        analysis_types: list[str] | None = None,
+        pphr_class: str = "NDPR",
+        n_points: int = 24,
+        refine_band: float = 0.1,
+    ) -> res.LoadCaseResults:
+        r"""Checks many load cases for several analysis types in one pass.
+
+        For each analysis type, factored bending capacities about each axis are
+        linearly interpolated at the design axial force of each load case from the
+        unfactored neutral axis sweeps (see :meth:`get_unfactored_sweep`). Analysis
+        types that analyse the same section share a sweep and only differ by the
+        strength reduction factor. Load cases with a utilisation within
+        ``refine_band`` of unity have their capacities calculated exactly using
+        :meth:`ultimate_bending_capacity`.
+
+        Biaxial bending is checked conservatively with a linear interaction, i.e. the
+        combined utilisation is :math:`u_x + u_y`, where
+        :math:`u_x = M^*_x / \phi M_{nx}` and :math:`u_y = M^*_y / \phi M_{ny}`. The
+        factored capacities :math:`\phi M_{nx}` and :math:`\phi M_{ny}` are stored as
+        ``phi_m_ux`` and ``phi_m_uy`` in the results. Load cases with an axial force
+        outside the axial load limits of the section (see :meth:`check_axial_limits`)
+        have an infinite utilisation.
+
+        Args:
+            load_cases: Array of load cases, one row per load case, each row
+                containing the design axial force and bending moments
+                (:math:`N^*`, :math:`M^*_x`, :math:`M^*_y`)
+            analysis_types: List of analysis types to check, refer to
+                :meth:`NZS3101.capacity_reduction_factor` for further information on
+                analysis types. Defaults to ``["nom_chk"]``.
+            pphr_class: Potential Plastic Hinge Region (PPHR) classification,
+                ``"NDPR"``/``"LDPR"``/``"DPR"``
+            n_points: Number of equally spaced neutral axes in each sweep
+            refine_band: Load cases with a utilisation between ``1 - refine_band``
+                and ``1 + refine_band`` are calculated exactly
+
+        Raises:
+            ValueError: If ``load_cases`` does not have three columns
+
+        Returns:
+            Load case results object, with one row per analysis type and load case
+        """
+        if analysis_types is None:
+            analysis_types = ["nom_chk"]
+
+        cases = np.atleast_2d(np.asarray(load_cases, dtype=float))
+
+        if cases.ndim != 2 or cases.shape[1] != 3:
+            msg = "load_cases must be an array with three columns (N*, Mx*, My*)."
+            raise ValueError(msg)
+
+        # Check NZS3101:2006 CL 5.2.1 concrete compressive strength limits
+        # (dependant on PPHR class)
+        self.check_f_c_limits(pphr_class)
+
+        # Check NZS3101:2006 CL 5.3.3 steel reinforcement yield strength limit
+        self.check_f_y_limit()
+
+        n_design, m_x, m_y = cases.T
+        n_cases = len(cases)
+        table = np.zeros(
+            n_cases * len(analysis_types),
+            dtype=[
+                ("case", int),
+                ("analysis_type", "U11"),
+                ("n", float),
+                ("m_x", float),
+                ("m_y", float),
+                ("phi", float),
+                ("phi_m_ux", float),
+                ("phi_m_uy", float),
+                ("util_x", float),
+                ("util_y", float),
+                ("utilisation", float),
+                ("refined", bool),
+            ],
+        )
+
+        for idx, analysis_type in enumerate(analysis_types):
+            rows = table[idx * n_cases : (idx + 1) * n_cases]
+            rows["case"] = np.arange(n_cases)
+            rows["analysis_type"] = analysis_type
+            rows["n"] = n_design
+            rows["m_x"] = m_x
+            rows["m_y"] = m_y
+
+            phi, cpe_design, os_design, prob_design = self.capacity_reduction_factor(
+                analysis_type
+            )
+            rows["phi"] = phi
+
+            # interpolate factored capacities, positive and negative moments
+            for theta, col, moment, sign in [
+                (0.0, 1, m_x, 1),
+                (np.pi, 1, m_x, -1),
+                (-np.pi / 2, 2, m_y, 1),
+                (np.pi / 2, 2, m_y, -1),
+            ]:
+                mask = sign * moment > 0
+
+                if mask.any():
+                    sweep = self.get_unfactored_sweep(
+                        analysis_type=analysis_type, theta=theta, n_points=n_points
+                    )
+                    capacity = "phi_m_ux" if col == 1 else "phi_m_uy"
+                    rows[capacity][mask] = phi * np.interp(
+                        n_design[mask] / phi,
+                        sweep[:, 0],
+                        np.abs(sweep[:, col]),
+                        left=0,
+                        right=0,
+                    )
+
+            self._calculate_utilisation(rows=rows)
+
+            # axial force outside the axial load limits of the section
+            max_ten = -self.max_ten_strength(os_design, prob_design)
+            max_comp = self.max_comp_strength(cpe_design, os_design, prob_design)
+            outside = (n_design < phi * max_ten) | (n_design > phi * max_comp)
+            rows["utilisation"][outside] = np.inf
+
+            # exact capacities near the capacity boundary
+            rows["refined"] = np.isfinite(rows["utilisation"]) & (
+                np.abs(rows["utilisation"] - 1) <= refine_band
+            )
+
+            for row in rows[rows["refined"]]:
+                case = row["case"]
+
+                if m_x[case] != 0:
+                    f_ult_res, _, _ = self.ultimate_bending_capacity(
+                        pphr_class=pphr_class,
+                        analysis_type=analysis_type,
+                        theta=0.0 if m_x[case] > 0 else np.pi,
+                        n_design=n_design[case],
+                    )
+                    rows["phi_m_ux"][case] = abs(f_ult_res.m_x)
+
+                if m_y[case] != 0:
+                    f_ult_res, _, _ = self.ultimate_bending_capacity(
+                        pphr_class=pphr_class,
+                        analysis_type=analysis_type,
+                        theta=-np.pi / 2 if m_y[case] > 0 else np.pi / 2,
+                        n_design=n_design[case],
+                    )
+                    rows["phi_m_uy"][case] = abs(f_ult_res.m_y)
+
+            refined = rows["refined"]
+
+            if refined.any():
+                rows[refined] = self._calculate_utilisation(rows=rows[refined])
+
+        return res.LoadCaseResults(
+            default_units=self.concrete_section.default_units,
+            **{name: table[name] for name in table.dtype.names},  # pyright: ignore
+        )
+
+    def _calculate_utilisation(
+        self,
+        rows: np.ndarray,
+    ) -> np.ndarray:
+        """Calculates the utilisations of load case table rows in place.
+
+        Args:
+            rows: Rows of a load case table, see :meth:`check_load_cases`
+
+        Returns:
+            Rows with updated utilisations
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rows["util_x"] = np.where(
+                rows["m_x"] == 0, 0, np.abs(rows["m_x"]) / rows["phi_m_ux"]
+            )
+            rows["util_y"] = np.where(
+                rows["m_y"] == 0, 0, np.abs(rows["m_y"]) / rows["phi_m_uy"]
+            )
+
+        rows["utilisation"] = rows["util_x"] + rows["util_y"]
+
+        return rows
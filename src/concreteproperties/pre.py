@@ -5,20 +5,27 @@ Also contains helper methods for adding bars to a geometry objects.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
-from more_itertools import peekable
-from sectionproperties.pre.geometry import Geometry
+from sectionproperties.pre.geometry import CompoundGeometry, Geometry
 from sectionproperties.pre.library.primitive_sections import circular_section_by_area
-from shapely import LineString, Polygon
+from shapely import (
+    LineString,
+    MultiPolygon,
+    Polygon,
+    STRtree,
+    intersects_xy,
+    unary_union,
+)
+from shapely.geometry.polygon import orient
 from shapely.ops import split
 
 from concreteproperties.material import Concrete
 
 if TYPE_CHECKING:
     import matplotlib.axes
-    from sectionproperties.pre.geometry import CompoundGeometry
     from shapely.geometry.base import GeometrySequence
 
     from concreteproperties.material import Material, SteelBar, SteelStrand
@@ -35,15 +42,21 @@ class CPGeom:
         self,
         geom: Polygon,
         material: Material,
+        tol: int | None = 6,
     ) -> None:
         """Inits the CPGeom class.
 
         Args:
             geom: Shapely polygon defining the geometry
             material: Material to apply to the geometry
+            tol: Number of decimal places to round the polygon coordinates to, if
+                ``None`` the coordinates are used as provided. Defaults to ``6``.
         """
         # round polygon points and save geometry
-        self.geom = self.round_geometry(geometry=geom, tol=6)
+        if tol is None:
+            self.geom = geom
+        else:
+            self.geom = self.round_geometry(geometry=geom, tol=tol)
 
         # store material
         self.material = material
@@ -51,6 +64,9 @@ class CPGeom:
         # create points and facets
         self.points, self.facets = self.create_points_and_facets(geometry=self.geom)
 
+        # create oriented ring coordinates for closed-form moment calculations
+        self.rings = self.create_rings(geometry=self.geom)
+
         # create holes
         self.holes: list[tuple[float, float]] = []
 
@@ -96,39 +112,50 @@ class CPGeom:
         Returns:
             Points and facets
         """
-        master_count = 0
         points: list[tuple[float, float]] = []
         facets: list[tuple[int, int]] = []
 
-        # perimeter, note in shapely last point == first point
-        if geometry.exterior:
-            for coords in list(geometry.exterior.coords[:-1]):
-                x, y = list(coords)
-                points.append((x, y))
-                master_count += 1
+        if geometry.is_empty:
+            return points, facets
 
-        facets += self.create_facets(points)
-        exterior_count = master_count
+        # perimeter then holes, note in shapely last point == first point
+        rings = [np.asarray(geometry.exterior.coords)[:-1]]
+        rings += [np.asarray(hole.coords)[:-1] for hole in geometry.interiors]
 
-        # holes
-        for idx, hole in enumerate(geometry.interiors):
-            break_count = master_count
-            int_points = []
+        for ring in rings:
+            facets += self.create_facets(ring, offset=len(points))
+            points += list(map(tuple, ring.tolist()))
 
-            for coords in hole.coords[:-1]:
-                int_points.append(coords)
-                master_count += 1
+        return points, facets
 
-            # (idx > 0), (idx < 1) are like a 'step functions'
-            offset = break_count * (idx > 0) + exterior_count * (idx < 1)
-            facets += self.create_facets(int_points, offset=offset)
-            points += int_points
+    def create_rings(
+        self,
+        geometry: Polygon,
+    ) -> list[np.ndarray]:
+        """Creates a list of ring coordinate arrays from a shapely polygon.
 
-        return points, facets
+        The exterior ring is oriented counter-clockwise and the interior rings are
+        oriented clockwise, such that summing signed ring moments gives the moments of
+        the polygon. The closing point of each ring is not repeated.
+
+        Args:
+            geometry: Shapely polygon from which to create rings
+
+        Returns:
+            List of ring coordinates, each [n x 2]
+        """
+        if geometry.is_empty:
+            return []
+
+        oriented = orient(geometry, sign=1.0)
+        rings = [np.array(oriented.exterior.coords)[:-1]]
+        rings += [np.array(intr.coords)[:-1] for intr in oriented.interiors]
+
+        return rings
 
     def create_facets(
         self,
-        points_list: list[tuple[float, float]],
+        points_list: list[tuple[float, float]] | np.ndarray,
         offset: int = 0,
     ) -> list[tuple[int, int]]:
         """Generates a list of facets given a list of points and a facet offset.
@@ -140,8 +167,9 @@ class CPGeom:
         Returns:
             List of facets
         """
-        idx_peeker = peekable([idx + offset for idx, _ in enumerate(points_list)])
-        return [(item, idx_peeker.peek(offset)) for item in idx_peeker]
+        # each point connects to the next, the last point closes back to the first
+        idx = np.arange(len(points_list)) + offset
+        return list(zip(idx.tolist(), np.roll(idx, -1).tolist(), strict=True))
 
     def calculate_area(self) -> float:
         """Calculates the area of the geometry.
@@ -159,6 +187,37 @@ class CPGeom:
         """
         return self.geom.centroid.x, self.geom.centroid.y
 
+    def get_displaced_elastic_modulus(self) -> float:
+        """Returns the elastic modulus of the concrete displaced by the geometry.
+
+        Polygon geometries are subtracted from the concrete geometries, i.e. they do
+        not displace any concrete.
+
+        Returns:
+            Elastic modulus of the displaced concrete
+        """
+        return 0
+
+    def get_displaced_stress(
+        self,
+        strain: float,
+        ultimate: bool = False,
+    ) -> float:
+        """Returns the stress in the concrete displaced by the geometry.
+
+        Polygon geometries are subtracted from the concrete geometries, i.e. they do
+        not displace any concrete.
+
+        Args:
+            strain: Strain at the centroid of the geometry
+            ultimate: If set to True, the ultimate stress-strain profile of the
+                displaced concrete is used. Defaults to ``False``.
+
+        Returns:
+            Stress in the displaced concrete
+        """
+        return 0
+
     def calculate_extents(self) -> tuple[float, float, float, float]:
         """Calculates the extents of the geometry.
 
@@ -308,12 +367,12 @@ class CPGeom:
                 else:
                     top_polys.append(poly)
 
-            # vertical line
+            # vertical line, "above" is the left side for an upwards vector
             else:
-                # if we are to the right of the line
-                if px < point[0]:
+                # if we are below the line
+                if (px - point[0]) * vector[1] > 0:
                     bot_polys.append(poly)
-                # if we are to the left of the line
+                # if we are above the line
                 else:
                     top_polys.append(poly)
 
@@ -352,22 +411,238 @@ class CPGeomConcrete(CPGeom):
         self,
         geom: Polygon,
         material: Concrete,
+        tol: int | None = 6,
     ) -> None:
         """Inits the CPGeomConcrete class.
 
         Args:
             geom: Shapely polygon defining the geometry
             material: Material to apply to the geometry
+            tol: Number of decimal places to round the polygon coordinates to, if
+                ``None`` the coordinates are used as provided. Defaults to ``6``.
         """
         super().__init__(
             geom=geom,
             material=material,
+            tol=tol,
         )
 
         # ensure material is a Concrete object
         self.material = material
 
 
+class CPPointBar:
+    """A ``concreteproperties`` point bar object.
+
+    A lumped reinforcing bar described only by its position, area and material. Point
+    bars provide the subset of the :class:`CPGeom` interface used for lumped geometries
+    in analyses, without creating any polygon geometry. A circular polygon is created
+    on request for plotting purposes only.
+
+    As no hole is cut in the concrete geometry, a bar placed within a concrete geometry
+    stores the displaced concrete material. Analyses deduct the displaced concrete at
+    the bar, i.e. the force in the bar is net of the force in the displaced concrete.
+    """
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        area: float,
+        material: SteelBar | SteelStrand,
+        displaced_material: Concrete | None = None,
+    ) -> None:
+        """Inits the CPPointBar class.
+
+        Args:
+            x: x-position of the bar
+            y: y-position of the bar
+            area: Bar cross-sectional area
+            material: Material to apply to the bar
+            displaced_material: Material of the concrete displaced by the bar, ``None``
+                if the bar does not lie within a concrete geometry. Defaults to
+                ``None``.
+
+        Raises:
+            ValueError: If the material is meshed
+        """
+        if material.meshed:
+            msg = "Point bars must be assigned a lumped (meshed=False) material."
+            raise ValueError(msg)
+
+        self.x = x
+        self.y = y
+        self.area = area
+        self.material = material
+        self.displaced_material = displaced_material
+        self.points = [(x, y)]
+        self._geom: Polygon | None = None
+
+    @property
+    def geom(self) -> Polygon:
+        """Circular polygon representing the bar, created on first access.
+
+        Returns:
+            Shapely polygon of the bar
+        """
+        if self._geom is None:
+            circle = circular_section_by_area(area=self.area, n=16)
+            self._geom = Polygon(
+                np.array(circle.geom.exterior.coords) + np.array([self.x, self.y])
+            )
+
+        return self._geom
+
+    def calculate_area(self) -> float:
+        """Calculates the area of the bar.
+
+        Returns:
+            Bar area
+        """
+        return self.area
+
+    def calculate_centroid(self) -> tuple[float, float]:
+        """Calculates the centroid of the bar.
+
+        Returns:
+            Bar centroid
+        """
+        return self.x, self.y
+
+    def get_displaced_elastic_modulus(self) -> float:
+        """Returns the elastic modulus of the concrete displaced by the bar.
+
+        Returns:
+            Elastic modulus of the displaced concrete, zero if no concrete is displaced
+        """
+        if self.displaced_material is None:
+            return 0
+
+        return self.displaced_material.elastic_modulus
+
+    def get_displaced_stress(
+        self,
+        strain: float,
+        ultimate: bool = False,
+    ) -> float:
+        """Returns the stress in the concrete displaced by the bar.
+
+        Args:
+            strain: Strain at the centroid of the bar
+            ultimate: If set to True, the ultimate stress-strain profile of the
+                displaced concrete is used. Defaults to ``False``.
+
+        Returns:
+            Stress in the displaced concrete, zero if no concrete is displaced
+        """
+        if self.displaced_material is None:
+            return 0
+
+        if ultimate:
+            profile = self.displaced_material.ultimate_stress_strain_profile
+        else:
+            profile = self.displaced_material.stress_strain_profile
+
+        return profile.get_stress(strain=strain)
+
+    def calculate_extents(self) -> tuple[float, float, float, float]:
+        """Calculates the extents of the bar.
+
+        Returns:
+            Extents (``x_min``, ``x_max``, ``y_min``, ``y_max``)
+        """
+        r = np.sqrt(self.area / np.pi)
+
+        return self.x - r, self.x + r, self.y - r, self.y + r
+
+    def to_sp_geom(self) -> Geometry:
+        """Converts self to a *sectionproperties* geometry object.
+
+        Returns:
+            ``sectionproperties`` geometry object
+        """
+        return Geometry(geom=self.geom, material=self.material)  # pyright: ignore [reportArgumentType]
+
+
+@dataclass
+class PointBars:
+    """Class for a collection of point bars stored as arrays.
+
+    Args:
+        x: x-positions of the bars
+        y: y-positions of the bars
+        area: Bar cross-sectional areas
+        materials: Bar materials
+        geometries: Point bar objects, one per bar
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    area: np.ndarray
+    materials: list[SteelBar | SteelStrand]
+    geometries: list[CPPointBar]
+
+    @classmethod
+    def from_records(
+        cls,
+        bars: list[LumpedBar],
+        concrete_geometries: list[CPGeomConcrete] | None = None,
+    ) -> PointBars:
+        """Creates a point bar collection from a list of lumped bar records.
+
+        Args:
+            bars: List of lumped bar records
+            concrete_geometries: Concrete geometries in which the bars are placed, the
+                material of the (first) concrete geometry containing a bar is the
+                material displaced by the bar. Defaults to ``None``.
+
+        Returns:
+            Point bar collection
+        """
+        x = np.array([bar.x for bar in bars], dtype=float)
+        y = np.array([bar.y for bar in bars], dtype=float)
+        area = np.array([bar.area for bar in bars], dtype=float)
+        materials = [bar.material for bar in bars]
+
+        # find the concrete displaced by each bar
+        displaced: list[Concrete | None] = [None] * len(bars)
+
+        for conc_geom in reversed(concrete_geometries or []):
+            for idx in np.flatnonzero(intersects_xy(conc_geom.geom, x, y)).tolist():
+                displaced[idx] = conc_geom.material
+
+        geometries = [
+            CPPointBar(
+                x=bar_x,
+                y=bar_y,
+                area=bar_area,
+                material=material,
+                displaced_material=displaced_material,
+            )
+            for bar_x, bar_y, bar_area, material, displaced_material in zip(
+                x.tolist(), y.tolist(), area.tolist(), materials, displaced, strict=True
+            )
+        ]
+
+        return cls(x=x, y=y, area=area, materials=materials, geometries=geometries)
+
+    def calculate_area(self) -> float:
+        """Calculates the total area of the bars.
+
+        Returns:
+            Total bar area
+        """
+        return float(self.area.sum())
+
+    def get_elastic_moduli(self) -> np.ndarray:
+        """Returns the elastic modulus of each bar.
+
+        Returns:
+            Elastic moduli
+        """
+        return np.array([material.elastic_modulus for material in self.materials])
+
+
 def add_bar(
     geometry: Geometry | CompoundGeometry,
     area: float,
@@ -431,6 +706,9 @@ def add_bar_rectangular_array(
     Returns:
         Reinforced concrete geometry with added bar
     """
+    x_list: list[float] = []
+    y_list: list[float] = []
+
     for j_idx in range(n_y):
         for i_idx in range(n_x):
             # check to see if we are adding a bar
@@ -443,13 +721,12 @@ def add_bar_rectangular_array(
                 add_bar = True
 
             if add_bar:
-                bar = circular_section_by_area(area=area, n=n, material=material)  # pyright: ignore [reportArgumentType]
-                x = anchor[0] + i_idx * x_s
-                y = anchor[1] + j_idx * y_s
-                bar = bar.shift_section(x_offset=x, y_offset=y)
-                geometry = (geometry - bar) + bar
+                x_list.append(anchor[0] + i_idx * x_s)
+                y_list.append(anchor[1] + j_idx * y_s)
 
-    return geometry
+    return add_bars(
+        geometry=geometry, area=area, material=material, x=x_list, y=y_list, n=n
+    )
 
 
 def add_bar_circular_array(
@@ -481,13 +758,183 @@ def add_bar_circular_array(
         Reinforced concrete geometry with added bar
     """
     d_theta = 2 * np.pi / n_bar
+    thetas = theta_0 + np.arange(n_bar) * d_theta
+
+    return add_bars(
+        geometry=geometry,
+        area=area,
+        material=material,
+        x=ctr[0] + r_array * np.cos(thetas),
+        y=ctr[1] + r_array * np.sin(thetas),
+        n=n,
+    )
+
+
+def add_bars(
+    geometry: Geometry | CompoundGeometry,
+    area: float | list[float] | np.ndarray,
+    material: SteelBar | SteelStrand,
+    x: list[float] | np.ndarray,
+    y: list[float] | np.ndarray,
+    n: int = 4,
+) -> Geometry | CompoundGeometry:
+    """Adds many reinforcing bars to a ``sectionproperties`` geometry at once.
+
+    All bar polygons are created first, their union is subtracted from ``geometry`` in
+    a single operation and the bars are then attached to the resulting geometry. As with
+    :func:`add_bar`, bars overlapping a bar placed later in the list are clipped by that
+    bar. Bars are discretised by four points by default.
+
+    Args:
+        geometry: Reinforced concrete geometry to which the new bars will be added
+        area: Bar cross-sectional area, either a single area for all bars or one area
+            per bar
+        material: Material object for the bars
+        x: x-positions of the bars
+        y: y-positions of the bars
+        n: Number of points to discretise the bar circles. Defaults to ``4``.
+
+    Raises:
+        ValueError: If the lengths of ``x``, ``y`` and ``area`` are not consistent
+
+    Returns:
+        Reinforced concrete geometry with added bars
+    """
+    x_arr, y_arr, areas = validate_bar_arrays(area=area, x=x, y=y)
+
+    if len(x_arr) == 0:
+        return geometry
+
+    # create bar polygons, sharing the discretised circle between equal areas
+    templates: dict[float, np.ndarray] = {}
+    bar_polys: list[Polygon] = []
 
-    for idx in range(n_bar):
-        bar = circular_section_by_area(area=area, n=n, material=material)  # pyright: ignore [reportArgumentType]
-        theta = theta_0 + idx * d_theta
-        x = ctr[0] + r_array * np.cos(theta)
-        y = ctr[1] + r_array * np.sin(theta)
-        bar = bar.shift_section(x_offset=x, y_offset=y)
-        geometry = (geometry - bar) + bar
+    for bar_area, bar_x, bar_y in zip(areas, x_arr, y_arr, strict=True):
+        if bar_area not in templates:
+            circle = circular_section_by_area(area=bar_area, n=n, material=material)  # pyright: ignore [reportArgumentType]
+            templates[bar_area] = np.array(circle.geom.exterior.coords)
+
+        bar_polys.append(Polygon(templates[bar_area] + np.array([bar_x, bar_y])))
+
+    # subtract all bars from the existing geometry in a single operation
+    existing = (
+        list(geometry.geoms) if isinstance(geometry, CompoundGeometry) else [geometry]
+    )
+    bars_union = unary_union(bar_polys)
+    geoms: list[Geometry] = []
+
+    for geom in existing:
+        diff = geom.geom.difference(bars_union)
+        polys = diff.geoms if isinstance(diff, MultiPolygon) else [diff]
+
+        geoms.extend(
+            Geometry(geom=poly, material=geom.material)
+            for poly in polys
+            if isinstance(poly, Polygon) and not poly.is_empty
+        )
+
+    # clip bars by any overlapping bars placed after them
+    clip_bars: dict[int, list[Polygon]] = {}
+    first, second = STRtree(bar_polys).query(bar_polys, predicate="intersects")
+
+    for idx, other in zip(first.tolist(), second.tolist(), strict=True):
+        if idx < other:
+            clip_bars.setdefault(idx, []).append(bar_polys[other])
+
+    # attach bars
+    for idx, poly in enumerate(bar_polys):
+        if idx in clip_bars:
+            diff = poly.difference(unary_union(clip_bars[idx]))
+            polys = diff.geoms if isinstance(diff, MultiPolygon) else [diff]
+        else:
+            polys = [poly]
+
+        geoms.extend(
+            Geometry(geom=bar_poly, material=material)  # pyright: ignore [reportArgumentType]
+            for bar_poly in polys
+            if isinstance(bar_poly, Polygon) and not bar_poly.is_empty
+        )
+
+    return CompoundGeometry(geoms=geoms)
+
+
+def validate_bar_arrays(
+    area: float | list[float] | np.ndarray,
+    x: list[float] | np.ndarray,
+    y: list[float] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Converts bar positions and areas to arrays of equal length.
+
+    Args:
+        area: Bar cross-sectional area, either a single area for all bars or one area
+            per bar
+        x: x-positions of the bars
+        y: y-positions of the bars
+
+    Raises:
+        ValueError: If the lengths of ``x``, ``y`` and ``area`` are not consistent
+
+    Returns:
+        Arrays of x-positions, y-positions and areas
+    """
+    x_arr = np.atleast_1d(np.asarray(x, dtype=float))
+    y_arr = np.atleast_1d(np.asarray(y, dtype=float))
+    areas = np.asarray(area, dtype=float)
+
+    if areas.ndim == 0:
+        areas = np.full(x_arr.shape, areas)
+
+    if x_arr.shape != y_arr.shape or areas.shape != x_arr.shape:
+        msg = "x, y and area must have the same length."
+        raise ValueError(msg)
+
+    return x_arr, y_arr, areas
+
+
+@dataclass
+class LumpedBar:
+    """Class for a lumped reinforcing bar record.
+
+    A lightweight description of a lumped (non-meshed) reinforcing bar that does not
+    create any polygon geometry.
+
+    Args:
+        x: x-position of the bar
+        y: y-position of the bar
+        area: Bar cross-sectional area
+        material: Material object for the bar
+    """
+
+    x: float
+    y: float
+    area: float
+    material: SteelBar | SteelStrand
+
+
+def create_lumped_bars(
+    area: float | list[float] | np.ndarray,
+    material: SteelBar | SteelStrand,
+    x: list[float] | np.ndarray,
+    y: list[float] | np.ndarray,
+) -> list[LumpedBar]:
+    """Creates a list of lumped reinforcing bar records.
+
+    Args:
+        area: Bar cross-sectional area, either a single area for all bars or one area
+            per bar
+        material: Material object for the bars
+        x: x-positions of the bars
+        y: y-positions of the bars
+
+    Raises:
+        ValueError: If the lengths of ``x``, ``y`` and ``area`` are not consistent
+
+    Returns:
+        List of lumped bar records
+    """
+    x_arr, y_arr, areas = validate_bar_arrays(area=area, x=x, y=y)
 
-    return geometry
+    return [
+        LumpedBar(x=float(bar_x), y=float(bar_y), area=float(a), material=material)
+        for bar_x, bar_y, a in zip(x_arr, y_arr, areas, strict=True)
+    ]
@@ -13,12 +13,13 @@ import concreteproperties.utils as utils
 from concreteproperties.analysis_section import AnalysisSection
 from concreteproperties.concrete_section import ConcreteSection
 from concreteproperties.material import SteelStrand
-from concreteproperties.pre import CPGeom, CPGeomConcrete
+from concreteproperties.pre import CPGeom, CPGeomConcrete, CPPointBar
 
 if TYPE_CHECKING:
     import sectionproperties.pre.geometry as sp_geom
 
     from concreteproperties.post import UnitDisplay
+    from concreteproperties.pre import LumpedBar
 
 
 class PrestressedSection(ConcreteSection):
@@ -41,6 +42,8 @@ class PrestressedSection(ConcreteSection):
         moment_centroid: tuple[float, float] | None = None,
         geometric_centroid_override: bool = True,
         default_units: UnitDisplay | None = None,
+        lumped_bars: list[LumpedBar] | None = None,
+        trusted: bool = False,
     ) -> None:
         """Inits the ConcreteSection class.
 
@@ -56,6 +59,13 @@ class PrestressedSection(ConcreteSection):
                 ``True``.
             default_units: Default unit system to use for formatting results. Defaults
                 to ``None``.
+            lumped_bars: List of lumped bar records (see
+                :func:`~concreteproperties.pre.create_lumped_bars`) describing point
+                bars and strands that are added to the section without any polygon
+                geometry. Defaults to ``None``.
+            trusted: If set to True, the geometry is assumed to be valid, i.e. the
+                check for overlapping regions is skipped and the polygon coordinates
+                are not rounded. Defaults to ``False``.
 
         Raises:
             ValueError: If the section is not symmetric about the y-axis
@@ -66,6 +76,8 @@ class PrestressedSection(ConcreteSection):
             moment_centroid=moment_centroid,
             geometric_centroid_override=geometric_centroid_override,
             default_units=default_units,
+            lumped_bars=lumped_bars,
+            trusted=trusted,
         )
 
         # check symmetry about y-axis
@@ -158,9 +170,7 @@ class PrestressedSection(ConcreteSection):
 
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=0
-        )
+        _, d_t = utils.calculate_extreme_fibre(points=self.hull_points, theta=0)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = d_t  # neutral axis at extreme tensile fibre
 
@@ -183,6 +193,14 @@ class PrestressedSection(ConcreteSection):
 
         return cracked_results
 
+    def cracked_properties_sweep(self):  # pyright: ignore [reportIncompatibleMethodOverride]
+        """Calculates cracked section properties for many neutral axis angles.
+
+        Raises:
+            NotImplementedError: This feature has not yet been implemented.
+        """
+        raise NotImplementedError
+
     def calculate_cracking_moment(  # pyright: ignore [reportIncompatibleMethodOverride]
         self,
         n: float,
@@ -271,7 +289,7 @@ class PrestressedSection(ConcreteSection):
         def calc_min_stress():
             # calculate extreme fibre in global coordinates
             extreme_fibre, d_t = utils.calculate_extreme_fibre(
-                points=self.compound_geometry.points, theta=theta
+                points=self.hull_points, theta=theta
             )
 
             # find point on neutral axis by shifting by d_nc
@@ -280,7 +298,7 @@ class PrestressedSection(ConcreteSection):
             )
 
             # split concrete geometries above and below d_nc, discard below
-            cracked_geoms: list[CPGeomConcrete | CPGeom] = []
+            cracked_geoms: list[CPGeomConcrete | CPGeom | CPPointBar] = []
 
             for conc_geom in self.concrete_geometries:
                 top_geoms, _ = conc_geom.split_section(point=point_na, theta=theta)
@@ -289,8 +307,14 @@ class PrestressedSection(ConcreteSection):
                 cracked_geoms.extend(top_geoms)
 
             # add reinforcement geometries to list
-            cracked_geoms.extend(self.reinf_geometries_lumped)
-            cracked_geoms.extend(self.strand_geometries)
+            cracked_geoms.extend(
+                self.get_cracked_lumped_geometries(
+                    lumped_geometries=self.reinf_geometries_lumped
+                    + self.strand_geometries,
+                    point_na=point_na,
+                    theta=theta,
+                )
+            )
 
             # save cracked geometries and calculate properties
             cracked_results.cracked_geometries = cracked_geoms
@@ -411,6 +435,30 @@ class PrestressedSection(ConcreteSection):
 
         return super().ultimate_bending_capacity(theta=theta, n=n)
 
+    def calculate_uncracked_stresses(self):  # pyright: ignore [reportIncompatibleMethodOverride]
+        """Calculates uncracked stresses for many load cases.
+
+        Raises:
+            NotImplementedError: This feature has not yet been implemented.
+        """
+        raise NotImplementedError
+
+    def calculate_cracked_stresses(self):  # pyright: ignore [reportIncompatibleMethodOverride]
+        """Calculates cracked stresses for many bending moments.
+
+        Raises:
+            NotImplementedError: This feature has not yet been implemented.
+        """
+        raise NotImplementedError
+
+    def calculate_service_stresses(self):  # pyright: ignore [reportIncompatibleMethodOverride]
+        """Calculates service stresses for many bending moments.
+
+        Raises:
+            NotImplementedError: This feature has not yet been implemented.
+        """
+        raise NotImplementedError
+
     def moment_interaction_diagram(self):  # pyright: ignore [reportIncompatibleMethodOverride]
         """Generates a moment interaction diagram.
 
@@ -529,14 +577,21 @@ class PrestressedSection(ConcreteSection):
                 + (e_iyy * m) / (e_ixx * e_iyy - e_ixy**2) * y
             )
 
+            # stress in the concrete displaced by the lump
+            displaced_sig = (
+                lumped_geom.get_displaced_elastic_modulus()
+                * sig
+                / lumped_geom.material.elastic_modulus
+            )
+
             # add initial prestress
             if isinstance(lumped_geom.material, SteelStrand):
                 sig += -lumped_geom.material.get_prestress_stress()
 
             strain = sig / lumped_geom.material.elastic_modulus
 
-            # net force and point of action
-            n_lumped = sig * lumped_geom.calculate_area()
+            # net force (net of the displaced concrete) and point of action
+            n_lumped = (sig - displaced_sig) * lumped_geom.calculate_area()
 
             if isinstance(lumped_geom.material, SteelStrand):
                 strand_sigs.append(sig)
@@ -643,8 +698,14 @@ class PrestressedSection(ConcreteSection):
                 conc_forces.append((n_sec, d_x, d_y))
                 conc_sections.append(analysis_section)
 
-        # loop through all lumped and strand geometries and calculate stress
-        for lumped_geom in self.reinf_geometries_lumped + self.strand_geometries:
+        # loop through all cracked lumped and strand geometries and calculate stress
+        lumped_geoms = [
+            geom
+            for geom in cracked_results.cracked_geometries
+            if not geom.material.meshed
+        ]
+
+        for lumped_geom in lumped_geoms:
             # initialise stress and position of bar
             sig = 0
             centroid = lumped_geom.calculate_centroid()
@@ -660,14 +721,21 @@ class PrestressedSection(ConcreteSection):
                 + (e_iyy * m_net) / (e_ixx * e_iyy - e_ixy**2) * y
             )
 
+            # stress in the concrete displaced by the lump
+            displaced_sig = (
+                lumped_geom.get_displaced_elastic_modulus()
+                * sig
+                / lumped_geom.material.elastic_modulus
+            )
+
             # add initial prestress
             if isinstance(lumped_geom.material, SteelStrand):
                 sig += -lumped_geom.material.get_prestress_stress()
 
             strain = sig / lumped_geom.material.elastic_modulus
 
-            # net force and point of action
-            n_lumped = sig * lumped_geom.calculate_area()
+            # net force (net of the displaced concrete) and point of action
+            n_lumped = (sig - displaced_sig) * lumped_geom.calculate_area()
 
             if isinstance(lumped_geom.material, SteelStrand):
                 strand_sigs.append(sig)
@@ -765,9 +833,7 @@ class PrestressedSection(ConcreteSection):
         strand_forces = []
 
         # get global coordinates of extreme compressive fibre
-        ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=0
-        )
+        ecf, _ = utils.calculate_extreme_fibre(points=self.hull_points, theta=0)
 
         # create splits in meshed geometries at points in stress-strain profiles
         meshed_split_geoms: list[CPGeom | CPGeomConcrete] = []
@@ -816,14 +882,18 @@ class PrestressedSection(ConcreteSection):
                 kappa=kappa,
             )
 
+            # stress in the concrete displaced by the lump
+            displaced_sig = lumped_geom.get_displaced_stress(strain=strain)
+
             # add initial prestress strain
             if isinstance(lumped_geom.material, SteelStrand):
                 eps_pe = -lumped_geom.material.get_prestress_strain()
                 strain += eps_pe
 
-            # calculate stress, force and point of action
+            # calculate stress, force (net of the displaced concrete) and point of
+            # action
             sig = lumped_geom.material.stress_strain_profile.get_stress(strain=strain)
-            n_lumped = sig * area
+            n_lumped = (sig - displaced_sig) * area
 
             if isinstance(lumped_geom.material, SteelStrand):
                 strand_sigs.append(sig)
@@ -881,7 +951,7 @@ class PrestressedSection(ConcreteSection):
         """
         # depth of neutral axis at extreme tensile fibre
         extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
+            points=self.hull_points, theta=ultimate_results.theta
         )
 
         # find point on neutral axis by shifting by d_n
@@ -960,14 +1030,20 @@ class PrestressedSection(ConcreteSection):
                     ultimate_strain=self.gross_properties.conc_ultimate_strain,
                 )
 
+            # stress in the concrete displaced by the lump
+            displaced_sig = lumped_geom.get_displaced_stress(
+                strain=strain, ultimate=True
+            )
+
             # add initial prestress strain
             if isinstance(lumped_geom.material, SteelStrand):
                 eps_pe = -lumped_geom.material.get_prestress_strain()
                 strain += eps_pe
 
-            # calculate stress, force and point of action
+            # calculate stress, force (net of the displaced concrete) and point of
+            # action
             sig = lumped_geom.material.stress_strain_profile.get_stress(strain=strain)
-            n_lumped = sig * lumped_geom.calculate_area()
+            n_lumped = (sig - displaced_sig) * lumped_geom.calculate_area()
 
             if isinstance(lumped_geom.material, SteelStrand):
                 strand_sigs.append(sig)
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import struct
 import warnings
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+import zipfile
+from dataclasses import asdict, dataclass, field, fields, replace
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
 
 import matplotlib as mpl
 import matplotlib.axes
@@ -21,19 +27,362 @@ from scipy.interpolate import interp1d
 from sectionproperties.pre.geometry import CompoundGeometry
 from shapely import Point, Polygon
 
+from concreteproperties.analysis_section import AnalysisSection
 from concreteproperties.post import (
     DEFAULT_UNITS,
+    UnitDisplay,
     plotting_context,
     string_formatter,
     string_formatter_plots,
     string_formatter_stress,
 )
+from concreteproperties.pre import CPGeom, CPGeomConcrete
 
 if TYPE_CHECKING:
-    from concreteproperties.analysis_section import AnalysisSection
+    import os
+    from collections.abc import Callable, Hashable
+
     from concreteproperties.concrete_section import ConcreteSection
-    from concreteproperties.post import UnitDisplay
-    from concreteproperties.pre import CPGeom
+    from concreteproperties.material import Material
+    from concreteproperties.pre import CPPointBar
+
+# version of the npz results format
+NPZ_FORMAT_VERSION = 1
+
+
+def _save_npz(
+    path: str | os.PathLike,
+    results: Any,
+    arrays: dict[str, np.ndarray],
+    **metadata: Any,
+) -> None:
+    """Saves results to an uncompressed ``.npz`` file.
+
+    The class name, format version and default units are stored with ``metadata`` as
+    a JSON string, so that no Python objects are pickled.
+
+    Args:
+        path: File path
+        results: Results object
+        arrays: Numeric arrays to store
+        metadata: JSON serialisable metadata to store
+    """
+    metadata = {
+        "class": type(results).__name__,
+        "version": NPZ_FORMAT_VERSION,
+        "default_units": asdict(results.default_units),
+        **metadata,
+    }
+
+    # write to a file object so that numpy does not append an extension
+    with open(path, "wb") as f:
+        np.savez(f, __metadata__=np.array(json.dumps(metadata)), **arrays)
+
+
+def _load_npz(
+    path: str | os.PathLike,
+    cls: type,
+    mmap_mode: str | None = None,
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Loads results saved by :func:`_save_npz`.
+
+    As the arrays are stored uncompressed, they can be memory-mapped directly from
+    the ``.npz`` file, unlike :func:`numpy.load` which only memory-maps ``.npy``
+    files.
+
+    Args:
+        path: File path
+        cls: Expected results class
+        mmap_mode: If not ``None``, memory-maps the arrays using the given mode
+            (``"r"``, ``"r+"`` or ``"c"``), see :class:`numpy.memmap`. Defaults to
+            ``None``.
+
+    Raises:
+        ValueError: If the memory-map mode is not valid, or if the file does not
+            contain results of the expected class
+
+    Returns:
+        Metadata and arrays
+    """
+    if mmap_mode not in (None, "r", "r+", "c"):
+        msg = f"{mmap_mode} is not a valid memory-map mode, use 'r', 'r+' or 'c'."
+        raise ValueError(msg)
+
+    arrays = {}
+
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            name = info.filename.removesuffix(".npy")
+
+            if mmap_mode is not None and info.compress_type == zipfile.ZIP_STORED:
+                # skip the local file header to the start of the .npy data
+                f.seek(info.header_offset)
+                n_name, n_extra = struct.unpack("<HH", f.read(30)[26:])
+                f.seek(info.header_offset + 30 + n_name + n_extra)
+
+                # read the .npy header
+                version = np.lib.format.read_magic(f)
+
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+                if len(shape) > 0 and 0 not in shape and not dtype.hasobject:
+                    arrays[name] = np.memmap(
+                        path,
+                        dtype=dtype,
+                        mode=mmap_mode,
+                        offset=f.tell(),
+                        shape=shape,
+                        order="F" if fortran_order else "C",
+                    )
+                    continue
+
+            with zf.open(info) as fp:
+                arrays[name] = np.lib.format.read_array(fp, allow_pickle=False)
+
+    metadata = json.loads(str(arrays.pop("__metadata__", "{}")))
+
+    if metadata.get("class") != cls.__name__:
+        msg = f"{path} does not contain {cls.__name__} results."
+        raise ValueError(msg)
+
+    units = UnitDisplay(**metadata["default_units"])
+    metadata["default_units"] = DEFAULT_UNITS if units == DEFAULT_UNITS else units
+
+    return metadata, arrays
+
+
+def _scalar_fields(results: Any) -> list[str]:
+    """Returns the names of the public fields of a results object that are numbers.
+
+    Args:
+        results: Results object
+
+    Returns:
+        Field names
+    """
+    return [
+        f.name
+        for f in fields(results)
+        if not f.name.startswith("_")
+        and isinstance(getattr(results, f.name), int | float | np.number)
+    ]
+
+
+def _pack_scalars(
+    results: Any,
+    names: list[str],
+) -> np.ndarray:
+    """Packs scalar fields of a results object into a single row structured array.
+
+    Args:
+        results: Results object
+        names: Field names
+
+    Returns:
+        Structured array
+    """
+    return np.array(
+        [tuple(float(getattr(results, name)) for name in names)],
+        dtype=[(name, float) for name in names],
+    )
+
+
+def _unpack_scalars(scalars: np.ndarray) -> dict[str, float]:
+    """Unpacks a structured array created by :func:`_pack_scalars`.
+
+    Args:
+        scalars: Structured array
+
+    Returns:
+        Dictionary of field values
+    """
+    return {name: float(scalars[name][0]) for name in scalars.dtype.names or ()}
+
+
+def _pack_arrays(
+    arrays: list[Any],
+    shape: tuple[int, ...] = (),
+    dtype: type = float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenates a list of arrays along the first axis.
+
+    Args:
+        arrays: List of arrays
+        shape: Shape of the trailing axes. Defaults to ``()``.
+        dtype: Data type. Defaults to ``float``.
+
+    Returns:
+        Concatenated array and offsets of each array (length ``len(arrays) + 1``)
+    """
+    arrays = [np.asarray(a, dtype=dtype).reshape(-1, *shape) for a in arrays]
+    offsets = np.cumsum([0] + [len(a) for a in arrays])
+
+    if not arrays:
+        return np.zeros((0, *shape), dtype=dtype), offsets
+
+    return np.concatenate(arrays), offsets
+
+
+def _unpack_arrays(
+    packed: np.ndarray,
+    offsets: np.ndarray,
+) -> list[np.ndarray]:
+    """Splits an array created by :func:`_pack_arrays`.
+
+    Args:
+        packed: Concatenated array
+        offsets: Offsets of each array
+
+    Returns:
+        List of arrays (views of ``packed``)
+    """
+    return [packed[a:b] for a, b in pairwise(offsets)]
+
+
+def _pack_stress_meshes(
+    name: str,
+    meshes: list[StressMesh],
+    stresses: list[np.ndarray],
+    forces: list[tuple[float, float, float]],
+) -> dict[str, np.ndarray]:
+    """Packs the meshes, outlines, stresses and forces of analysis sections.
+
+    Args:
+        name: Prefix of the array names
+        meshes: Meshes of the analysis sections
+        stresses: Nodal stresses of each analysis section
+        forces: Force and lever arm of each analysis section
+
+    Returns:
+        Dictionary of arrays
+    """
+    arrays = {}
+    arrays[f"{name}_nodes"], arrays[f"{name}_node_offsets"] = _pack_arrays(
+        arrays=[mesh.mesh_nodes for mesh in meshes], shape=(2,)
+    )
+    arrays[f"{name}_elements"], arrays[f"{name}_element_offsets"] = _pack_arrays(
+        arrays=[mesh.mesh_elements for mesh in meshes], shape=(3,), dtype=int
+    )
+    arrays[f"{name}_rings"], arrays[f"{name}_ring_offsets"] = _pack_arrays(
+        arrays=[ring for mesh in meshes for ring in mesh.rings], shape=(2,)
+    )
+    arrays[f"{name}_geometry_offsets"] = np.cumsum(
+        [0] + [len(mesh.rings) for mesh in meshes]
+    )
+    arrays[f"{name}_stresses"], _ = _pack_arrays(arrays=stresses)
+    arrays[f"{name}_forces"] = np.array(forces, dtype=float).reshape(-1, 3)
+
+    return arrays
+
+
+def _unpack_stress_meshes(
+    name: str,
+    arrays: dict[str, np.ndarray],
+    materials: list[Any],
+    geometry_class: type[CPGeom],
+) -> tuple[list[StressMesh], list[np.ndarray], list[tuple[float, float, float]]]:
+    """Unpacks the meshes packed by :func:`_pack_stress_meshes`.
+
+    Args:
+        name: Prefix of the array names
+        arrays: Dictionary of arrays
+        materials: Material of each analysis section
+        geometry_class: Geometry class of the analysis sections
+
+    Returns:
+        Meshes, nodal stresses and forces of the analysis sections
+    """
+    rings = _unpack_arrays(
+        packed=arrays[f"{name}_rings"], offsets=arrays[f"{name}_ring_offsets"]
+    )
+    geometry_offsets = arrays[f"{name}_geometry_offsets"]
+    node_offsets = arrays[f"{name}_node_offsets"]
+    nodes = _unpack_arrays(packed=arrays[f"{name}_nodes"], offsets=node_offsets)
+    elements = _unpack_arrays(
+        packed=arrays[f"{name}_elements"],
+        offsets=arrays[f"{name}_element_offsets"],
+    )
+    meshes = [
+        StressMesh(
+            mesh_nodes=nodes[idx],
+            mesh_elements=elements[idx],
+            rings=rings[geometry_offsets[idx] : geometry_offsets[idx + 1]],
+            material=material,
+            geometry_class=geometry_class,
+        )
+        for idx, material in enumerate(materials)
+    ]
+    stresses = _unpack_arrays(packed=arrays[f"{name}_stresses"], offsets=node_offsets)
+    forces = [tuple(f) for f in arrays[f"{name}_forces"].tolist()]
+
+    return meshes, stresses, forces
+
+
+class _DeferredField:
+    """Descriptor for a gross property that belongs to a deferred group.
+
+    On first access, the calculation registered for the group (see
+    :meth:`GrossProperties.defer_group`) is run before the value is returned.
+    """
+
+    def __init__(
+        self,
+        group: str,
+    ) -> None:
+        """Inits the _DeferredField class.
+
+        Args:
+            group: Name of the group the property belongs to
+        """
+        self.group = group
+
+    def __set_name__(
+        self,
+        owner: type,
+        name: str,
+    ) -> None:
+        """Sets the name of the attribute storing the value."""
+        self.attr = f"_{name}"
+
+    def __get__(
+        self,
+        obj: GrossProperties | None,
+        objtype: type | None = None,
+    ) -> float:
+        """Returns the value, running the group calculation if required."""
+        # default value used by the dataclass
+        if obj is None:
+            return 0
+
+        pending = obj.__dict__.get("_deferred_groups")
+
+        if pending and self.group in pending:
+            pending.pop(self.group)()
+
+        return obj.__dict__.get(self.attr, 0)
+
+    def __set__(
+        self,
+        obj: GrossProperties,
+        value: float,
+    ) -> None:
+        """Stores the value."""
+        obj.__dict__[self.attr] = value
+
+
+def _deferred_field(group: str) -> Any:
+    """Creates a gross property that belongs to a deferred group.
+
+    Args:
+        group: Name of the group the property belongs to
+
+    Returns:
+        Deferred field descriptor
+    """
+    return _DeferredField(group=group)
 
 
 @dataclass
@@ -44,6 +393,9 @@ class GrossProperties:
     modulus. In order to obtain transformed properties, call the
     :meth:`~concreteproperties.concrete_section.ConcreteSection.get_transformed_gross_properties`
     method.
+
+    The second moments of area and the section moduli may be deferred, in which case
+    they are calculated on first access.
     """
 
     # units
@@ -76,33 +428,69 @@ class GrossProperties:
     cy_gross: float = 0
 
     # second moments of area
-    e_ixx_g: float = 0
-    e_iyy_g: float = 0
-    e_ixy_g: float = 0
-    e_ixx_c: float = 0
-    e_iyy_c: float = 0
-    e_ixy_c: float = 0
-    e_i11: float = 0
-    e_i22: float = 0
+    e_ixx_g: float = _deferred_field(group="second_moments")
+    e_iyy_g: float = _deferred_field(group="second_moments")
+    e_ixy_g: float = _deferred_field(group="second_moments")
+    e_ixx_c: float = _deferred_field(group="second_moments")
+    e_iyy_c: float = _deferred_field(group="second_moments")
+    e_ixy_c: float = _deferred_field(group="second_moments")
+    e_i11: float = _deferred_field(group="second_moments")
+    e_i22: float = _deferred_field(group="second_moments")
 
     # principal axis angle
-    phi: float = 0
+    phi: float = _deferred_field(group="second_moments")
 
     # section moduli
-    e_zxx_plus: float = 0
-    e_zxx_minus: float = 0
-    e_zyy_plus: float = 0
-    e_zyy_minus: float = 0
-    e_z11_plus: float = 0
-    e_z11_minus: float = 0
-    e_z22_plus: float = 0
-    e_z22_minus: float = 0
+    e_zxx_plus: float = _deferred_field(group="section_moduli")
+    e_zxx_minus: float = _deferred_field(group="section_moduli")
+    e_zyy_plus: float = _deferred_field(group="section_moduli")
+    e_zyy_minus: float = _deferred_field(group="section_moduli")
+    e_z11_plus: float = _deferred_field(group="section_moduli")
+    e_z11_minus: float = _deferred_field(group="section_moduli")
+    e_z22_plus: float = _deferred_field(group="section_moduli")
+    e_z22_minus: float = _deferred_field(group="section_moduli")
 
     # other properties
     conc_ultimate_strain: float = 0
     n_prestress: float = 0
     m_prestress: float = 0
 
+    def defer_group(
+        self,
+        group: str,
+        calculate: Callable[[], None],
+    ) -> None:
+        """Defers the calculation of a group of properties until first access.
+
+        Args:
+            group: Name of the group, ``"second_moments"`` or ``"section_moduli"``
+            calculate: Function that calculates and stores the properties in the group
+        """
+        self.__dict__.setdefault("_deferred_groups", {})[group] = calculate
+
+    def calculate_deferred(self) -> None:
+        """Calculates all deferred groups of properties."""
+        pending = self.__dict__.get("_deferred_groups", {})
+
+        while pending:
+            _, calculate = pending.popitem()
+            calculate()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state to pickle, calculating all deferred groups first.
+
+        The deferred calculations reference the concrete section, which is therefore
+        not pickled along with the properties.
+
+        Returns:
+            Instance dictionary without the deferred calculations
+        """
+        self.calculate_deferred()
+        state = self.__dict__.copy()
+        state.pop("_deferred_groups", None)
+
+        return state
+
     def print_results(
         self,
         eng: bool = True,
@@ -385,6 +773,47 @@ class GrossProperties:
         console = Console()
         console.print(table)
 
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the gross properties to an uncompressed ``.npz`` file.
+
+        Any deferred properties are calculated before saving.
+
+        Args:
+            path: File path
+        """
+        self.calculate_deferred()
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={"scalars": _pack_scalars(self, _scalar_fields(self))},
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> GrossProperties:
+        """Loads gross properties saved by :meth:`to_npz`.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Gross properties object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(
+            default_units=metadata["default_units"],
+            **_unpack_scalars(arrays["scalars"]),
+        )
+
 
 @dataclass
 class TransformedGrossProperties:
@@ -622,6 +1051,54 @@ class TransformedGrossProperties:
         console = Console()
         console.print(table)
 
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the transformed gross properties to an uncompressed ``.npz`` file.
+
+        Only the gross properties and the reference elastic modulus are stored, the
+        transformed properties are recalculated on loading.
+
+        Args:
+            path: File path
+        """
+        gross = self.concrete_properties
+        gross.calculate_deferred()
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={"concrete_properties": _pack_scalars(gross, _scalar_fields(gross))},
+            elastic_modulus=self.elastic_modulus,
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> TransformedGrossProperties:
+        """Loads transformed gross properties saved by :meth:`to_npz`.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Transformed gross properties object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(
+            default_units=metadata["default_units"],
+            concrete_properties=GrossProperties(
+                default_units=metadata["default_units"],
+                **_unpack_scalars(arrays["concrete_properties"]),
+            ),
+            elastic_modulus=metadata["elastic_modulus"],
+        )
+
 
 @dataclass
 class CrackedResults:
@@ -636,6 +1113,8 @@ class CrackedResults:
         default_units: Default units to use for reporting
         theta: Angle (in radians) the neutral axis makes with the horizontal axis
             (:math:`-\pi \leq \theta \leq \pi`)
+        stress_basis: Cracked stress basis, calculated on the first call of
+            :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_cracked_stresses`
     """
 
     # units
@@ -662,6 +1141,7 @@ class CrackedResults:
     e_i11_cr: float = 0
     e_i22_cr: float = 0
     phi_cr: float = 0
+    stress_basis: ElasticStressBasis | None = field(default=None, repr=False)
 
     # transformed properties
     elastic_modulus_ref: float | None = None
@@ -695,6 +1175,7 @@ class CrackedResults:
         self.e_i11_cr = 0
         self.e_i22_cr = 0
         self.phi_cr = 0
+        self.stress_basis = None
 
     def calculate_transformed_properties(
         self,
@@ -1053,6 +1534,187 @@ class CrackedResults:
         console = Console()
         console.print(table)
 
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the cracked results to an uncompressed ``.npz`` file.
+
+        The cracked geometries and the cracked stress basis are not stored.
+
+        Args:
+            path: File path
+        """
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={
+                "scalars": _pack_scalars(self, _scalar_fields(self)),
+                "m_cr": np.asarray(self.m_cr, dtype=float),
+            },
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> CrackedResults:
+        """Loads cracked results saved by :meth:`to_npz`.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Cracked results object, without any cracked geometries
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+        m_cr = arrays["m_cr"]
+        scalars = _unpack_scalars(arrays["scalars"])
+        scalars["m_cr"] = float(m_cr) if m_cr.ndim == 0 else tuple(m_cr.tolist())
+
+        return cls(default_units=metadata["default_units"], **scalars)
+
+
+@dataclass
+class CrackedSweepResults:
+    r"""Class for storing cracked properties for many neutral axis angles.
+
+    A compact, array based counterpart to
+    :class:`~concreteproperties.results.CrackedResults`, each array has one entry per
+    neutral axis angle in ``theta``. Cracked geometries are not stored. All properties
+    with an ``e_`` preceding the property are multiplied by the elastic modulus.
+
+    Args:
+        default_units: Default units to use for reporting
+        theta: Angles (in radians) the neutral axis makes with the horizontal axis
+            (:math:`-\pi \leq \theta \leq \pi`)
+        m_cr: Cracking moments
+        d_nc: Cracked neutral axis depths
+        e_a_cr: Cracked axial rigidities
+        cx: Cracked centroids (x-coordinate)
+        cy: Cracked centroids (y-coordinate)
+        e_ixx_c_cr: Cracked centroidal second moments of area about the x-axis
+        e_iyy_c_cr: Cracked centroidal second moments of area about the y-axis
+        e_ixy_c_cr: Cracked centroidal product moments of area
+        e_iuu_cr: Cracked second moments of area about the neutral axis
+        e_i11_cr: Cracked major principal second moments of area
+        e_i22_cr: Cracked minor principal second moments of area
+        phi_cr: Cracked principal axis angles
+    """
+
+    # units
+    default_units: UnitDisplay
+
+    theta: np.ndarray
+    m_cr: np.ndarray
+    d_nc: np.ndarray
+    e_a_cr: np.ndarray
+    cx: np.ndarray
+    cy: np.ndarray
+    e_ixx_c_cr: np.ndarray
+    e_iyy_c_cr: np.ndarray
+    e_ixy_c_cr: np.ndarray
+    e_iuu_cr: np.ndarray
+    e_i11_cr: np.ndarray
+    e_i22_cr: np.ndarray
+    phi_cr: np.ndarray
+
+    def get_cracked_results(
+        self,
+        idx: int,
+    ) -> CrackedResults:
+        """Returns the cracked results object for a single neutral axis angle.
+
+        Note that the returned object does not contain any cracked geometries.
+
+        Args:
+            idx: Index of the neutral axis angle in ``theta``
+
+        Returns:
+            Cracked results object
+        """
+        e_a_cr = float(self.e_a_cr[idx])
+        e_qx_cr = e_a_cr * float(self.cy[idx])
+        e_qy_cr = e_a_cr * float(self.cx[idx])
+
+        return CrackedResults(
+            default_units=self.default_units,
+            theta=float(self.theta[idx]),
+            m_cr=float(self.m_cr[idx]),
+            d_nc=float(self.d_nc[idx]),
+            e_a_cr=e_a_cr,
+            e_qx_cr=e_qx_cr,
+            e_qy_cr=e_qy_cr,
+            cx=float(self.cx[idx]),
+            cy=float(self.cy[idx]),
+            e_ixx_g_cr=float(self.e_ixx_c_cr[idx]) + e_qx_cr**2 / e_a_cr,
+            e_iyy_g_cr=float(self.e_iyy_c_cr[idx]) + e_qy_cr**2 / e_a_cr,
+            e_ixy_g_cr=float(self.e_ixy_c_cr[idx]) + e_qx_cr * e_qy_cr / e_a_cr,
+            e_ixx_c_cr=float(self.e_ixx_c_cr[idx]),
+            e_iyy_c_cr=float(self.e_iyy_c_cr[idx]),
+            e_ixy_c_cr=float(self.e_ixy_c_cr[idx]),
+            e_iuu_cr=float(self.e_iuu_cr[idx]),
+            e_i11_cr=float(self.e_i11_cr[idx]),
+            e_i22_cr=float(self.e_i22_cr[idx]),
+            phi_cr=float(self.phi_cr[idx]),
+        )
+
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the cracked sweep results to an uncompressed ``.npz`` file.
+
+        Args:
+            path: File path
+        """
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={
+                f.name: np.asarray(getattr(self, f.name), dtype=float)
+                for f in fields(self)
+                if f.name != "default_units"
+            },
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> CrackedSweepResults:
+        """Loads cracked sweep results saved by :meth:`to_npz`.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Cracked sweep results object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(default_units=metadata["default_units"], **arrays)
+
+
+# arrays stored when saving moment curvature results
+_MOMENT_CURVATURE_ARRAYS = (
+    "kappa",
+    "n",
+    "m_x",
+    "m_y",
+    "m_xy",
+    "convergence",
+    "eps0",
+    "ecf",
+    "failure_ratio",
+)
+
 
 @dataclass
 class MomentCurvatureResults:
@@ -1072,6 +1734,12 @@ class MomentCurvatureResults:
         convergence: The critical ratio between the strain and the failure strain within
             the cross-section for each curvature step in the analysis. A value of one
             indicates failure.
+        eps0: Converged strain at the extreme compressive fibre for each curvature
+            step in the analysis
+        ecf: Global coordinate of the extreme compressive fibre, which is common to
+            all curvature steps (``x``, ``y``)
+        failure_ratio: The critical ratio between the strain and the failure strain
+            for each curvature step, stored as an array (see ``convergence``)
     """
 
     # units
@@ -1087,9 +1755,13 @@ class MomentCurvatureResults:
     m_xy: list[float] = field(default_factory=list)
     failure_geometry: CPGeom = field(init=False, repr=False)
     convergence: list[float] = field(default_factory=list)
+    eps0: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    ecf: np.ndarray = field(default_factory=lambda: np.zeros(2))
+    failure_ratio: np.ndarray = field(default_factory=lambda: np.zeros(0))
 
     # for analysis
     _kappa: float = field(default=0, repr=False)
+    _eps0_i: float = field(default=0, repr=False)
     _n_i: float = field(default=0, repr=False)
     _m_x_i: float = field(default=0, repr=False)
     _m_y_i: float = field(default=0, repr=False)
@@ -1252,11 +1924,31 @@ class MomentCurvatureResults:
         Returns:
             Curvature
         """
-        # check moment is within bounds of results
+        return float(self.get_curvatures(moments=np.array([moment]))[0])
+
+    def get_curvatures(
+        self,
+        moments: np.ndarray,
+    ) -> np.ndarray:
+        """Given moments, uses the moment-curvature results to interpolate curvatures.
+
+        Args:
+            moments: Bending moments at which to obtain curvatures
+
+        Raises:
+            ValueError: If any supplied moment is outside bounds of moment-curvature
+                results.
+
+        Returns:
+            Curvatures
+        """
+        moments = np.asarray(moments, dtype=float)
+
+        # check moments are within bounds of results
         m_min = min(self.m_xy)
         m_max = max(self.m_xy)
 
-        if moment > m_max or moment < m_min:
+        if np.any(moments > m_max) or np.any(moments < m_min):
             msg = "moment must be within the bounds of the moment-curvature results."
             raise ValueError(msg)
 
@@ -1266,7 +1958,94 @@ class MomentCurvatureResults:
             kind="linear",
         )
 
-        return float(f_kappa(moment))
+        return np.asarray(f_kappa(moments), dtype=float)
+
+    def get_step(
+        self,
+        kappa: float,
+    ) -> int | None:
+        """Returns the index of the curvature step with the given curvature.
+
+        Args:
+            kappa: Curvature
+
+        Returns:
+            Index of the curvature step, ``None`` if ``kappa`` is not a curvature step
+            or the converged strains were not stored during the analysis
+        """
+        if len(self.eps0) != len(self.kappa):
+            return None
+
+        steps = np.flatnonzero(np.asarray(self.kappa) == kappa)
+
+        return int(steps[0]) if len(steps) else None
+
+    def get_eps0_estimates(
+        self,
+        kappa: np.ndarray,
+    ) -> np.ndarray | None:
+        """Interpolates the converged extreme fibre strains at the given curvatures.
+
+        Args:
+            kappa: Curvatures at which to estimate the extreme fibre strain
+
+        Returns:
+            Estimated strains at the extreme compressive fibre, ``None`` if the
+            converged strains were not stored during the analysis
+        """
+        if len(self.eps0) != len(self.kappa) or len(self.kappa) < 2:
+            return None
+
+        return np.interp(kappa, self.kappa, self.eps0)
+
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the moment curvature results to an uncompressed ``.npz`` file.
+
+        The failure geometry is not stored.
+
+        Args:
+            path: File path
+        """
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={
+                name: np.asarray(getattr(self, name), dtype=float)
+                for name in _MOMENT_CURVATURE_ARRAYS
+            },
+            theta=self.theta,
+            n_target=self.n_target,
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> MomentCurvatureResults:
+        """Loads moment curvature results saved by :meth:`to_npz`.
+
+        The results are stored as arrays rather than lists.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Moment curvature results object, without a failure geometry
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(
+            default_units=metadata["default_units"],
+            theta=metadata["theta"],
+            n_target=metadata["n_target"],
+            **arrays,
+        )
 
 
 @dataclass(order=True)
@@ -1305,6 +2084,29 @@ class UltimateBendingResults:
     # label
     label: str | None = field(default=None, compare=False)
 
+    def scale(
+        self,
+        factor: float,
+    ) -> UltimateBendingResults:
+        """Returns a copy of the results with the actions multiplied by ``factor``.
+
+        The copy is shallow, i.e. ``default_units`` is shared with these results.
+
+        Args:
+            factor: Factor to apply to the axial force and bending moments, e.g. a
+                capacity reduction factor
+
+        Returns:
+            Scaled ultimate bending results
+        """
+        return replace(
+            self,
+            n=self.n * factor,
+            m_x=self.m_x * factor,
+            m_y=self.m_y * factor,
+            m_xy=self.m_xy * factor,
+        )
+
     def print_results(
         self,
         eng: bool = True,
@@ -1382,33 +2184,467 @@ class UltimateBendingResults:
         console = Console()
         console.print(table)
 
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the ultimate bending results to an uncompressed ``.npz`` file.
 
-@dataclass
-class MomentInteractionResults:
-    """Class for storing moment interaction results.
+        Args:
+            path: File path
+        """
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={"scalars": _pack_scalars(self, list(_COMPARE_FIELDS))},
+            label=self.label,
+        )
 
-    Args:
-        default_units: Default units to use for reporting
-        results: List of ultimate bending result objects
-    """
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> UltimateBendingResults:
+        """Loads ultimate bending results saved by :meth:`to_npz`.
 
-    # units
-    default_units: UnitDisplay
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Ultimate bending results object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(
+            default_units=metadata["default_units"],
+            label=metadata["label"],
+            **_unpack_scalars(arrays["scalars"]),
+        )
+
+
+# columns of an array of ultimate bending results, labels are stored as indices into
+# a list of labels (-1 if no label)
+ULTIMATE_RESULTS_DTYPE = np.dtype(
+    [
+        ("theta", float),
+        ("d_n", float),
+        ("k_u", float),
+        ("n", float),
+        ("m_x", float),
+        ("m_y", float),
+        ("m_xy", float),
+        ("label", np.int32),
+    ]
+)
+
+# columns compared when sorting and removing duplicate results
+_COMPARE_FIELDS = ("theta", "d_n", "k_u", "n", "m_x", "m_y", "m_xy")
+
+
+def _results_to_columns(
+    results: list[UltimateBendingResults],
+) -> tuple[np.ndarray, list[str]]:
+    """Converts a list of ultimate bending results to array columns.
+
+    Args:
+        results: List of ultimate bending result objects
+
+    Returns:
+        Results columns (see :data:`ULTIMATE_RESULTS_DTYPE`) and the unique labels,
+        indexed by the ``label`` column
+    """
+    labels: list[str] = []
+    label_idx: dict[str, int] = {}
+    columns = np.empty(len(results), dtype=ULTIMATE_RESULTS_DTYPE)
+
+    for name in _COMPARE_FIELDS:
+        columns[name] = [getattr(r, name) for r in results]
+
+    for idx, r in enumerate(results):
+        if r.label is None:
+            columns["label"][idx] = -1
+        else:
+            columns["label"][idx] = label_idx.setdefault(r.label, len(labels))
+
+            if columns["label"][idx] == len(labels):
+                labels.append(r.label)
+
+    return columns, labels
+
+
+class _ResultsList(list):
+    """List of ultimate bending results that counts the changes made to it.
+
+    The version is incremented whenever the list is modified or its items are
+    accessed, as the items may then be modified in place. Columns built from the list
+    are only rebuilt if the version has changed.
+    """
+
+    version: int = 0
+
+
+def _counted(name: str) -> Callable:
+    """Wraps a list method so that calling it increments the list version.
+
+    Args:
+        name: Name of the list method
+
+    Returns:
+        Wrapped method
+    """
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self: _ResultsList, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in (
+    "__getitem__",
+    "__iter__",
+    "__reversed__",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_ResultsList, _name, _counted(name=_name))
+
+
+class _ResultsListField:
+    """Descriptor for a list of ultimate bending results backed by array columns.
+
+    The results are stored as columns (see :attr:`UltimateResultsColumns.columns`)
+    until the list is accessed. From then on the list is the source of truth, the
+    caller may modify it and the columns are rebuilt from it when it has changed.
+    """
+
+    def __get__(
+        self,
+        obj: UltimateResultsColumns | None,
+        objtype: type | None = None,
+    ) -> list[UltimateBendingResults]:
+        """Returns the list of results, building it from the columns if required."""
+        # default value used by the dataclass
+        if obj is None:
+            return None  # pyright: ignore [reportReturnType]
+
+        results = obj.__dict__.get("_results")
+
+        if results is None:
+            results = _ResultsList(obj.build_results_list())
+            obj.__dict__["_results"] = results
+            obj.__dict__["_version"] = results.version
+
+        return results
+
+    def __set__(
+        self,
+        obj: UltimateResultsColumns,
+        value: list[UltimateBendingResults] | None,
+    ) -> None:
+        """Stores the list of results."""
+        obj.__dict__["_results"] = _ResultsList([] if value is None else value)
+        obj.__dict__["_columns"] = None
+        obj.__dict__["_cache"] = {}
+
+
+class UltimateResultsColumns:
+    """Mixin for results classes storing many ultimate bending results.
+
+    The results are backed by a structured array with one row per result (see
+    :data:`ULTIMATE_RESULTS_DTYPE`). :class:`UltimateBendingResults` objects are built
+    on demand when the ``results`` list is accessed, after which the columns track any
+    changes made to the list.
+    """
+
+    default_units: UnitDisplay
+
+    @property
+    def columns(self) -> np.ndarray:
+        """Structured array of the results, one row per result.
+
+        If the ``results`` list has been accessed, the columns are rebuilt from the list
+        whenever it may have changed, so that any changes made to it are included.
+
+        Returns:
+            Results columns (see :data:`ULTIMATE_RESULTS_DTYPE`)
+        """
+        results = self.__dict__.get("_results")
+        columns = self.__dict__.get("_columns")
+
+        if results is None and columns is None:
+            results = _ResultsList()
+
+        if results is not None and self.__dict__.get("_version") != results.version:
+            new_columns, labels = _results_to_columns(results=results)
+            self.__dict__["_version"] = results.version
+
+            # only discard the cache if the results have changed
+            if (
+                columns is None
+                or labels != self.__dict__.get("_labels")
+                or new_columns.tobytes() != columns.tobytes()
+            ):
+                columns = new_columns
+                self.__dict__["_columns"] = columns
+                self.__dict__["_labels"] = labels
+                self.__dict__["_cache"] = {}
+
+        return columns
+
+    @property
+    def labels(self) -> list[str]:
+        """Unique labels, indexed by the ``label`` column.
+
+        Returns:
+            List of labels
+        """
+        _ = self.columns
+
+        return self.__dict__.get("_labels", [])
+
+    def set_columns(
+        self,
+        columns: np.ndarray,
+        labels: list[str] | None = None,
+    ) -> None:
+        """Replaces the results with the given columns.
+
+        A ``results`` list that has already been accessed is updated in place.
+
+        Args:
+            columns: Structured array of results (see :data:`ULTIMATE_RESULTS_DTYPE`)
+            labels: Unique labels, indexed by the ``label`` column. Defaults to
+                ``None``.
+        """
+        self.__dict__["_columns"] = np.asarray(columns, dtype=ULTIMATE_RESULTS_DTYPE)
+        self.__dict__["_labels"] = [] if labels is None else list(labels)
+        self.__dict__["_cache"] = {}
+
+        # keep a list held by the caller in sync with the new columns
+        results = self.__dict__.get("_results")
+
+        if results is not None:
+            results[:] = self.build_results_list()
+            self.__dict__["_version"] = results.version
+
+    def get_column(
+        self,
+        name: str,
+    ) -> np.ndarray:
+        """Returns a column of the results.
+
+        Args:
+            name: Column name, e.g. ``"n"`` or ``"m_x"``
+
+        Raises:
+            ValueError: If the column name is not valid
+
+        Returns:
+            Column of results
+        """
+        if name not in _COMPARE_FIELDS:
+            msg = f"{name} is not a results column."
+            raise ValueError(msg)
+
+        return self.columns[name]
+
+    def get_label(
+        self,
+        idx: int,
+    ) -> str | None:
+        """Returns the label of a result.
+
+        Args:
+            idx: Index of the result
+
+        Returns:
+            Result label
+        """
+        label_idx = self.columns["label"][idx]
+
+        return None if label_idx < 0 else self.labels[label_idx]
+
+    def build_results_list(self) -> list[UltimateBendingResults]:
+        """Builds ultimate bending result objects from the columns.
+
+        Returns:
+            List of ultimate bending result objects
+        """
+        columns = self.__dict__.get("_columns")
+
+        if columns is None:
+            return []
+
+        labels = self.__dict__.get("_labels", [])
+
+        return [
+            UltimateBendingResults(
+                default_units=self.default_units,
+                theta=theta,
+                d_n=d_n,
+                k_u=k_u,
+                n=n,
+                m_x=m_x,
+                m_y=m_y,
+                m_xy=m_xy,
+                label=None if label < 0 else labels[label],
+            )
+            for theta, d_n, k_u, n, m_x, m_y, m_xy, label in columns.tolist()
+        ]
+
+    def cached(
+        self,
+        key: Hashable,
+        calculate: Callable[[], Any],
+    ) -> Any:
+        """Returns a cached value derived from the results.
+
+        The cache is discarded whenever the results are modified.
+
+        Args:
+            key: Cache key
+            calculate: Function calculating the value
+
+        Returns:
+            Cached value
+        """
+        _ = self.columns
+        cache = self.__dict__.setdefault("_cache", {})
 
-    results: list[UltimateBendingResults] = field(default_factory=list)
+        if key not in cache:
+            cache[key] = calculate()
+
+        return cache[key]
+
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the results columns to an uncompressed ``.npz`` file.
+
+        Args:
+            path: File path
+        """
+        # other fields, e.g. the axial force of biaxial bending results
+        names = [
+            f.name
+            for f in fields(self)  # pyright: ignore
+            if f.name not in ("default_units", "results")
+        ]
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={"columns": self.columns},
+            labels=self.labels,
+            **{name: getattr(self, name) for name in names},
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> Any:
+        """Loads results saved by :meth:`to_npz`.
+
+        The loaded results are backed by the stored columns, which are memory-mapped
+        if ``mmap_mode`` is provided.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Results object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+        labels = metadata.pop("labels")
+
+        for key in ("class", "version"):
+            metadata.pop(key)
+
+        results = cls(**metadata)
+        results.set_columns(columns=arrays["columns"], labels=labels)
+
+        return results
+
+
+@dataclass
+class MomentInteractionResults(UltimateResultsColumns):
+    """Class for storing moment interaction results.
+
+    The results are backed by array columns (see
+    :attr:`~concreteproperties.results.UltimateResultsColumns.columns`),
+    :class:`UltimateBendingResults` objects are built on demand when ``results`` is
+    accessed.
+
+    Args:
+        default_units: Default units to use for reporting
+        results: List of ultimate bending result objects
+    """
+
+    # units
+    default_units: UnitDisplay
+
+    results: list[UltimateBendingResults] = _ResultsListField()
 
     def sort_results(self) -> None:
-        """Sorts the results by decreasing axial force."""
-        self.results.sort(reverse=True)
+        """Sorts the results by decreasing axial force and removes duplicates."""
+        columns = self.columns
+
+        # stable sort in decreasing order of the compared fields, the first field is
+        # the primary key
+        keys = [-columns[name] for name in reversed(_COMPARE_FIELDS)]
+        columns = columns[np.lexsort(keys)]
+
+        # remove duplicates, which are adjacent after sorting
+        values = np.column_stack([columns[name] for name in _COMPARE_FIELDS])
+        keep = np.ones(len(columns), dtype=bool)
+        keep[1:] = np.any(values[1:] != values[:-1], axis=1)
+
+        self.set_columns(columns=columns[keep], labels=self.labels)
+
+    def scale(
+        self,
+        factors: float | list[float] | np.ndarray,
+    ) -> MomentInteractionResults:
+        """Returns a copy of the results with the actions multiplied by ``factors``.
+
+        Args:
+            factors: Factor to apply to the axial force and bending moments of all
+                results, or a list of factors, one for each result
+
+        Returns:
+            Scaled moment interaction results
+        """
+        columns = self.columns.copy()
+        factor_arr = np.broadcast_to(np.asarray(factors, dtype=float), columns.shape)
 
-        # remove duplicates from sorted list
-        new_results = []
+        for name in ("n", "m_x", "m_y", "m_xy"):
+            columns[name] *= factor_arr
 
-        for res in self.results:
-            if res not in new_results:
-                new_results.append(res)
+        scaled = MomentInteractionResults(default_units=self.default_units)
+        scaled.set_columns(columns=columns, labels=self.labels)
 
-        self.results = new_results
+        return scaled
 
     def get_results_lists(
         self,
@@ -1427,24 +2663,11 @@ class MomentInteractionResults:
             Tuple containing a list of axial forces and a list of moments
             (``n_list``, ``m_list``)
         """
-        # build list of results
-        n_list = []
-        m_list = []
-
-        for result in self.results:
-            n_list.append(result.n)
-
-            if moment == "m_x":
-                m_list.append(result.m_x)
-            elif moment == "m_y":
-                m_list.append(result.m_y)
-            elif moment == "m_xy":
-                m_list.append(result.m_xy)
-            else:
-                msg = f"{moment} not an acceptable value for moment."
-                raise ValueError(msg)
+        if moment not in ("m_x", "m_y", "m_xy"):
+            msg = f"{moment} not an acceptable value for moment."
+            raise ValueError(msg)
 
-        return n_list, m_list
+        return self.columns["n"].tolist(), self.columns[moment].tolist()
 
     def plot_diagram(
         self,
@@ -1516,8 +2739,14 @@ class MomentInteractionResults:
                     y_diff = ax.get_ylim()
                     ar = (y_diff[1] - y_diff[0]) / (x_diff[1] - x_diff[0])
 
+                # look up the labels once rather than for each point
+                label_idxs = self.columns["label"].tolist()
+                label_names = self.labels
+
                 for idx, m in enumerate(m_list):
-                    if self.results[idx].label is not None:
+                    if label_idxs[idx] >= 0:
+                        label = label_names[label_idxs[idx]]
+
                         # get x,y position on plot
                         x = m * units.moment_scale
                         y = n_list[idx] * units.force_scale
@@ -1546,7 +2775,7 @@ class MomentInteractionResults:
 
                         # plot text
                         ax.annotate(
-                            text=self.results[idx].label,  # pyright: ignore
+                            text=label,
                             xy=(x, y),
                             **annotate_dict,
                         )
@@ -1659,25 +2888,30 @@ class MomentInteractionResults:
         Returns:
             True, if combination of axial force and moment is within the diagram
         """
-        # get results
-        n_list, m_list = self.get_results_lists(moment=moment)
-
-        # create a polygon from points on diagram
-        poly_points = []
-
-        for idx, mom in enumerate(m_list):
-            poly_points.append((mom, n_list[idx]))
+        if moment not in ("m_x", "m_y", "m_xy"):
+            msg = f"{moment} not an acceptable value for moment."
+            raise ValueError(msg)
 
-        poly = Polygon(poly_points)
-        point = Point(m, n)
+        # create a polygon from points on diagram, cached per moment
+        poly = self.cached(
+            key=("polygon", moment),
+            calculate=lambda: Polygon(
+                np.column_stack([self.columns[moment], self.columns["n"]])
+            ),
+        )
 
-        return poly.contains(point)
+        return poly.contains(Point(m, n))
 
 
 @dataclass
-class BiaxialBendingResults:
+class BiaxialBendingResults(UltimateResultsColumns):
     """Class for storing biaxial bending results.
 
+    The results are backed by array columns (see
+    :attr:`~concreteproperties.results.UltimateResultsColumns.columns`),
+    :class:`UltimateBendingResults` objects are built on demand when ``results`` is
+    accessed.
+
     Args:
         default_units: Default units to use for reporting
         n: Net axial force
@@ -1688,7 +2922,7 @@ class BiaxialBendingResults:
     default_units: UnitDisplay
 
     n: float
-    results: list[UltimateBendingResults] = field(default_factory=list)
+    results: list[UltimateBendingResults] = _ResultsListField()
 
     def get_results_lists(
         self,
@@ -1698,15 +2932,7 @@ class BiaxialBendingResults:
         Returns:
             Tuple containing two list of moments (``mx_list``, ``my_list``)
         """
-        # build list of results
-        m_x_list = []
-        m_y_list = []
-
-        for result in self.results:
-            m_x_list.append(result.m_x)
-            m_y_list.append(result.m_y)
-
-        return m_x_list, m_y_list
+        return self.columns["m_x"].tolist(), self.columns["m_y"].tolist()
 
     def plot_diagram(
         self,
@@ -1950,19 +3176,290 @@ class BiaxialBendingResults:
         Returns:
             ``True``, if combination of bendings moments is within the diagram
         """
-        # create a polygon from points on diagram
-        poly_points = [(ult_res.m_x, ult_res.m_y) for ult_res in self.results]
-        poly = Polygon(poly_points)
-        point = Point(m_x, m_y)
+        # create a polygon from points on diagram, cached
+        poly = self.cached(
+            key="polygon",
+            calculate=lambda: Polygon(
+                np.column_stack([self.columns["m_x"], self.columns["m_y"]])
+            ),
+        )
+
+        return poly.contains(Point(m_x, m_y))
+
+
+@dataclass
+class LoadCaseResults:
+    """Class for storing the results of a design code load case check.
+
+    Each array has one value per row. Design codes that check several analysis types
+    have one row per analysis type and load case, otherwise there is one row per load
+    case. Load cases with an axial force outside the factored axial capacity of the
+    section have an infinite utilisation.
+
+    Args:
+        default_units: Default units to use for reporting
+        case: Index of the load case of each row
+        n: Design axial forces, N*
+        m_x: Design bending moments about the x-axis, Mx*
+        m_y: Design bending moments about the y-axis, My*
+        phi_m_ux: Factored bending capacities about the x-axis, in the direction of
+            ``m_x``
+        phi_m_uy: Factored bending capacities about the y-axis, in the direction of
+            ``m_y``
+        util_x: Utilisations for bending about the x-axis
+        util_y: Utilisations for bending about the y-axis
+        utilisation: Combined utilisations, refer to the ``check_load_cases`` method
+            of the design code for the biaxial bending interaction
+        refined: True if the capacities were calculated exactly, False if they were
+            interpolated from the interaction diagrams
+        analysis_type: Analysis type of each row, ``None`` if the design code does
+            not check several analysis types. Defaults to ``None``.
+        phi: Capacity reduction factors, ``None`` if they are not constant for an
+            analysis type. Defaults to ``None``.
+        alpha_n: Biaxial bending exponents, ``None`` if the biaxial bending
+            interaction is linear. Defaults to ``None``.
+    """
+
+    # units
+    default_units: UnitDisplay
+
+    case: np.ndarray
+    n: np.ndarray
+    m_x: np.ndarray
+    m_y: np.ndarray
+    phi_m_ux: np.ndarray
+    phi_m_uy: np.ndarray
+    util_x: np.ndarray
+    util_y: np.ndarray
+    utilisation: np.ndarray
+    refined: np.ndarray
+    analysis_type: np.ndarray | None = None
+    phi: np.ndarray | None = None
+    alpha_n: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Returns the number of rows.
+
+        Returns:
+            Number of rows
+        """
+        return len(self.case)
+
+    def get_analysis_type(
+        self,
+        analysis_type: str,
+    ) -> LoadCaseResults:
+        """Returns the rows of a single analysis type.
+
+        Args:
+            analysis_type: Analysis type
+
+        Raises:
+            ValueError: If the results do not contain the analysis type
+
+        Returns:
+            Load case results object, with one row per load case
+        """
+        if self.analysis_type is None or analysis_type not in self.analysis_type:
+            msg = f"The results do not contain the {analysis_type} analysis type."
+            raise ValueError(msg)
+
+        mask = self.analysis_type == analysis_type
+
+        return LoadCaseResults(
+            default_units=self.default_units,
+            **{
+                f.name: None
+                if getattr(self, f.name) is None
+                else getattr(self, f.name)[mask]
+                for f in fields(self)
+                if f.name != "default_units"
+            },
+        )
+
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the load case results to an uncompressed ``.npz`` file.
+
+        Args:
+            path: File path
+        """
+        _save_npz(
+            path=path,
+            results=self,
+            arrays={
+                f.name: np.asarray(getattr(self, f.name))
+                for f in fields(self)
+                if f.name != "default_units" and getattr(self, f.name) is not None
+            },
+        )
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        mmap_mode: str | None = None,
+    ) -> LoadCaseResults:
+        """Loads load case results saved by :meth:`to_npz`.
+
+        Args:
+            path: File path
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Returns:
+            Load case results object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+
+        return cls(default_units=metadata["default_units"], **arrays)
+
+
+@dataclass(eq=False)
+class StressMesh:
+    """Class for storing the mesh of an analysis section of a stress result.
+
+    Only the data required to plot stresses and to rebuild the
+    :class:`~concreteproperties.analysis_section.AnalysisSection` object is stored.
+
+    Args:
+        mesh_nodes: Coordinates of the nodes [nodes x 2]
+        mesh_elements: Node indices of the elements [elements x 3]
+        rings: Coordinates of the exterior ring, followed by any interior rings, of the
+            geometry of the analysis section
+        material: Material of the analysis section
+        geometry_class: Class of the geometry of the analysis section
+    """
+
+    mesh_nodes: np.ndarray
+    mesh_elements: np.ndarray
+    rings: list[np.ndarray]
+    material: Material
+    geometry_class: type[CPGeom] = CPGeom
+
+    @classmethod
+    def from_analysis_section(
+        cls,
+        section: AnalysisSection,
+        mesh_cache: dict[Hashable, StressMesh] | None = None,
+    ) -> StressMesh:
+        """Creates the mesh of an analysis section.
+
+        Args:
+            section: Analysis section
+            mesh_cache: Meshes that may be shared, identical meshes are only stored
+                once. Defaults to ``None``.
+
+        Returns:
+            Mesh of the analysis section
+        """
+        nodes = section.mesh_nodes
+        elements = np.asarray(section.mesh_elements, dtype=int).reshape(-1, 3)
+
+        if mesh_cache is not None:
+            digest = hashlib.blake2b(nodes.tobytes() + elements.tobytes()).digest()
+            key = (id(section.material), type(section.geometry), digest)
+            mesh = mesh_cache.get(key)
 
-        return poly.contains(point)
+            if (
+                mesh is not None
+                and np.array_equal(mesh.mesh_nodes, nodes)
+                and np.array_equal(mesh.mesh_elements, elements)
+            ):
+                return mesh
+
+        polygon = section.geometry.geom
+        mesh = cls(
+            mesh_nodes=nodes,
+            mesh_elements=elements,
+            rings=[
+                np.array(ring.coords) for ring in [polygon.exterior, *polygon.interiors]
+            ],
+            material=section.material,
+            geometry_class=type(section.geometry),
+        )
+
+        if mesh_cache is not None:
+            mesh_cache[key] = mesh  # pyright: ignore [reportPossiblyUnboundVariable]
+
+        return mesh
+
+    def build_analysis_section(self) -> AnalysisSection:
+        """Rebuilds the analysis section, using the stored mesh.
+
+        Returns:
+            Analysis section
+        """
+        geometry = self.geometry_class(
+            geom=Polygon(shell=self.rings[0], holes=self.rings[1:]),
+            material=self.material,
+            tol=None,
+        )
+
+        return AnalysisSection(
+            geometry=geometry,
+            mesh_nodes=self.mesh_nodes,
+            mesh_elements=self.mesh_elements,
+        )
+
+
+class _AnalysisSectionsField:
+    """Descriptor for the analysis sections of a stress result.
+
+    The analysis sections are stored either as
+    :class:`~concreteproperties.analysis_section.AnalysisSection` objects or, for a
+    compact stress result (see :meth:`StressResult.compact`), as :class:`StressMesh`
+    objects from which the analysis sections are rebuilt on first access.
+    """
+
+    def __set_name__(
+        self,
+        owner: type,
+        name: str,
+    ) -> None:
+        """Sets the name of the attribute storing the analysis sections."""
+        self.name = name
+
+    def __get__(
+        self,
+        obj: StressResult | None,
+        objtype: type | None = None,
+    ) -> list[AnalysisSection]:
+        """Returns the analysis sections, rebuilding them if required."""
+        # no default value, i.e. a required dataclass field
+        if obj is None:
+            raise AttributeError(self.name)
+
+        sections = obj.__dict__.get(f"_{self.name}")
+
+        if sections is None:
+            sections = [
+                mesh.build_analysis_section()
+                for mesh in obj.__dict__.get(f"_{self.name}_meshes") or []
+            ]
+            obj.__dict__[f"_{self.name}"] = sections
+
+        return sections
+
+    def __set__(
+        self,
+        obj: StressResult,
+        value: list[AnalysisSection],
+    ) -> None:
+        """Stores the analysis sections."""
+        obj.__dict__[f"_{self.name}"] = list(value)
+        obj.__dict__[f"_{self.name}_meshes"] = None
 
 
 @dataclass
 class StressResult:
     """Class for storing stress results.
 
-    The lever arm is computed to the elastic centroid.
+    The lever arm is computed to the elastic centroid. Calling :meth:`compact` discards
+    the analysis section objects, retaining only their meshes, the analysis sections
+    are then rebuilt on first access.
 
     Args:
         default_units: Default units to use for reporting
@@ -2000,10 +3497,10 @@ class StressResult:
     default_units: UnitDisplay
 
     concrete_section: ConcreteSection
-    concrete_analysis_sections: list[AnalysisSection]
+    concrete_analysis_sections: list[AnalysisSection] = _AnalysisSectionsField()
     concrete_stresses: list[np.ndarray]
     concrete_forces: list[tuple[float, float, float]]
-    meshed_reinforcement_sections: list[AnalysisSection]
+    meshed_reinforcement_sections: list[AnalysisSection] = _AnalysisSectionsField()
     meshed_reinforcement_stresses: list[np.ndarray]
     meshed_reinforcement_forces: list[tuple[float, float, float]]
     lumped_reinforcement_geometries: list[CPGeom]
@@ -2016,6 +3513,87 @@ class StressResult:
     strand_forces: list[tuple[float, float, float]] = field(default_factory=list)
     _m_net: float | None = field(default=None, repr=False)
 
+    @property
+    def concrete_meshes(self) -> list[StressMesh]:
+        """Meshes of the concrete analysis sections.
+
+        Returns:
+            List of meshes
+        """
+        return self.get_meshes(name="concrete_analysis_sections")
+
+    @property
+    def meshed_reinforcement_meshes(self) -> list[StressMesh]:
+        """Meshes of the meshed reinforcement analysis sections.
+
+        Returns:
+            List of meshes
+        """
+        return self.get_meshes(name="meshed_reinforcement_sections")
+
+    def get_meshes(
+        self,
+        name: str,
+        mesh_cache: dict[Hashable, StressMesh] | None = None,
+    ) -> list[StressMesh]:
+        """Returns the meshes of a list of analysis sections.
+
+        Args:
+            name: Name of the list of analysis sections,
+                ``"concrete_analysis_sections"`` or ``"meshed_reinforcement_sections"``
+            mesh_cache: Meshes that may be shared, identical meshes are only stored
+                once. Defaults to ``None``.
+
+        Returns:
+            List of meshes
+        """
+        meshes = self.__dict__.get(f"_{name}_meshes")
+
+        if meshes is None:
+            meshes = [
+                StressMesh.from_analysis_section(section=section, mesh_cache=mesh_cache)
+                for section in getattr(self, name)
+            ]
+
+        return meshes
+
+    def set_meshes(
+        self,
+        name: str,
+        meshes: list[StressMesh],
+    ) -> None:
+        """Replaces a list of analysis sections with their meshes.
+
+        The analysis sections are rebuilt from the meshes on first access.
+
+        Args:
+            name: Name of the list of analysis sections,
+                ``"concrete_analysis_sections"`` or ``"meshed_reinforcement_sections"``
+            meshes: List of meshes
+        """
+        self.__dict__[f"_{name}"] = None
+        self.__dict__[f"_{name}_meshes"] = list(meshes)
+
+    def compact(
+        self,
+        mesh_cache: dict[Hashable, StressMesh] | None = None,
+    ) -> None:
+        """Discards the analysis section objects, retaining only their meshes.
+
+        Only the node coordinates, connectivity and outline of each analysis section
+        are retained, the stresses and forces are unaffected. Plotting stresses does
+        not require the analysis sections, which are rebuilt on first access.
+
+        Args:
+            mesh_cache: Meshes that may be shared between stress results, e.g. the
+                same dictionary may be used to compact many stress results, in which
+                case identical meshes are only stored once. Defaults to ``None``.
+        """
+        for name in ("concrete_analysis_sections", "meshed_reinforcement_sections"):
+            self.set_meshes(
+                name=name, meshes=self.get_meshes(name=name, mesh_cache=mesh_cache)
+            )
+
     def plot_stress(
         self,
         title: str = "Stress",
@@ -2155,14 +3733,16 @@ class StressResult:
                 reinf_tick_same = False
 
             # plot the concrete stresses
+            conc_meshes = self.concrete_meshes
+
             for idx, sig in enumerate(self.concrete_stresses):
                 # check region has a force
                 if abs(self.concrete_forces[idx][0]) > 1e-8:
                     # create triangulation
                     triang_conc = tri.Triangulation(
-                        self.concrete_analysis_sections[idx].mesh_nodes[:, 0],
-                        self.concrete_analysis_sections[idx].mesh_nodes[:, 1],
-                        self.concrete_analysis_sections[idx].mesh_elements[:, 0:3],  # pyright: ignore
+                        conc_meshes[idx].mesh_nodes[:, 0],
+                        conc_meshes[idx].mesh_nodes[:, 1],
+                        conc_meshes[idx].mesh_elements,
                     )
 
                     # scale stress
@@ -2203,15 +3783,16 @@ class StressResult:
 
             # plot the meshed reinforcement stresses
             trictr_reinf = None
+            reinf_meshes = self.meshed_reinforcement_meshes
 
             for idx, sig in enumerate(self.meshed_reinforcement_stresses):
                 # check region has a force
                 if abs(self.meshed_reinforcement_forces[idx][0]) > 1e-8:
                     # create triangulation
                     triang_reinf = tri.Triangulation(
-                        self.meshed_reinforcement_sections[idx].mesh_nodes[:, 0],
-                        self.meshed_reinforcement_sections[idx].mesh_nodes[:, 1],
-                        self.meshed_reinforcement_sections[idx].mesh_elements[:, 0:3],  # pyright: ignore
+                        reinf_meshes[idx].mesh_nodes[:, 0],
+                        reinf_meshes[idx].mesh_nodes[:, 1],
+                        reinf_meshes[idx].mesh_elements,
                     )
 
                     # scale stress
@@ -2389,3 +3970,442 @@ class StressResult:
                 max_stress = max(max_stress, stress_list.max())
 
         return min_stress, max_stress
+
+    def to_npz(
+        self,
+        path: str | os.PathLike,
+    ) -> None:
+        """Saves the stress results to an uncompressed ``.npz`` file.
+
+        The meshes, outlines, stresses and forces of the analysis sections are stored
+        as packed arrays. The materials of the analysis sections are stored as indices
+        into the meshed geometries of the concrete section, and lumped reinforcement and
+        strand geometries as indices into the lumped geometries of the concrete section,
+        which must therefore be provided when loading the results.
+
+        Args:
+            path: File path
+
+        Raises:
+            ValueError: If a material or a lumped geometry does not belong to the
+                concrete section
+        """
+        # index of the first meshed geometry with each material
+        material_index: dict[int, int] = {}
+
+        for idx, geom in enumerate(self.concrete_section.meshed_geometries):
+            material_index.setdefault(id(geom.material), idx)
+
+        lumped_geoms = (
+            self.concrete_section.reinf_geometries_lumped
+            + self.concrete_section.strand_geometries
+        )
+        lumped_index = {id(geom): idx for idx, geom in enumerate(lumped_geoms)}
+        arrays = {
+            **_pack_stress_meshes(
+                name="concrete",
+                meshes=self.concrete_meshes,
+                stresses=self.concrete_stresses,
+                forces=self.concrete_forces,
+            ),
+            **_pack_stress_meshes(
+                name="meshed_reinforcement",
+                meshes=self.meshed_reinforcement_meshes,
+                stresses=self.meshed_reinforcement_stresses,
+                forces=self.meshed_reinforcement_forces,
+            ),
+        }
+
+        for name in ("concrete", "meshed_reinforcement"):
+            meshes: list[StressMesh] = getattr(self, f"{name}_meshes")
+
+            if any(id(mesh.material) not in material_index for mesh in meshes):
+                msg = f"{name} materials must belong to the concrete section."
+                raise ValueError(msg)
+
+            arrays[f"{name}_material_index"] = np.array(
+                [material_index[id(mesh.material)] for mesh in meshes], dtype=int
+            )
+
+        for name in ("lumped_reinforcement", "strand"):
+            geoms: list[CPGeom | CPPointBar] = getattr(self, f"{name}_geometries")
+
+            if any(id(geom) not in lumped_index for geom in geoms):
+                msg = f"{name} geometries must belong to the concrete section."
+                raise ValueError(msg)
+
+            arrays[f"{name}_index"] = np.array(
+                [lumped_index[id(geom)] for geom in geoms], dtype=int
+            )
+            arrays[f"{name}_stresses"] = np.array(
+                getattr(self, f"{name}_stresses"), dtype=float
+            )
+            arrays[f"{name}_strains"] = np.array(
+                getattr(self, f"{name}_strains"), dtype=float
+            )
+            arrays[f"{name}_forces"] = np.array(
+                getattr(self, f"{name}_forces"), dtype=float
+            ).reshape(-1, 3)
+
+        _save_npz(path=path, results=self, arrays=arrays)
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str | os.PathLike,
+        concrete_section: ConcreteSection,
+        mmap_mode: str | None = None,
+    ) -> StressResult:
+        """Loads stress results saved by :meth:`to_npz`.
+
+        The loaded stress results are compact (see :meth:`compact`), i.e. the analysis
+        sections are only rebuilt from the stored meshes and outlines on first access.
+        Materials and lumped geometries are taken from ``concrete_section``, which must
+        have the same geometries as the section the results were saved for.
+
+        Args:
+            path: File path
+            concrete_section: Concrete section the stress results were calculated for
+            mmap_mode: If not ``None``, memory-maps the arrays using the given mode,
+                see :class:`numpy.memmap`. Defaults to ``None``.
+
+        Raises:
+            ValueError: If the stored geometry indices are not valid for the concrete
+                section
+
+        Returns:
+            Stress results object
+        """
+        metadata, arrays = _load_npz(path=path, cls=cls, mmap_mode=mmap_mode)
+        meshed_geoms = concrete_section.meshed_geometries
+        lumped_geoms = (
+            concrete_section.reinf_geometries_lumped
+            + concrete_section.strand_geometries
+        )
+
+        for name, geoms in (
+            ("concrete_material", meshed_geoms),
+            ("meshed_reinforcement_material", meshed_geoms),
+            ("lumped_reinforcement", lumped_geoms),
+            ("strand", lumped_geoms),
+        ):
+            if np.any(arrays[f"{name}_index"] >= len(geoms)):
+                msg = f"The stored {name} indices are not valid for the concrete "
+                msg += "section."
+                raise ValueError(msg)
+
+        meshes = {}
+
+        for name, geometry_class in (
+            ("concrete", CPGeomConcrete),
+            ("meshed_reinforcement", CPGeom),
+        ):
+            meshes[name] = _unpack_stress_meshes(
+                name=name,
+                arrays=arrays,
+                materials=[
+                    meshed_geoms[idx].material
+                    for idx in arrays[f"{name}_material_index"].tolist()
+                ],
+                geometry_class=geometry_class,
+            )
+
+        lumped = {}
+
+        for name in ("lumped_reinforcement", "strand"):
+            lumped[f"{name}_geometries"] = [
+                lumped_geoms[idx] for idx in arrays[f"{name}_index"].tolist()
+            ]
+            lumped[f"{name}_stresses"] = arrays[f"{name}_stresses"].tolist()
+            lumped[f"{name}_strains"] = arrays[f"{name}_strains"].tolist()
+            lumped[f"{name}_forces"] = [
+                tuple(f) for f in arrays[f"{name}_forces"].tolist()
+            ]
+
+        conc_meshes, conc_sigs, conc_forces = meshes["concrete"]
+        reinf_meshes, reinf_sigs, reinf_forces = meshes["meshed_reinforcement"]
+        stress_result = cls(
+            default_units=metadata["default_units"],
+            concrete_section=concrete_section,
+            concrete_analysis_sections=[],
+            concrete_stresses=conc_sigs,
+            concrete_forces=conc_forces,
+            meshed_reinforcement_sections=[],
+            meshed_reinforcement_stresses=reinf_sigs,
+            meshed_reinforcement_forces=reinf_forces,
+            **lumped,
+        )
+        stress_result.set_meshes(name="concrete_analysis_sections", meshes=conc_meshes)
+        stress_result.set_meshes(
+            name="meshed_reinforcement_sections", meshes=reinf_meshes
+        )
+
+        return stress_result
+
+
+@dataclass
+class ElasticStressBasis:
+    """Class for storing the elastic stress basis of an uncracked or cracked section.
+
+    Stores the stresses and net actions resulting from a unit axial force and unit
+    bending moments about the x and y axes. As the elastic stress is linear in the
+    applied actions, the stresses for any load case are given by multiplying the basis
+    by the vector of actions (``n``, ``m_x``, ``m_y``).
+
+    Args:
+        concrete_analysis_sections: List of concrete analysis section objects
+        concrete_stresses: List of nodal stresses for unit actions for each concrete
+            analysis section [nodes x 3]
+        concrete_actions: Net force and moments about the x and y axes (rows) for unit
+            actions (columns) for each concrete analysis section [sections x 3 x 3]
+        meshed_reinforcement_sections: List of meshed reinforcement section objects
+        meshed_reinforcement_stresses: List of nodal stresses for unit actions for each
+            meshed reinforcement analysis section [nodes x 3]
+        meshed_reinforcement_actions: Net force and moments about the x and y axes
+            (rows) for unit actions (columns) for each meshed reinforcement analysis
+            section [sections x 3 x 3]
+        lumped_reinforcement_geometries: List of lumped reinforcement geometry objects
+        lumped_reinforcement_stresses: Stresses for unit actions for each lumped
+            reinforcement geometry [bars x 3]
+        lumped_reinforcement_positions: Position of each lumped reinforcement geometry
+            relative to the elastic centroid [bars x 2]
+        lumped_reinforcement_areas: Area of each lumped reinforcement geometry
+        lumped_reinforcement_elastic_moduli: Elastic modulus of each lumped
+            reinforcement geometry
+        lumped_reinforcement_displaced_moduli: Elastic modulus of the concrete
+            displaced by each lumped reinforcement geometry
+    """
+
+    concrete_analysis_sections: list[AnalysisSection]
+    concrete_stresses: list[np.ndarray]
+    concrete_actions: np.ndarray
+    meshed_reinforcement_sections: list[AnalysisSection]
+    meshed_reinforcement_stresses: list[np.ndarray]
+    meshed_reinforcement_actions: np.ndarray
+    lumped_reinforcement_geometries: list[CPGeom]
+    lumped_reinforcement_stresses: np.ndarray
+    lumped_reinforcement_positions: np.ndarray
+    lumped_reinforcement_areas: np.ndarray
+    lumped_reinforcement_elastic_moduli: np.ndarray
+    lumped_reinforcement_displaced_moduli: np.ndarray
+
+
+@dataclass
+class ElasticStressResults:
+    """Class for storing elastic stress results for many load cases.
+
+    Results are stored as arrays with the load case along the first axis. A
+    :class:`StressResult` for a single load case can be obtained by calling
+    :meth:`get_stress_result`. Moments and lever arms are computed about the elastic
+    centroid.
+
+    Args:
+        default_units: Default units to use for reporting
+        concrete_section: Concrete section the results were calculated for
+        basis: Elastic stress basis used to calculate the results
+        actions: Applied actions for each load case (``n``, ``m_x``, ``m_y``)
+            [cases x 3]
+        concrete_stresses: List of nodal stresses for each concrete analysis section
+            [cases x nodes]
+        concrete_actions: Net force and moments about the x and y axes (``n``,
+            ``m_x``, ``m_y``) for each concrete analysis section [cases x sections x 3]
+        meshed_reinforcement_stresses: List of nodal stresses for each meshed
+            reinforcement analysis section [cases x nodes]
+        meshed_reinforcement_actions: Net force and moments about the x and y axes
+            (``n``, ``m_x``, ``m_y``) for each meshed reinforcement analysis section
+            [cases x sections x 3]
+        lumped_reinforcement_stresses: Lumped reinforcement stresses [cases x bars]
+        lumped_reinforcement_strains: Lumped reinforcement strains [cases x bars]
+        lumped_reinforcement_forces: Net force and lever arm (``force``, ``d_x``,
+            ``d_y``) for each lumped reinforcement geometry [cases x bars x 3]
+        cracked_results: Cracked results the stresses were calculated for, ``None``
+            for uncracked stresses. Defaults to ``None``.
+    """
+
+    # units
+    default_units: UnitDisplay
+
+    concrete_section: ConcreteSection
+    basis: ElasticStressBasis
+    actions: np.ndarray
+    concrete_stresses: list[np.ndarray]
+    concrete_actions: np.ndarray
+    meshed_reinforcement_stresses: list[np.ndarray]
+    meshed_reinforcement_actions: np.ndarray
+    lumped_reinforcement_stresses: np.ndarray
+    lumped_reinforcement_strains: np.ndarray
+    lumped_reinforcement_forces: np.ndarray
+    cracked_results: CrackedResults | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        """Returns the number of load cases.
+
+        Returns:
+            Number of load cases
+        """
+        return len(self.actions)
+
+    def get_stress_result(
+        self,
+        idx: int,
+    ) -> StressResult:
+        """Returns the stress results for a single load case.
+
+        The stress results are recalculated by calling
+        :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_uncracked_stress`
+        or
+        :meth:`~concreteproperties.concrete_section.ConcreteSection.calculate_cracked_stress`
+        for the load case, such that the meshed geometries are split at the neutral
+        axis and the net force and point of action of each geometry are consistent.
+
+        Args:
+            idx: Index of the load case
+
+        Returns:
+            Stress results object
+        """
+        n, m_x, m_y = (float(action) for action in self.actions[idx])
+
+        if self.cracked_results is None:
+            return self.concrete_section.calculate_uncracked_stress(
+                n=n, m_x=m_x, m_y=m_y
+            )
+
+        return self.concrete_section.calculate_cracked_stress(
+            cracked_results=self.cracked_results, n=n, m=float(np.hypot(m_x, m_y))
+        )
+
+    def sum_forces(self) -> np.ndarray:
+        """Returns the sum of the internal forces for each load case.
+
+        Returns:
+            Sum of internal forces [cases]
+        """
+        return (
+            self.concrete_actions[..., 0].sum(axis=1)
+            + self.meshed_reinforcement_actions[..., 0].sum(axis=1)
+            + self.lumped_reinforcement_forces[..., 0].sum(axis=1)
+        )
+
+    def sum_moments(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the sum of the internal moments for each load case.
+
+        Returns:
+            Sum of internal moments about each axis and resultant moment (``m_x``,
+            ``m_y``, ``m``) [cases]
+        """
+        lumped = self.lumped_reinforcement_forces
+        moment_sum_x = (
+            self.concrete_actions[..., 1].sum(axis=1)
+            + self.meshed_reinforcement_actions[..., 1].sum(axis=1)
+            + (lumped[..., 0] * lumped[..., 2]).sum(axis=1)
+        )
+        moment_sum_y = (
+            self.concrete_actions[..., 2].sum(axis=1)
+            + self.meshed_reinforcement_actions[..., 2].sum(axis=1)
+            + (lumped[..., 0] * lumped[..., 1]).sum(axis=1)
+        )
+
+        return moment_sum_x, moment_sum_y, np.hypot(moment_sum_x, moment_sum_y)
+
+    def get_concrete_stress_limits(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the minimum and maximum concrete stress for each load case.
+
+        Returns:
+            Minimum concrete stress, maximum concrete stress [cases]
+        """
+        if not self.concrete_stresses:
+            return np.zeros(len(self)), np.zeros(len(self))
+
+        stresses = np.concatenate(self.concrete_stresses, axis=1)
+
+        return stresses.min(axis=1), stresses.max(axis=1)
+
+
+@dataclass
+class ServiceStressResults:
+    """Class for storing service stress results for many bending moments.
+
+    Args:
+        default_units: Default units to use for reporting
+        moment_curvature_results: Moment-curvature results used in the analysis
+        kappa: Curvature for each load case
+        eps0: Converged strain at the extreme compressive fibre for each load case
+        stress_results: Stress results object for each load case
+    """
+
+    # units
+    default_units: UnitDisplay
+
+    moment_curvature_results: MomentCurvatureResults
+    kappa: np.ndarray
+    eps0: np.ndarray
+    stress_results: list[StressResult]
+
+    def __len__(self) -> int:
+        """Returns the number of load cases.
+
+        Returns:
+            Number of load cases
+        """
+        return len(self.stress_results)
+
+    def __getitem__(
+        self,
+        idx: int,
+    ) -> StressResult:
+        """Returns the stress results for a single load case.
+
+        Args:
+            idx: Index of the load case
+
+        Returns:
+            Stress results object
+        """
+        return self.stress_results[idx]
+
+    @property
+    def lumped_reinforcement_stresses(self) -> np.ndarray:
+        """Lumped reinforcement stresses for each load case.
+
+        Returns:
+            Lumped reinforcement stresses [cases x bars]
+        """
+        return np.array(
+            [sr.lumped_reinforcement_stresses for sr in self.stress_results],
+            dtype=float,
+        ).reshape(len(self), -1)
+
+    def sum_forces(self) -> np.ndarray:
+        """Returns the sum of the internal forces for each load case.
+
+        Returns:
+            Sum of internal forces [cases]
+        """
+        return np.array([sr.sum_forces() for sr in self.stress_results], dtype=float)
+
+    def sum_moments(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the sum of the internal moments for each load case.
+
+        Returns:
+            Sum of internal moments about each axis and resultant moment (``m_x``,
+            ``m_y``, ``m``) [cases]
+        """
+        moments = np.array(
+            [sr.sum_moments() for sr in self.stress_results], dtype=float
+        ).reshape(-1, 3)
+
+        return moments[:, 0], moments[:, 1], moments[:, 2]
+
+    def get_concrete_stress_limits(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the minimum and maximum concrete stress for each load case.
+
+        Returns:
+            Minimum concrete stress, maximum concrete stress [cases]
+        """
+        limits = np.array(
+            [sr.get_concrete_stress_limits() for sr in self.stress_results],
+            dtype=float,
+        ).reshape(-1, 2)
+
+        return limits[:, 0], limits[:, 1]
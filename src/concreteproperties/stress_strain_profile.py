@@ -26,6 +26,30 @@ if TYPE_CHECKING:
     from concreteproperties.post import UnitDisplay
 
 
+@dataclass
+class ProfileMetadata:
+    """Class for storing precomputed stress-strain profile metadata.
+
+    Args:
+        unique_strains: Ordered list of unique strains
+        ultimate_compressive_strain: Largest compressive strain
+        ultimate_tensile_strain: Largest tensile strain
+        compressive_strength: Most positive stress
+        tensile_strength: Most negative stress
+        stress_function: Piecewise linear stress interpolation function
+        elastic_modulus: Elastic modulus, evaluated on first request. Defaults to
+            ``None``.
+    """
+
+    unique_strains: list[float]
+    ultimate_compressive_strain: float
+    ultimate_tensile_strain: float
+    compressive_strength: float
+    tensile_strength: float
+    stress_function: interp1d
+    elastic_modulus: float | None = None
+
+
 @dataclass
 class StressStrainProfile:
     """Abstract base class for a material stress-strain profile.
@@ -75,6 +99,65 @@ class StressStrainProfile:
 
                 prev_strain = self.strains[idx]
 
+    def __setattr__(
+        self,
+        name: str,
+        value: object,
+    ) -> None:
+        """Sets an attribute, discarding any compiled metadata.
+
+        Args:
+            name: Attribute name
+            value: Attribute value
+        """
+        # reassigning a public attribute invalidates the compiled metadata
+        if not name.startswith("_"):
+            self.__dict__.pop("_metadata", None)
+
+        super().__setattr__(name, value)
+
+    def compile(self) -> ProfileMetadata:
+        """Precomputes and stores the stress-strain profile metadata.
+
+        The metadata (unique strains, ultimate strains, strengths, elastic modulus and
+        stress interpolation function) is compiled on first use and discarded whenever
+        an attribute of the profile is reassigned. If ``strains`` or ``stresses`` are
+        mutated in place, this method must be called to recompile the metadata.
+
+        Returns:
+            Compiled profile metadata
+        """
+        self._metadata = ProfileMetadata(
+            unique_strains=sorted(set(self.strains)),
+            ultimate_compressive_strain=max(self.strains),
+            ultimate_tensile_strain=min(self.strains),
+            compressive_strength=max(self.stresses),
+            tensile_strength=min(self.stresses),
+            stress_function=interp1d(
+                x=self.strains,
+                y=self.stresses,
+                kind="linear",
+                fill_value="extrapolate",  # pyright: ignore [reportArgumentType]
+            ),
+        )
+
+        return self._metadata
+
+    def get_metadata(self) -> ProfileMetadata:
+        """Returns the compiled stress-strain profile metadata.
+
+        Compiles the metadata if it has not yet been compiled.
+
+        Returns:
+            Compiled profile metadata
+        """
+        metadata = self.__dict__.get("_metadata")
+
+        if metadata is None:
+            metadata = self.compile()
+
+        return metadata
+
     def get_stress(
         self,
         strain: float,
@@ -87,19 +170,51 @@ class StressStrainProfile:
         Returns:
             Stress
         """
-        # create interpolation function
-        stress_function = interp1d(
-            x=self.strains,
-            y=self.stresses,
-            kind="linear",
-            fill_value="extrapolate",  # pyright: ignore [reportArgumentType]
-        )
+        return self.get_metadata().stress_function(strain)
+
+    def get_stresses(
+        self,
+        strains: np.ndarray,
+    ) -> np.ndarray:
+        """Returns an array of stresses given an array of strains.
+
+        Profiles that override :meth:`get_stress` are evaluated point by point, unless
+        they also override this method.
+
+        Args:
+            strains: Strains at which to return the stresses
+
+        Returns:
+            Stresses
+        """
+        strains = np.asarray(strains, dtype=float)
+
+        if type(self).get_stress is not StressStrainProfile.get_stress:
+            return np.array(
+                [self.get_stress(strain=strain) for strain in strains.flat], dtype=float
+            ).reshape(strains.shape)
 
-        return stress_function(strain)
+        return np.asarray(self.get_metadata().stress_function(strains), dtype=float)
 
     def get_elastic_modulus(self) -> float:
         """Returns the elastic modulus of the stress-strain profile.
 
+        Raises:
+            ValueError: Elastic modulus is zero
+
+        Returns:
+            Elastic modulus
+        """
+        metadata = self.get_metadata()
+
+        if metadata.elastic_modulus is None:
+            metadata.elastic_modulus = self.calculate_elastic_modulus()
+
+        return metadata.elastic_modulus
+
+    def calculate_elastic_modulus(self) -> float:
+        """Calculates the elastic modulus of the stress-strain profile.
+
         Raises:
             ValueError: Elastic modulus is zero
 
@@ -135,7 +250,7 @@ class StressStrainProfile:
         Returns:
             Compressive strength
         """
-        return max(self.stresses)
+        return self.get_metadata().compressive_strength
 
     def get_tensile_strength(self) -> float:
         """Returns the most negative stress.
@@ -143,7 +258,7 @@ class StressStrainProfile:
         Returns:
             Tensile strength
         """
-        return min(self.stresses)
+        return self.get_metadata().tensile_strength
 
     def get_yield_strength(self) -> float:
         """Returns the yield strength of the stress-strain profile.
@@ -160,7 +275,7 @@ class StressStrainProfile:
         Returns:
             Ultimate strain
         """
-        return max(self.strains)
+        return self.get_metadata().ultimate_compressive_strain
 
     def get_ultimate_tensile_strain(self) -> float:
         """Returns the largest tensile strain.
@@ -168,7 +283,7 @@ class StressStrainProfile:
         Returns:
             Ultimate strain
         """
-        return min(self.strains)
+        return self.get_metadata().ultimate_tensile_strain
 
     def get_unique_strains(self) -> list[float]:
         """Returns an ordered list of unique strains.
@@ -176,10 +291,7 @@ class StressStrainProfile:
         Returns:
             Ordered list of unique strains
         """
-        unique_strains = list(set(self.strains))
-        unique_strains.sort()
-
-        return unique_strains
+        return self.get_metadata().unique_strains
 
     def print_properties(
         self,
@@ -983,6 +1095,25 @@ class RectangularStressBlock(ConcreteUltimateProfile):
         else:
             return 0
 
+    def get_stresses(
+        self,
+        strains: np.ndarray,
+    ) -> np.ndarray:
+        """Returns an array of stresses given an array of strains.
+
+        Overrides parent method with small tolerance to aid ultimate stress generation
+        at nodes.
+
+        Args:
+            strains: Strains at which to return the stresses
+
+        Returns:
+            Stresses
+        """
+        strains = np.asarray(strains, dtype=float)
+
+        return np.where(strains >= self.strains[1] - 1e-8, self.stresses[2], 0.0)
+
 
 @dataclass
 class BilinearStressStrain(ConcreteUltimateProfile):
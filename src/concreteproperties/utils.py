@@ -8,6 +8,7 @@ import numpy as np
 from rich.progress import BarColumn, Progress, ProgressColumn, SpinnerColumn, TextColumn
 from rich.table import Column
 from rich.text import Text
+from shapely import MultiPoint, Polygon
 
 from concreteproperties.pre import CPGeomConcrete
 
@@ -19,19 +20,20 @@ if TYPE_CHECKING:
 
 
 def get_service_strain(
-    point: tuple[float, float],
+    point: tuple[float, float] | tuple[np.ndarray, np.ndarray],
     ecf: tuple[float, float],
     eps0: float,
     theta: float,
     kappa: float,
-) -> float:
+) -> float | np.ndarray:
     r"""Returns the service strain.
 
     Determines the strain at point ``point`` given curvature ``kappa`` and neutral axis
     angle ``theta``. Positive strain is compression.
 
     Args:
-        point: Point at which to evaluate the strain
+        point: Point at which to evaluate the strain, or arrays of x and y
+            coordinates of many points
         ecf: Global coordinate of the extreme compressive fibre
         eps0: Strain at top fibre
         theta: Angle (in radians) the neutral axis makes with the horizontal axis
@@ -39,7 +41,7 @@ def get_service_strain(
         kappa: Curvature
 
     Returns:
-        Service strain
+        Service strain (an array if ``point`` contains arrays)
     """
     # convert point to local coordinates
     _, v = global_to_local(theta=theta, x=point[0], y=point[1])
@@ -54,19 +56,20 @@ def get_service_strain(
 
 
 def get_ultimate_strain(
-    point: tuple[float, float],
+    point: tuple[float, float] | tuple[np.ndarray, np.ndarray],
     point_na: tuple[float, float],
     d_n: float,
     theta: float,
     ultimate_strain: float,
-) -> float:
+) -> float | np.ndarray:
     r"""Returns the ultimate strain.
 
     Determines the strain at point ``point`` given neutral axis depth ``d_n`` and
     neutral axis angle ``theta``. Positive strain is compression.
 
     Args:
-        point: Point at which to evaluate the strain
+        point: Point at which to evaluate the strain, or arrays of x and y
+            coordinates of many points
         point_na: Point on the neutral axis
         d_n: Depth of the neutral axis from the extreme compression fibre
         theta: Angle (in radians) the neutral axis makes with the horizontal
@@ -74,7 +77,7 @@ def get_ultimate_strain(
         ultimate_strain: Concrete strain at failure
 
     Returns:
-        Ultimate strain
+        Ultimate strain (an array if ``point`` contains arrays)
     """
     # convert point to local coordinates
     _, v = global_to_local(theta=theta, x=point[0], y=point[1])
@@ -271,8 +274,32 @@ def split_geom_at_strains_ultimate(
     return split_geoms
 
 
+def calculate_convex_hull(
+    points: list[tuple[float, float]] | np.ndarray,
+) -> np.ndarray:
+    """Returns the vertices of the convex hull of a set of points.
+
+    The extreme fibres of a section for any neutral axis angle always lie on the convex
+    hull, so the hull vertices can be used in place of all the section points when
+    searching for extreme fibres.
+
+    Args:
+        points: Points for which to calculate the convex hull
+
+    Returns:
+        Convex hull vertices [n x 2]
+    """
+    hull = MultiPoint(np.asarray(points, dtype=float)).convex_hull
+
+    # degenerate hulls (points or lines)
+    if not isinstance(hull, Polygon):
+        return np.array(hull.coords)
+
+    return np.array(hull.exterior.coords)[:-1]
+
+
 def calculate_extreme_fibre(
-    points: list[tuple[float, float]],
+    points: list[tuple[float, float]] | np.ndarray,
     theta: float,
 ) -> tuple[tuple[float, float], float]:
     r"""Returns the extreme fibre location.
@@ -289,33 +316,48 @@ def calculate_extreme_fibre(
         Global coordinate of the extreme compression fibre (``x``, ``y``) and the
         neutral axis depth at the extreme tensile fibre
     """
-    # initialise min/max variable & point
-    max_pt = points[0]
-    _, v = global_to_local(theta=theta, x=points[0][0], y=points[0][1])
-    v_min = v
-    v_max = v
+    pts = np.asarray(points, dtype=float)
+
+    # determine the coordinate of the points wrt the local axis
+    v = pts[:, 1] * np.cos(theta) - pts[:, 0] * np.sin(theta)
+    idx_max = int(np.argmax(v))
 
-    # loop through all points
-    for point in points[1:]:
-        # determine the coordinate of the point wrt the local axis
-        _, v = global_to_local(theta=theta, x=point[0], y=point[1])
+    # calculate depth of neutral axis at tensile fibre
+    d_t = float(v[idx_max] - v.min())
 
-        # update the min/max & point where necessary
-        if v < v_min:
-            v_min = v
+    return (float(pts[idx_max, 0]), float(pts[idx_max, 1])), d_t
 
-        if v > v_max:
-            v_max = v
-            max_pt = point
 
-    # calculate depth of neutral axis at tensile fibre
-    d_t = v_max - v_min
+def calculate_extreme_fibres(
+    points: list[tuple[float, float]] | np.ndarray,
+    thetas: list[float] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Returns the extreme fibre locations for many neutral axis angles.
 
-    return max_pt, d_t
+    Vectorised version of :func:`calculate_extreme_fibre`.
+
+    Args:
+        points: Points over which to search for extreme fibres
+        thetas: Angles (in radians) the neutral axis makes with the horizontal axis
+            (:math:`-\pi \leq \theta \leq \pi`)
+
+    Returns:
+        Global coordinates of the extreme compression fibres [n x 2] and the neutral
+        axis depths at the extreme tensile fibres [n]
+    """
+    pts = np.asarray(points, dtype=float)
+    thetas = np.atleast_1d(np.asarray(thetas, dtype=float))
+
+    # local v-coordinates of every point for every angle [n_points x n_thetas]
+    v = np.outer(pts[:, 1], np.cos(thetas)) - np.outer(pts[:, 0], np.sin(thetas))
+    idx_max = np.argmax(v, axis=0)
+    d_t = v[idx_max, np.arange(len(thetas))] - v.min(axis=0)
+
+    return pts[idx_max], d_t
 
 
 def calculate_max_bending_depth(
-    points: list[tuple[float, float]],
+    points: list[tuple[float, float]] | np.ndarray,
     c_local_v: float,
     theta: float,
 ) -> float:
@@ -333,16 +375,123 @@ def calculate_max_bending_depth(
     Returns:
         Maximum bending depth, returns zero if distance is negative
     """
-    max_bending_depth = 0
+    pts = np.asarray(points, dtype=float)
+
+    # determine the coordinate of the points wrt the local axis
+    v = pts[:, 1] * np.cos(theta) - pts[:, 0] * np.sin(theta)
+
+    return max(float(c_local_v - v.min()), 0)
 
-    # loop through all points
-    for point in points:
-        # determine the coordinate of the point wrt the local axis
-        _, v = global_to_local(theta=theta, x=point[0], y=point[1])
 
-        max_bending_depth = max(c_local_v - v, max_bending_depth)
+def calculate_ring_moments(
+    coords: np.ndarray,
+) -> tuple[float, float, float, float, float, float]:
+    """Calculates the area moments of a closed polygon ring.
+
+    Uses the closed-form (shoelace) expressions for the area, first and second moments
+    of area of a simple polygon. The sign of the results follows the orientation of the
+    ring (positive for counter-clockwise rings).
+
+    Args:
+        coords: Ring coordinates [n x 2], the first point may or may not be repeated at
+            the end of the ring
+
+    Returns:
+        Signed area properties (``area``, ``qx``, ``qy``, ``ixx_g``, ``iyy_g``,
+        ``ixy_g``)
+    """
+    x0 = coords[:, 0]
+    y0 = coords[:, 1]
+    x1 = np.roll(x0, -1)
+    y1 = np.roll(y0, -1)
+    cross = x0 * y1 - x1 * y0
+
+    area = cross.sum() / 2
+    qx = ((y0 + y1) * cross).sum() / 6
+    qy = ((x0 + x1) * cross).sum() / 6
+    ixx = ((y0 * y0 + y0 * y1 + y1 * y1) * cross).sum() / 12
+    iyy = ((x0 * x0 + x0 * x1 + x1 * x1) * cross).sum() / 12
+    ixy = ((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross).sum() / 24
 
-    return max_bending_depth
+    return area, qx, qy, ixx, iyy, ixy
+
+
+def clip_ring(
+    coords: np.ndarray,
+    theta: float,
+    v_na: float,
+) -> np.ndarray:
+    r"""Clips a polygon ring to the compressive side of a neutral axis.
+
+    Retains the part of the ring for which the local ``v`` coordinate is greater than or
+    equal to ``v_na``. The clipped ring may contain degenerate edges along the neutral
+    axis, these do not contribute to the closed-form moments of the ring.
+
+    Args:
+        coords: Ring coordinates [n x 2], the closing point is not repeated
+        theta: Angle (in radians) the neutral axis makes with the horizontal axis
+            (:math:`-\pi \leq \theta \leq \pi`)
+        v_na: Local ``v`` coordinate of the neutral axis
+
+    Returns:
+        Clipped ring coordinates [m x 2]
+    """
+    # signed distance of each vertex from the neutral axis
+    s = coords[:, 1] * np.cos(theta) - coords[:, 0] * np.sin(theta) - v_na
+    keep = s >= 0
+
+    # entire ring above or below the neutral axis
+    if keep.all():
+        return coords
+
+    if not keep.any():
+        return coords[:0]
+
+    # edges that cross the neutral axis and their intersection points
+    coords_next = np.roll(coords, -1, axis=0)
+    s_next = np.roll(s, -1)
+    cross = keep != (s_next >= 0)
+    t = np.divide(s, s - s_next, out=np.zeros_like(s), where=cross)
+    intersections = coords + t[:, np.newaxis] * (coords_next - coords)
+
+    # interleave retained vertices and intersection points in ring order
+    candidates = np.stack([coords, intersections], axis=1)
+    mask = np.stack([keep, cross], axis=1)
+
+    return candidates[mask]
+
+
+def calculate_polygon_moments(
+    geom: CPGeom,
+    theta: float | None = None,
+    v_na: float | None = None,
+) -> tuple[float, float, float, float, float, float]:
+    r"""Calculates the area moments of a geometry without meshing.
+
+    Sums the closed-form moments of the oriented rings of the geometry (see
+    :func:`calculate_ring_moments`). If ``theta`` and ``v_na`` are provided, only the
+    part of the geometry on the compressive side of the neutral axis is considered.
+
+    Args:
+        geom: Geometry for which to calculate the moments of area
+        theta: Angle (in radians) the neutral axis makes with the horizontal axis
+            (:math:`-\pi \leq \theta \leq \pi`). Defaults to ``None``.
+        v_na: Local ``v`` coordinate of the neutral axis. Defaults to ``None``.
+
+    Returns:
+        Area properties (``area``, ``qx``, ``qy``, ``ixx_g``, ``iyy_g``, ``ixy_g``)
+    """
+    moments = np.zeros(6)
+
+    for ring in geom.rings:
+        if theta is not None and v_na is not None:
+            ring = clip_ring(coords=ring, theta=theta, v_na=v_na)
+
+        moments += calculate_ring_moments(coords=ring)
+
+    area, qx, qy, ixx_g, iyy_g, ixy_g = moments.tolist()
+
+    return area, qx, qy, ixx_g, iyy_g, ixy_g
 
 
 def gauss_points(n: float) -> list[list[float]]:
@@ -422,24 +571,15 @@ def calculate_local_extents(
     Returns:
         Local extents (``x11_max``, ``x11_min``, ``y22_max``, ``y22_min``)
     """
-    # initialise min, max variables
-    pt0 = geometry.points[0]
-    x11, y22 = global_to_local(theta=theta, x=pt0[0] - cx, y=pt0[1] - cy)
-    x11_max = x11
-    x11_min = x11
-    y22_max = y22
-    y22_min = y22
-
-    # loop through all points in geometry
-    for pt in geometry.points[1:]:
-        # determine the coordinate of the point wrt the principal axis
-        x11, y22 = global_to_local(theta=theta, x=pt[0] - cx, y=pt[1] - cy)
-
-        # update the mins and maxes where necessary
-        x11_max = max(x11_max, x11)
-        x11_min = min(x11_min, x11)
-        y22_max = max(y22_max, y22)
-        y22_min = min(y22_min, y22)
+    pts = np.asarray(geometry.points, dtype=float)
+
+    # determine the coordinate of the points wrt the principal axis
+    x11, y22 = global_to_local(theta=theta, x=pts[:, 0] - cx, y=pts[:, 1] - cy)
+
+    x11_max = float(x11.max())
+    x11_min = float(x11.min())
+    y22_max = float(y22.max())
+    y22_min = float(y22.min())
 
     return x11_max, x11_min, y22_max, y22_min
 
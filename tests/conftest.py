@@ -0,0 +1,62 @@
+"""Shared fixtures for the tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sectionproperties.pre.library.concrete_sections import concrete_rectangular_section
+
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.design_codes.as3600 import AS3600
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def create_beam_section(design_code: AS3600 | None = None) -> ConcreteSection:
+    """Creates a 400 x 600 reinforced concrete beam.
+
+    The beam has 40 MPa concrete, 3N20 top bars and 3N24 bottom bars. The function is
+    defined at module level so that it can be sent to batch worker processes.
+
+    Args:
+        design_code: Design code to create the materials with and to assign the
+            section to. If ``None``, the materials are created with a new
+            :class:`AS3600` object. Defaults to ``None``.
+
+    Returns:
+        ConcreteSection object
+    """
+    material_code = AS3600() if design_code is None else design_code
+    geom = concrete_rectangular_section(
+        d=600,
+        b=400,
+        dia_top=20,
+        area_top=310,
+        n_top=3,
+        c_top=40,
+        dia_bot=24,
+        area_bot=450,
+        n_bot=3,
+        c_bot=40,
+        n_circle=8,
+        conc_mat=material_code.create_concrete_material(compressive_strength=40),
+        steel_mat=material_code.create_steel_material(),
+    )
+    concrete_section = ConcreteSection(geom)
+
+    if design_code is not None:
+        design_code.assign_concrete_section(concrete_section=concrete_section)
+
+    return concrete_section
+
+
+@pytest.fixture(scope="session")
+def beam_factory() -> Callable[..., ConcreteSection]:
+    """Returns the factory of the reinforced concrete beam shared by the tests.
+
+    Returns:
+        :func:`create_beam_section`
+    """
+    return create_beam_section
@@ -0,0 +1,133 @@
+"""Tests for the AS3600 class."""
+
+import numpy as np
+import pytest
+
+from concreteproperties.design_codes.as3600 import AS3600
+
+
+@pytest.mark.parametrize("n_design", [-5e5, 0, 1e6, 5.8e6])
+def test_interaction_anchors(beam_factory, n_design):
+    """Tests ultimate bending capacity using cached interaction diagram anchors."""
+    design_code = AS3600()
+    beam_factory(design_code)
+    theta = 0.4
+
+    f_ult_res, ult_res, phi = design_code.ultimate_bending_capacity(
+        theta=theta, n_design=n_design
+    )
+
+    # anchors are cached per theta
+    anchors = design_code.get_interaction_anchors(theta=theta)
+    assert design_code.get_interaction_anchors(theta=theta) is anchors
+    assert pytest.approx(anchors.squash.n) == design_code.squash_load
+    assert pytest.approx(anchors.tensile.n) == design_code.tensile_load
+
+    # compare with the factored points of the full interaction diagram
+    f_mi_res, _, _ = design_code.moment_interaction_diagram(
+        theta=theta, control_points=[("N", 0.0)], n_points=2, progress_bar=False
+    )
+
+    def factor(n):
+        return design_code.capacity_reduction_factor(
+            n_u=n,
+            n_ub=anchors.n_ub,
+            n_uot=design_code.tensile_load,
+            k_uo=anchors.k_uo,
+            phi_0=0.6,
+        )
+
+    decomp = anchors.decomp
+    pure = anchors.pure
+    assert pytest.approx(f_mi_res.results[1].n) == decomp.n * factor(decomp.n)
+    assert pytest.approx(f_mi_res.results[-2].m_x) == pure.m_x * factor(pure.n)
+
+    assert pytest.approx(f_ult_res.n, rel=1e-5, abs=10) == n_design
+    assert pytest.approx(f_ult_res.m_x) == phi * ult_res.m_x
+
+
+@pytest.mark.parametrize("reinforcement_class", ["N", "L"])
+def test_capacity_reduction_factor_vectorised(reinforcement_class):
+    """Tests array evaluation and closed-form solution of the capacity factor."""
+    design_code = AS3600()
+    design_code.reinforcement_class = reinforcement_class
+    n_ub = 2.5e6
+    n_uot = -1.2e6
+    k_uo = 0.25
+    phi_0 = 0.6
+
+    n_u = np.linspace(-1.2e6, 4e6, 27)
+    phis = design_code.capacity_reduction_factor(
+        n_u=n_u, n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
+    )
+
+    for n, phi in zip(n_u, phis, strict=True):
+        assert pytest.approx(phi) == design_code.capacity_reduction_factor(
+            n_u=float(n), n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
+        )
+
+    # phi = phi(N* / phi) for each design axial force
+    n_design = np.linspace(-0.9e6, 3e6, 27)
+    phis = design_code.design_capacity_reduction_factor(
+        n_design=n_design, n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
+    )
+    check = design_code.capacity_reduction_factor(
+        n_u=n_design / phis, n_ub=n_ub, n_uot=n_uot, k_uo=k_uo, phi_0=phi_0
+    )
+
+    assert pytest.approx(check) == phis
+    assert np.all((phis >= phi_0) & (phis <= 0.85))
+
+
+def test_check_load_cases(beam_factory):
+    """Tests checking many load cases against interpolated capacities."""
+    design_code = AS3600()
+    beam_factory(design_code)
+
+    load_cases = np.array(
+        [
+            [1e6, 2e8, 0],
+            [3e6, -1e8, 5e7],
+            [-3e5, 0, -1.5e8],
+            [2e6, 4.6e8, 0],
+            [1e7, 1e8, 0],
+        ]
+    )
+    check = design_code.check_load_cases(load_cases=load_cases, refine_band=0.1)
+    assert list(check.case) == list(range(len(load_cases)))
+    assert check.analysis_type is None
+
+    # interpolated capacities against exact capacities
+    for idx, (n, m_x, m_y) in enumerate(load_cases[:4]):
+        if m_x:
+            f_ult_res, _, _ = design_code.ultimate_bending_capacity(
+                theta=0 if m_x > 0 else np.pi, n_design=n
+            )
+            assert pytest.approx(check.phi_m_ux[idx], rel=5e-3) == abs(f_ult_res.m_x)
+
+        if m_y:
+            f_ult_res, _, _ = design_code.ultimate_bending_capacity(
+                theta=-np.pi / 2 if m_y > 0 else np.pi / 2, n_design=n
+            )
+            assert pytest.approx(check.phi_m_uy[idx], rel=5e-3) == abs(f_ult_res.m_y)
+
+    # uniaxial utilisation
+    assert pytest.approx(check.utilisation[0]) == 2e8 / check.phi_m_ux[0]
+    assert check.util_y[0] == 0
+
+    # biaxial utilisation
+    a = check.alpha_n[1]
+    assert 1 <= a <= 2
+    assert pytest.approx(check.utilisation[1]) == (
+        check.util_x[1] ** a + check.util_y[1] ** a
+    ) ** (1 / a)
+
+    # load cases near the capacity boundary are calculated exactly
+    assert check.refined[3]
+    assert not check.refined[0]
+
+    # axial force greater than the squash load
+    assert np.isinf(check.utilisation[4])
+
+    with pytest.raises(ValueError, match="three columns"):
+        design_code.check_load_cases(load_cases=np.zeros((2, 2)))
@@ -0,0 +1,192 @@
+"""Tests for the batch runner."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import concreteproperties.results as res
+from concreteproperties.batch import BatchJob, NpzSink, iter_batch, run_batch
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.pre import create_lumped_bars
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def create_jobs(
+    section: Callable[[], ConcreteSection],
+) -> list[BatchJob]:
+    """Creates a list of jobs, one of which fails.
+
+    Args:
+        section: Function returning the concrete section to analyse
+
+    Returns:
+        List of jobs
+    """
+    return [
+        BatchJob(
+            section=section,
+            method="moment_interaction_diagram",
+            kwargs={"n_points": 8},
+            job_id="mi",
+        ),
+        BatchJob(
+            section=section,
+            method="biaxial_bending_diagram",
+            kwargs={"n_points": 8},
+            job_id="bb",
+        ),
+        BatchJob(section=section, method="calculate_cracked_properties"),
+        # axial force exceeds the squash load
+        BatchJob(
+            section=section,
+            method="ultimate_bending_capacity",
+            kwargs={"n": 1e9},
+        ),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_iter_batch(beam_factory, max_workers):
+    """Tests running a batch of jobs in the current process and in a process pool."""
+    batch_results = sorted(
+        iter_batch(
+            jobs=create_jobs(section=beam_factory),
+            max_workers=max_workers,
+            chunk_size=3,
+        ),
+        key=lambda r: r.index,
+    )
+
+    assert [r.job_id for r in batch_results] == ["mi", "bb", 2, 3]
+    assert [r.success for r in batch_results] == [True, True, True, False]
+    assert isinstance(batch_results[0].result, res.MomentInteractionResults)
+    assert isinstance(batch_results[2].result, res.CrackedResults)
+    assert batch_results[3].error.startswith("AnalysisError")
+
+    # results match a direct analysis
+    cracked_res = beam_factory().calculate_cracked_properties()
+    assert pytest.approx(batch_results[2].result.m_cr) == cracked_res.m_cr
+
+
+def test_batch_timeout(beam_factory):
+    """Tests jobs exceeding the time limit."""
+    calls = []
+
+    def create_slow_section() -> ConcreteSection:
+        calls.append(None)
+        time.sleep(0.1)
+
+        return beam_factory()
+
+    jobs = [
+        BatchJob(
+            section=create_slow_section,
+            method="moment_interaction_diagram",
+            kwargs={"n_points": 200},
+        ),
+        BatchJob(section=create_slow_section, method="get_gross_properties"),
+        BatchJob(section=create_slow_section, method="get_gross_properties"),
+    ]
+    batch_results = list(iter_batch(jobs=jobs, max_workers=0, timeout=0.05))
+
+    assert batch_results[0].error.startswith("BatchTimeoutError")
+    assert batch_results[1].success
+    assert batch_results[2].success
+
+    # creating the section does not count towards the time limit, and the section is
+    # created again after a job times out
+    assert len(calls) == 2
+
+
+def test_run_batch_npz_sink(beam_factory, tmp_path):
+    """Tests streaming the results of a batch to a directory."""
+    n_success, n_failed = run_batch(
+        jobs=create_jobs(section=beam_factory),
+        sink=NpzSink(directory=tmp_path),
+        max_workers=0,
+    )
+
+    assert (n_success, n_failed) == (3, 1)
+
+    records = [
+        json.loads(line) for line in (tmp_path / "jobs.jsonl").read_text().splitlines()
+    ]
+
+    assert [r["file"] for r in records] == ["mi.npz", "bb.npz", "2.npz", None]
+    assert records[3]["error"].startswith("AnalysisError")
+
+    mi_res = res.MomentInteractionResults.from_npz(tmp_path / "mi.npz")
+    assert len(mi_res.results) > 0
+
+
+def test_section_snapshot(beam_factory, monkeypatch):
+    """Tests rehydrating a concrete section from a snapshot."""
+    section = beam_factory()
+    section = ConcreteSection(
+        section.compound_geometry,
+        lumped_bars=create_lumped_bars(
+            area=200,
+            material=section.reinf_geometries_lumped[0].material,  # pyright: ignore
+            x=[100, 300],
+            y=[300, 300],
+        ),
+    )
+    snapshot = section.snapshot()
+
+    # gross properties are restored, not recalculated
+    def calculate_gross_properties(self):
+        msg = "gross properties recalculated"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(
+        ConcreteSection, "calculate_gross_properties", calculate_gross_properties
+    )
+    rehydrated = pickle.loads(pickle.dumps(snapshot))()  # noqa: S301
+    gross_props = section.get_gross_properties()
+    rehydrated_props = rehydrated.get_gross_properties()
+    assert rehydrated_props.e_ixx_c == gross_props.e_ixx_c
+    assert rehydrated_props.e_zxx_plus == gross_props.e_zxx_plus
+    assert rehydrated.moment_centroid == section.moment_centroid
+    assert len(rehydrated.all_geometries) == len(section.all_geometries)
+    assert np.array_equal(rehydrated.point_bars.x, section.point_bars.x)
+
+    # materials are shared by the rehydrated geometries
+    mats = {id(geom.material) for geom in rehydrated.reinf_geometries_lumped}
+    assert len(mats) == 1
+
+    mi_res = section.moment_interaction_diagram(n_points=8, progress_bar=False)
+    rehydrated_res = rehydrated.moment_interaction_diagram(
+        n_points=8, progress_bar=False
+    )
+    assert pytest.approx(rehydrated_res.get_column(name="m_x")) == mi_res.get_column(
+        name="m_x"
+    )
+
+    # only the name and layout of the shared memory block is pickled
+    shm = snapshot.share()
+
+    try:
+        data = pickle.dumps(snapshot)
+        assert len(data) < len(pickle.dumps(section.snapshot()))
+
+        jobs = [
+            BatchJob(section=snapshot, method="calculate_cracked_properties"),
+            BatchJob(section=snapshot, method="get_gross_properties"),
+        ]
+        batch_results = list(iter_batch(jobs=jobs, max_workers=2, chunk_size=1))
+
+        assert all(r.success for r in batch_results)
+        assert pytest.approx(
+            next(r.result.e_a for r in batch_results if r.index == 1)
+        ) == (gross_props.e_a)
+    finally:
+        shm.close()
+        shm.unlink()
@@ -1,9 +1,54 @@
 """Tests the calculation of gross properties."""
 
+import pickle
+
+import numpy as np
 import pytest
 import sectionproperties.pre.library.primitive_sections as sp_ps
+from sectionproperties.pre.library.concrete_sections import concrete_rectangular_section
 
+import concreteproperties.utils as utils
 from concreteproperties.analysis_section import AnalysisSection
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.material import Concrete, SteelBar
+from concreteproperties.pre import (
+    CPGeom,
+    CPGeomConcrete,
+    add_bar,
+    add_bar_circular_array,
+    add_bars,
+    create_lumped_bars,
+)
+from concreteproperties.stress_strain_profile import (
+    ConcreteLinear,
+    RectangularStressBlock,
+    SteelElasticPlastic,
+)
+
+CONCRETE = Concrete(
+    name="32 MPa Concrete",
+    density=2.4e-6,
+    stress_strain_profile=ConcreteLinear(elastic_modulus=30.1e3),
+    ultimate_stress_strain_profile=RectangularStressBlock(
+        compressive_strength=32,
+        alpha=0.802,
+        gamma=0.89,
+        ultimate_strain=0.003,
+    ),
+    flexural_tensile_strength=3.4,
+    colour="lightgrey",
+)
+
+STEEL = SteelBar(
+    name="500 MPa Steel",
+    density=7.85e-6,
+    stress_strain_profile=SteelElasticPlastic(
+        yield_strength=500,
+        elastic_modulus=200e3,
+        fracture_strain=0.05,
+    ),
+    colour="grey",
+)
 
 
 def test_rectangle_second_moment_of_area():
@@ -40,3 +85,244 @@ def test_rectangle_second_moment_of_area():
     assert pytest.approx(ixx_c) == b * d * d * d / 12
     assert pytest.approx(iyy_c) == d * b * b * b / 12
     assert pytest.approx(ixy_c, abs=1e-6) == 0
+
+
+def test_polygon_moments_match_mesh():
+    """Test closed-form polygon moments against the meshed element moments."""
+    # hollow, rotated and shifted box (orientation of rings is mixed)
+    outer = sp_ps.circular_section(d=400, n=16)
+    inner = sp_ps.rectangular_section(d=150, b=100).shift_section(-50, -20)
+    geom = (
+        (outer - inner)
+        .rotate_section(angle=23)
+        .shift_section(x_offset=57, y_offset=-41)
+    )
+    cp_geom = CPGeom(geom=geom.geom, material=CONCRETE)
+    sec = AnalysisSection(geometry=cp_geom)
+
+    ixx_m = 0
+    iyy_m = 0
+    ixy_m = 0
+
+    for el in sec.elements:
+        el_e_ixx, el_e_iyy, el_e_ixy = el.second_moments_of_area()
+        ixx_m += el_e_ixx / CONCRETE.elastic_modulus
+        iyy_m += el_e_iyy / CONCRETE.elastic_modulus
+        ixy_m += el_e_ixy / CONCRETE.elastic_modulus
+
+    _, _, _, ixx_g, iyy_g, ixy_g = utils.calculate_polygon_moments(geom=cp_geom)
+
+    assert pytest.approx(ixx_g) == ixx_m
+    assert pytest.approx(iyy_g) == iyy_m
+    assert pytest.approx(ixy_g) == ixy_m
+
+
+@pytest.mark.parametrize("theta", [0, 0.3, np.pi / 2, 2.4, -np.pi, -1.1])
+def test_clipped_polygon_moments_match_split(theta):
+    """Test clipped polygon moments against a shapely split of the geometry."""
+    outer = sp_ps.rectangular_section(d=500, b=300)
+    inner = sp_ps.circular_section(d=150, n=12).shift_section(150, 300)
+    notch = sp_ps.rectangular_section(d=100, b=100).shift_section(200, 0)
+    cp_geom = CPGeomConcrete(geom=(outer - inner - notch).geom, material=CONCRETE)
+
+    # neutral axis through a point inside the section
+    point = (120, 260)
+    _, v_na = utils.global_to_local(theta=theta, x=point[0], y=point[1])
+
+    top_geoms, _ = cp_geom.split_section(point=point, theta=theta)
+    ref = np.zeros(6)
+
+    for geom in top_geoms:
+        ref += utils.calculate_polygon_moments(geom=geom)
+
+    moments = utils.calculate_polygon_moments(geom=cp_geom, theta=theta, v_na=v_na)
+
+    assert pytest.approx(moments, rel=1e-6) == ref
+
+
+def test_bulk_bar_placement():
+    """Test bulk bar placement against placing bars one at a time."""
+    geom = sp_ps.circular_section(d=600, n=32, material=CONCRETE)
+    thetas = np.arange(12) * 2 * np.pi / 12
+    x = 240 * np.cos(thetas)
+    y = 240 * np.sin(thetas)
+
+    ref_geom = geom
+    for bar_x, bar_y in zip(x, y, strict=True):
+        ref_geom = add_bar(ref_geom, area=314, material=STEEL, x=bar_x, y=bar_y)
+
+    bulk_geom = add_bar_circular_array(
+        geom, area=314, material=STEEL, n_bar=12, r_array=240
+    )
+
+    ref = ConcreteSection(ref_geom).gross_properties
+    bulk = ConcreteSection(bulk_geom).gross_properties
+
+    assert len(bulk_geom.geoms) == len(ref_geom.geoms)
+    assert pytest.approx(bulk.concrete_area) == ref.concrete_area
+    assert pytest.approx(bulk.reinf_lumped_area) == ref.reinf_lumped_area
+    assert pytest.approx(bulk.e_ixx_c) == ref.e_ixx_c
+
+    bars = create_lumped_bars(area=314, material=STEEL, x=x, y=y)
+    assert len(bars) == 12
+    assert pytest.approx(bars[3].y) == y[3]
+
+    with pytest.raises(ValueError, match="must have the same length"):
+        create_lumped_bars(area=[314, 314], material=STEEL, x=x, y=y)
+
+    # overlapping bars are clipped by the bars placed after them
+    x = [0, 10, 30, 35]
+    y = [0, 0, 100, 100]
+    ref_geom = geom
+    for bar_x, bar_y in zip(x, y, strict=True):
+        ref_geom = add_bar(ref_geom, area=314, material=STEEL, x=bar_x, y=bar_y)
+
+    bulk_geom = add_bars(geom, area=314, material=STEEL, x=x, y=y)
+    ref = ConcreteSection(ref_geom).gross_properties
+    bulk = ConcreteSection(bulk_geom).gross_properties
+
+    assert len(bulk_geom.geoms) == len(ref_geom.geoms)
+    assert pytest.approx(bulk.reinf_lumped_area) == ref.reinf_lumped_area
+    assert bulk.reinf_lumped_area < 3.5 * 314
+    assert pytest.approx(bulk.e_ixx_c) == ref.e_ixx_c
+
+
+def test_point_bar_displaced_concrete():
+    """Tests the concrete displaced by point bars."""
+    geom = sp_ps.rectangular_section(d=600, b=400, material=CONCRETE)  # pyright: ignore [reportArgumentType]
+    x = [100, 300, 500]
+    y = [100, 100, 700]
+    sec = ConcreteSection(
+        geom, lumped_bars=create_lumped_bars(area=314, material=STEEL, x=x, y=y)
+    )
+    ref_geom = geom
+    for bar_x, bar_y in zip(x[:2], y[:2], strict=True):
+        ref_geom = add_bar(ref_geom, area=314, material=STEEL, x=bar_x, y=bar_y)
+
+    ref_geom = ref_geom + sp_ps.circular_section_by_area(
+        area=314,
+        n=4,
+        material=STEEL,  # pyright: ignore [reportArgumentType]
+    ).shift_section(x_offset=x[2], y_offset=y[2])
+    ref = ConcreteSection(ref_geom).gross_properties
+
+    # only the bars within the concrete displace concrete
+    bars = sec.point_bars.geometries
+    assert [bar.displaced_material for bar in bars] == [CONCRETE, CONCRETE, None]
+    assert pytest.approx(sec.gross_properties.concrete_area) == ref.concrete_area
+    assert pytest.approx(sec.gross_properties.e_a) == ref.e_a
+    assert pytest.approx(sec.gross_properties.cy) == ref.cy
+    assert pytest.approx(sec.gross_properties.e_ixx_c, rel=1e-5) == ref.e_ixx_c
+
+    # material variants displace the replaced concrete
+    stronger = Concrete(
+        name="50 MPa Concrete",
+        density=2.4e-6,
+        stress_strain_profile=ConcreteLinear(elastic_modulus=34.8e3),
+        ultimate_stress_strain_profile=CONCRETE.ultimate_stress_strain_profile,
+        flexural_tensile_strength=4.2,
+        colour="grey",
+    )
+    variant = sec.create_material_variant(concrete_material=lambda _: stronger)
+
+    assert variant.point_bars.geometries[0].displaced_material is stronger
+    assert variant.point_bars.geometries[2].displaced_material is None
+    assert variant.reinf_geometries_lumped[0] is variant.point_bars.geometries[0]
+    assert sec.point_bars.geometries[0].displaced_material is CONCRETE
+
+
+def test_trusted_construction():
+    """Test trusted construction with lazy gross properties."""
+    geom = concrete_rectangular_section(
+        d=600,
+        b=400,
+        dia_top=16,
+        area_top=200,
+        n_top=3,
+        c_top=30,
+        dia_bot=20,
+        area_bot=310,
+        n_bot=3,
+        c_bot=30,
+        conc_mat=CONCRETE,
+        steel_mat=STEEL,
+    )
+
+    ref = ConcreteSection(geom)
+    sec = ConcreteSection(geom, trusted=True)
+
+    assert pytest.approx(sec.moment_centroid) == ref.moment_centroid
+    assert pytest.approx(sec.gross_properties.e_ixx_c) == ref.gross_properties.e_ixx_c
+    assert sec.meshed_geometries[0].facets == ref.meshed_geometries[0].facets
+
+    # deferred overlap check
+    assert not sec.check_geometry_overlaps()
+    overlapping = geom + sp_ps.rectangular_section(d=100, b=100, material=STEEL)
+    sec = ConcreteSection(overlapping, trusted=True)
+
+    with pytest.warns(UserWarning, match="overlapping regions"):
+        assert sec.check_geometry_overlaps()
+
+    # gross properties use the materials at construction, or at first access for a
+    # trusted section
+    conc = Concrete(
+        name="32 MPa Concrete",
+        density=2.4e-6,
+        stress_strain_profile=ConcreteLinear(elastic_modulus=30.1e3),
+        ultimate_stress_strain_profile=CONCRETE.ultimate_stress_strain_profile,
+        flexural_tensile_strength=3.4,
+        colour="lightgrey",
+    )
+    rect = sp_ps.rectangular_section(d=600, b=400, material=conc)  # pyright: ignore [reportArgumentType]
+    sec = ConcreteSection(rect)
+    trusted_sec = ConcreteSection(rect, trusted=True)
+    conc.elastic_modulus = 2 * 30.1e3
+
+    assert pytest.approx(sec.gross_properties.e_a) == 30.1e3 * 400 * 600
+    assert pytest.approx(sec.gross_properties.e_ixx_c) == 30.1e3 * 400 * 600**3 / 12
+    assert pytest.approx(trusted_sec.gross_properties.e_a) == 2 * 30.1e3 * 400 * 600
+
+
+def test_deferred_gross_properties(monkeypatch):
+    """Test deferred calculation of second moments of area and section moduli."""
+    calls = []
+    calculate_gross_second_moments = ConcreteSection.calculate_gross_second_moments
+
+    def counted_second_moments(self, *args, **kwargs):
+        calls.append(self)
+        calculate_gross_second_moments(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ConcreteSection, "calculate_gross_second_moments", counted_second_moments
+    )
+
+    d = 600
+    b = 400
+    geom = sp_ps.rectangular_section(d=d, b=b, material=CONCRETE)
+    gross = ConcreteSection(geom).gross_properties
+
+    # only areas and centroids are calculated up front
+    assert pytest.approx(gross.cy) == d / 2
+    assert not calls
+
+    # accessing a section modulus also calculates the second moments of area
+    e = 30.1e3
+    assert pytest.approx(gross.e_zxx_plus) == e * b * d**2 / 6
+    assert len(calls) == 1
+    assert pytest.approx(gross.e_ixx_c) == e * b * d**3 / 12
+    assert len(calls) == 1
+
+    # get_gross_properties calculates all deferred groups
+    ConcreteSection(geom).get_gross_properties()
+    assert len(calls) == 2
+
+    # pickling calculates all deferred groups and does not pickle the section
+    gross = ConcreteSection(geom).gross_properties
+    data = pickle.dumps(gross)
+    assert len(calls) == 3
+    assert b"ConcreteSection" not in data
+
+    unpickled = pickle.loads(data)  # noqa: S301
+    assert pytest.approx(unpickled.e_zxx_plus) == e * b * d**2 / 6
+    assert pytest.approx(unpickled.e_ixx_c) == e * b * d**3 / 12
+    assert len(calls) == 3
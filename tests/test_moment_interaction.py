@@ -313,3 +313,138 @@ def test_labels():
     assert mi_res_mc.results[0].label == "A"
     assert mi_res_mc.results[1].label == "B"
     assert mi_res_mc.results[2].label is None
+
+
+def test_scale_results():
+    """Tests scaling of moment interaction results by capacity reduction factors."""
+    mi_res = conc_sec.moment_interaction_diagram(n_points=6, progress_bar=False)
+    phis = np.linspace(0.6, 0.85, len(mi_res.results))
+    f_mi_res = mi_res.scale(factors=phis)
+
+    for phi, f_res, ult_res in zip(phis, f_mi_res.results, mi_res.results, strict=True):
+        assert f_res is not ult_res
+        assert pytest.approx(f_res.n) == phi * ult_res.n
+        assert pytest.approx(f_res.m_x) == phi * ult_res.m_x
+        assert pytest.approx(f_res.m_xy) == phi * ult_res.m_xy
+        assert f_res.d_n == ult_res.d_n
+        assert f_res.label == ult_res.label
+
+    # a single factor applies to all results
+    f_mi_res = mi_res.scale(factors=0.85)
+    assert pytest.approx(f_mi_res.results[0].n) == 0.85 * mi_res.results[0].n
+
+    f_ult_res = mi_res.results[1].scale(factor=0.5)
+    assert pytest.approx(f_ult_res.m_y) == 0.5 * mi_res.results[1].m_y
+
+
+def test_results_columns():
+    """Tests the array columns backing moment interaction results."""
+    ult = [
+        res.UltimateBendingResults(
+            default_units=DEFAULT_UNITS, theta=0, d_n=d_n, n=n, m_x=m_x, label=label
+        )
+        for d_n, n, m_x, label in [
+            (100, 1e5, 2e8, None),
+            (300, 2e6, 4e8, "B"),
+            (100, 1e5, 2e8, "dup"),
+            (200, 1e6, 3e8, "A"),
+            (50, -1e5, 1e8, "A"),
+        ]
+    ]
+    mi_res = res.MomentInteractionResults(default_units=DEFAULT_UNITS, results=ult)
+
+    # reference sort and dedupe using dataclass ordering and equality
+    ref = []
+
+    for r in sorted(ult, reverse=True):
+        if r not in ref:
+            ref.append(r)
+
+    mi_res.sort_results()
+
+    assert mi_res.columns.dtype == res.ULTIMATE_RESULTS_DTYPE
+    assert mi_res.results == ref
+    assert [r.label for r in mi_res.results] == [r.label for r in ref]
+    assert mi_res.labels == ["B", "A"]
+    assert mi_res.get_results_lists(moment="m_x") == (
+        [r.n for r in ref],
+        [r.m_x for r in ref],
+    )
+
+    # derived geometry is cached until the results list is modified
+    mi_res.results.insert(0, res.UltimateBendingResults(DEFAULT_UNITS, 0, n=3e6))
+    mi_res.results.append(res.UltimateBendingResults(DEFAULT_UNITS, 0, n=-1e6))
+    assert mi_res.point_in_diagram(n=5e5, m=1e8)
+    poly = mi_res.cached(key=("polygon", "m_x"), calculate=lambda: None)
+    assert poly is not None
+    assert not mi_res.point_in_diagram(n=5e5, m=3.5e8)
+
+    mi_res.results[2].m_x = 6e8
+    assert mi_res.point_in_diagram(n=5e5, m=3.5e8)
+
+    with pytest.raises(ValueError, match="not a results column"):
+        mi_res.get_column(name="m_z")
+
+    # biaxial bending results
+    bb_res = res.BiaxialBendingResults(default_units=DEFAULT_UNITS, n=0)
+    bb_res.results.extend(
+        res.UltimateBendingResults(
+            DEFAULT_UNITS, theta, m_x=np.cos(theta), m_y=np.sin(theta)
+        )
+        for theta in np.linspace(-np.pi, np.pi, 17)
+    )
+    assert bb_res.point_in_diagram(m_x=0.5, m_y=0.5)
+    assert not bb_res.point_in_diagram(m_x=1, m_y=1)
+    assert pytest.approx(bb_res.get_column(name="m_y")) == bb_res.get_results_lists()[1]
+
+
+def test_held_results_list(monkeypatch):
+    """Tests that changes to a held results list are reflected in the columns."""
+    builds = []
+    results_to_columns = res._results_to_columns
+
+    def counted_results_to_columns(results):
+        builds.append(None)
+
+        return results_to_columns(results=results)
+
+    monkeypatch.setattr(res, "_results_to_columns", counted_results_to_columns)
+
+    mi_res = res.MomentInteractionResults(default_units=DEFAULT_UNITS)
+    results = mi_res.results
+    results.append(res.UltimateBendingResults(DEFAULT_UNITS, 0, n=1e5, m_x=1e8))
+    assert len(mi_res.columns) == 1
+
+    # the columns are only rebuilt once the list has changed
+    for _ in range(3):
+        assert mi_res.get_label(idx=0) is None
+        assert list(mi_res.get_column(name="n")) == [1e5]
+
+    assert len(builds) == 1
+
+    # appends and edits after the columns have been built are kept
+    results.append(
+        res.UltimateBendingResults(DEFAULT_UNITS, 0, n=2e5, m_x=2e8, label="A")
+    )
+    results[0].m_x = 3e8
+    assert mi_res.results is results
+    assert list(mi_res.get_column(name="m_x")) == [3e8, 2e8]
+    assert mi_res.labels == ["A"]
+
+    # sorting updates the held list in place
+    mi_res.sort_results()
+    assert [r.n for r in results] == [2e5, 1e5]
+    assert results[0].label == "A"
+
+    results.pop()
+    assert list(mi_res.get_column(name="n")) == [2e5]
+
+    # results backed by columns hand out a list that is tracked in the same way
+    loaded = res.MomentInteractionResults(default_units=DEFAULT_UNITS)
+    loaded.set_columns(columns=mi_res.columns, labels=mi_res.labels)
+    held = loaded.results
+    held[0].n = 4e5
+    held.append(res.UltimateBendingResults(DEFAULT_UNITS, 0, n=-1e5))
+    assert list(loaded.get_column(name="n")) == [4e5, -1e5]
+    assert loaded.get_label(idx=0) == "A"
+    assert list(mi_res.get_column(name="n")) == [2e5]
@@ -1525,3 +1525,86 @@ def test_nzs3101_create_section_with_non_steelbarnz_material():
         design_code.check_f_y_limit()
     with pytest.raises(ValueError, match="Material must be a SteelBarNZ"):
         design_code.steel_capacity()
+
+
+def test_nzs3101_section_variants():
+    """Tests lazily created material variants of the concrete section."""
+    design_code = NZS3101()
+    concrete_section = create_dummy_section(design_code)
+
+    # variants are only created when required
+    assert not design_code._section_variants
+
+    os_section = design_code.assign_analysis_section(analysis_type="os_chk")
+    assert set(design_code._section_variants) == {"os"}
+    assert design_code.os_concrete_section is os_section
+
+    # geometry and gross properties are shared with the nominal section
+    nom_geom = concrete_section.concrete_geometries[0]
+    os_geom = os_section.concrete_geometries[0]
+    assert os_geom.geom is nom_geom.geom
+    assert os_section.hull_points is concrete_section.hull_points
+    assert os_section.gross_properties is concrete_section.gross_properties
+
+    # only the materials are replaced
+    nom_ssp = nom_geom.material.ultimate_stress_strain_profile
+    os_ssp = os_geom.material.ultimate_stress_strain_profile
+    assert pytest.approx(os_ssp.compressive_strength) == 55
+    assert pytest.approx(nom_ssp.compressive_strength) == 40
+    assert os_section.all_geometries[0] is os_geom
+
+    for bar in os_section.reinf_geometries_lumped:
+        assert bar in os_section.all_geometries
+        assert pytest.approx(bar.material.stress_strain_profile.yield_strength) == 675
+
+
+def test_nzs3101_check_load_cases():
+    """Tests checking many load cases for several analysis types."""
+    design_code = NZS3101()
+    create_dummy_section(design_code)
+    load_cases = np.array(
+        [
+            [1e6, 5e8, 0],
+            [3e6, -4e8, 2e8],
+            [2e6, 1.2e9, 0],
+            [5e7, 1e8, 0],
+        ]
+    )
+    analysis_types = ["nom_chk", "cpe_chk", "os_chk"]
+    check = design_code.check_load_cases(
+        load_cases=load_cases, analysis_types=analysis_types
+    )
+
+    # nom_chk and cpe_chk share a neutral axis sweep
+    assert len(check) == len(load_cases) * len(analysis_types)
+    assert len(design_code._sweeps) == 2 * 3
+
+    for analysis_type in analysis_types:
+        rows = check.get_analysis_type(analysis_type=analysis_type)
+        assert list(rows.case) == list(range(len(load_cases)))
+
+        for case, (n, m_x, _) in enumerate(load_cases[:3]):
+            f_ult_res, _, phi = design_code.ultimate_bending_capacity(
+                analysis_type=analysis_type,
+                theta=0 if m_x > 0 else np.pi,
+                n_design=n,
+            )
+            assert pytest.approx(rows.phi[case]) == phi
+            assert pytest.approx(rows.phi_m_ux[case], rel=0.02) == abs(f_ult_res.m_x)
+
+            # linear biaxial interaction
+            assert pytest.approx(rows.utilisation[case]) == (
+                rows.util_x[case] + rows.util_y[case]
+            )
+
+        # axial force greater than the compression capacity
+        assert np.isinf(rows.utilisation[3])
+
+    # load cases near the capacity boundary are calculated exactly
+    assert check.get_analysis_type(analysis_type="nom_chk").refined[2]
+
+    with pytest.raises(ValueError, match="do not contain the prob_chk"):
+        check.get_analysis_type(analysis_type="prob_chk")
+
+    with pytest.raises(ValueError, match="three columns"):
+        design_code.check_load_cases(load_cases=np.zeros((2, 2)))
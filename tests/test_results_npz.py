@@ -0,0 +1,216 @@
+"""Tests saving and loading results objects to and from npz files."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import sectionproperties.pre.library.primitive_sections as sp_ps
+
+import concreteproperties.results as res
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.design_codes.as3600 import AS3600
+from concreteproperties.material import Concrete
+from concreteproperties.post import si_n_mm
+from concreteproperties.stress_strain_profile import (
+    ConcreteLinear,
+    RectangularStressBlock,
+)
+
+
+@pytest.fixture(scope="module")
+def concrete_section(beam_factory) -> ConcreteSection:
+    """Creates a reinforced concrete beam assigned to an AS 3600 design code.
+
+    Args:
+        beam_factory: Factory of the shared reinforced concrete beam
+
+    Returns:
+        ConcreteSection object
+    """
+    return beam_factory(AS3600())
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_ultimate_results_npz(concrete_section, tmp_path, mmap_mode):
+    """Tests saving and loading moment interaction and biaxial bending results."""
+    path = tmp_path / "mi.npz"
+    mi_res = concrete_section.moment_interaction_diagram(
+        n_points=12, progress_bar=False
+    )
+    mi_res.results[3].label = "Point"
+    mi_res.to_npz(path)
+    loaded = res.MomentInteractionResults.from_npz(path, mmap_mode=mmap_mode)
+
+    assert loaded.default_units == si_n_mm
+    assert np.array_equal(loaded.columns, mi_res.columns)
+    assert loaded.labels == ["Point"]
+    assert loaded.results[3].label == "Point"
+    assert loaded.point_in_diagram(n=1e6, m=1e8) == mi_res.point_in_diagram(
+        n=1e6, m=1e8
+    )
+
+    path = tmp_path / "bb.npz"
+    bb_res = concrete_section.biaxial_bending_diagram(
+        n=5e5, n_points=8, progress_bar=False
+    )
+    bb_res.to_npz(path)
+    loaded = res.BiaxialBendingResults.from_npz(path, mmap_mode=mmap_mode)
+
+    assert loaded.n == 5e5
+    assert np.array_equal(loaded.get_column(name="m_y"), bb_res.get_column(name="m_y"))
+
+
+def test_moment_curvature_npz(concrete_section, tmp_path):
+    """Tests saving and loading moment curvature results."""
+    path = tmp_path / "mk.npz"
+    mk_res = concrete_section.moment_curvature_analysis(
+        kappa_inc=2e-6, progress_bar=False
+    )
+    mk_res.to_npz(path)
+    loaded = res.MomentCurvatureResults.from_npz(path, mmap_mode="r")
+
+    # arrays are memory-mapped
+    assert isinstance(loaded.kappa, np.memmap)
+    assert loaded.theta == mk_res.theta
+    assert np.array_equal(loaded.m_xy, mk_res.m_xy)
+    assert np.array_equal(loaded.eps0, mk_res.eps0)
+    assert pytest.approx(loaded.get_curvature(moment=1e8)) == mk_res.get_curvature(
+        moment=1e8
+    )
+
+
+def test_properties_npz(concrete_section, tmp_path):
+    """Tests saving and loading gross and cracked properties."""
+    gross_props = concrete_section.get_gross_properties()
+    gross_props.to_npz(tmp_path / "gross.npz")
+    loaded = res.GrossProperties.from_npz(tmp_path / "gross.npz")
+
+    assert loaded.e_ixx_c == gross_props.e_ixx_c
+    assert loaded.e_zxx_plus == gross_props.e_zxx_plus
+
+    cracked_res = concrete_section.calculate_cracked_properties(theta=0.2)
+    cracked_res.to_npz(tmp_path / "cracked.npz")
+    loaded = res.CrackedResults.from_npz(tmp_path / "cracked.npz")
+
+    assert loaded.theta == 0.2
+    assert loaded.m_cr == cracked_res.m_cr
+    assert loaded.e_iuu_cr == cracked_res.e_iuu_cr
+    assert loaded.cracked_geometries == []
+
+    # wrong results class
+    with pytest.raises(ValueError, match="does not contain"):
+        res.GrossProperties.from_npz(tmp_path / "cracked.npz")
+
+
+def test_stress_result_npz(concrete_section, tmp_path):
+    """Tests saving and loading stress results."""
+    path = tmp_path / "stress.npz"
+    cracked_res = concrete_section.calculate_cracked_properties()
+    stress_res = concrete_section.calculate_cracked_stress(
+        cracked_results=cracked_res, m=1.5e8
+    )
+    stress_res.to_npz(path)
+    loaded = res.StressResult.from_npz(
+        path, concrete_section=concrete_section, mmap_mode="r"
+    )
+
+    assert len(loaded.concrete_analysis_sections) == len(
+        stress_res.concrete_analysis_sections
+    )
+
+    for sec, sec_loaded in zip(
+        stress_res.concrete_analysis_sections,
+        loaded.concrete_analysis_sections,
+        strict=True,
+    ):
+        assert np.array_equal(sec.mesh_nodes, sec_loaded.mesh_nodes)
+        assert sec_loaded.material is sec.material
+
+    assert loaded.lumped_reinforcement_geometries == (
+        stress_res.lumped_reinforcement_geometries
+    )
+    assert pytest.approx(loaded.sum_forces()) == stress_res.sum_forces()
+    assert pytest.approx(loaded.sum_moments()) == stress_res.sum_moments()
+    assert loaded.get_concrete_stress_limits() == (
+        stress_res.get_concrete_stress_limits()
+    )
+
+
+def test_stress_result_npz_materials(tmp_path):
+    """Tests that materials are restored by geometry rather than by name."""
+    path = tmp_path / "stress.npz"
+    materials = [
+        Concrete(
+            name="Concrete",
+            density=2.4e-6,
+            stress_strain_profile=ConcreteLinear(elastic_modulus=e),
+            ultimate_stress_strain_profile=RectangularStressBlock(
+                compressive_strength=32,
+                alpha=0.802,
+                gamma=0.89,
+                ultimate_strain=0.003,
+            ),
+            flexural_tensile_strength=3.4,
+            colour="lightgrey",
+        )
+        for e in (25e3, 35e3)
+    ]
+    geom = sp_ps.rectangular_section(d=300, b=400, material=materials[0])
+    geom += sp_ps.rectangular_section(
+        d=300, b=400, material=materials[1]
+    ).shift_section(y_offset=300)
+    conc_sec = ConcreteSection(geom)
+    stress_res = conc_sec.calculate_uncracked_stress(n=1e5, m_x=5e7)
+    stress_res.to_npz(path)
+    loaded = res.StressResult.from_npz(path, concrete_section=conc_sec)
+
+    for sec, sec_loaded in zip(
+        stress_res.concrete_analysis_sections,
+        loaded.concrete_analysis_sections,
+        strict=True,
+    ):
+        assert sec_loaded.material is sec.material
+
+    assert pytest.approx(loaded.sum_moments()) == stress_res.sum_moments()
+
+    # the geometries of another section do not match the stored indices
+    single_sec = ConcreteSection(
+        sp_ps.rectangular_section(d=300, b=400, material=materials[0])
+    )
+
+    with pytest.raises(ValueError, match="not valid for the concrete section"):
+        res.StressResult.from_npz(path, concrete_section=single_sec)
+
+
+def test_load_case_results_npz(tmp_path):
+    """Tests saving and loading load case results."""
+    path = tmp_path / "load_cases.npz"
+    n_rows = 4
+    check = res.LoadCaseResults(
+        default_units=si_n_mm,
+        case=np.array([0, 1, 0, 1]),
+        n=np.linspace(0, 1e6, n_rows),
+        m_x=np.linspace(1e8, 2e8, n_rows),
+        m_y=np.zeros(n_rows),
+        phi_m_ux=np.full(n_rows, 3e8),
+        phi_m_uy=np.zeros(n_rows),
+        util_x=np.linspace(1 / 3, 2 / 3, n_rows),
+        util_y=np.zeros(n_rows),
+        utilisation=np.array([1 / 3, 4 / 9, 5 / 9, np.inf]),
+        refined=np.array([False, False, True, False]),
+        analysis_type=np.array(["nom_chk", "nom_chk", "os_chk", "os_chk"]),
+        phi=np.array([0.85, 0.85, 1.0, 1.0]),
+    )
+    check.to_npz(path)
+    loaded = res.LoadCaseResults.from_npz(path, mmap_mode="r")
+
+    assert len(loaded) == n_rows
+    assert loaded.alpha_n is None
+    assert loaded.default_units == si_n_mm
+
+    for name in ("case", "n", "utilisation", "refined", "analysis_type", "phi"):
+        assert np.array_equal(getattr(loaded, name), getattr(check, name))
+
+    os_chk = loaded.get_analysis_type(analysis_type="os_chk")
+    assert list(os_chk.case) == [0, 1]
+    assert os_chk.refined[0]
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from sectionproperties.pre.library.concrete_sections import concrete_rectangular_section
 
+import concreteproperties.utils as utils
 from concreteproperties.concrete_section import ConcreteSection
 from concreteproperties.material import Concrete, SteelBar
 from concreteproperties.stress_strain_profile import (
@@ -109,6 +110,38 @@ def test_rotated_cracked_properties(theta):
     assert pytest.approx(new_cracked.e_iuu_cr) == ref_cracked.e_iuu_cr
 
 
+def test_extreme_fibres_convex_hull():
+    """Tests vectorised extreme fibre queries on the cached convex hull."""
+    ecfs, d_ts = utils.calculate_extreme_fibres(
+        points=ref_sec.hull_points, thetas=thetas
+    )
+
+    for idx, theta in enumerate(thetas):
+        ecf, d_t = utils.calculate_extreme_fibre(points=ref_geom.points, theta=theta)
+        _, v_ref = utils.global_to_local(theta=theta, x=ecf[0], y=ecf[1])
+        _, v = utils.global_to_local(theta=theta, x=ecfs[idx][0], y=ecfs[idx][1])
+
+        assert pytest.approx(d_ts[idx]) == d_t
+        assert pytest.approx(v) == v_ref
+
+
+def test_cracked_properties_sweep():
+    """Tests the cracked properties sweep against individual cracked analyses."""
+    sweep = ref_sec.cracked_properties_sweep(thetas=thetas)
+
+    for idx, theta in enumerate(thetas):
+        cracked = ref_sec.calculate_cracked_properties(theta=theta)
+
+        assert pytest.approx(sweep.m_cr[idx]) == cracked.m_cr
+        assert pytest.approx(sweep.d_nc[idx], rel=1e-4) == cracked.d_nc
+        assert pytest.approx(sweep.e_a_cr[idx], rel=1e-4) == cracked.e_a_cr
+        assert pytest.approx(sweep.e_iuu_cr[idx], rel=1e-4) == cracked.e_iuu_cr
+        assert (
+            pytest.approx(sweep.get_cracked_results(idx).e_ixx_g_cr, rel=1e-4)
+            == cracked.e_ixx_g_cr
+        )
+
+
 # list of normal forces
 normal_forces = [-1e3, 0, 1e3, 1e5]
 
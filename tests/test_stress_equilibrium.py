@@ -3,9 +3,11 @@
 import numpy as np
 import pytest
 import sectionproperties.pre.library.concrete_sections as sp_cs
+import sectionproperties.pre.library.primitive_sections as sp_ps
 
 from concreteproperties.concrete_section import ConcreteSection
-from concreteproperties.material import Concrete, SteelBar
+from concreteproperties.material import Concrete, Steel, SteelBar
+from concreteproperties.pre import CPPointBar, add_bars, create_lumped_bars
 from concreteproperties.stress_strain_profile import (
     ConcreteLinear,
     RectangularStressBlock,
@@ -187,3 +189,400 @@ def test_stress_equilibrium_tee(theta):
 
     assert pytest.approx(ult_stress.sum_forces(), abs=100) == 0
     assert pytest.approx(ult_stress.sum_moments()[2], rel=1e-4) == ultimate.m_xy
+
+
+@pytest.mark.parametrize("nf", normal_forces)
+def test_stress_equilibrium_point_bars(nf):
+    """Tests stress equilibrium and capacity for a section with point bars."""
+    conc = sp_ps.circular_section_by_area(
+        area=np.pi * 750**2 / 4,
+        n=64,
+        material=concrete,  # pyright: ignore [reportArgumentType]
+    )
+    thetas_bar = np.arange(12) * 2 * np.pi / 12
+    x = 325 * np.cos(thetas_bar)
+    y = 325 * np.sin(thetas_bar)
+
+    # reference section with polygon bars
+    ref_sec = ConcreteSection(add_bars(conc, 450, steel, x, y, n=16))
+
+    # point bar section
+    sec = ConcreteSection(
+        conc,
+        lumped_bars=create_lumped_bars(area=450, material=steel, x=x, y=y),
+    )
+
+    assert len(sec.reinf_geometries_lumped) == 12
+    assert isinstance(sec.reinf_geometries_lumped[0], CPPointBar)
+    # displaced concrete is deducted at each point bar
+    for prop in ["reinf_lumped_area", "concrete_area", "e_a", "mass", "e_ixx_c"]:
+        assert pytest.approx(getattr(sec.gross_properties, prop)) == getattr(
+            ref_sec.gross_properties, prop
+        )
+
+    cracked = sec.calculate_cracked_properties()
+    ref_cracked = ref_sec.calculate_cracked_properties()
+
+    assert pytest.approx(cracked.d_nc, rel=1e-6) == ref_cracked.d_nc
+    assert pytest.approx(cracked.e_iuu_cr, rel=1e-6) == ref_cracked.e_iuu_cr
+
+    sweep = sec.cracked_properties_sweep(thetas=[0])
+
+    assert pytest.approx(sweep.d_nc[0], rel=1e-4) == cracked.d_nc
+    assert pytest.approx(sweep.e_iuu_cr[0], rel=1e-4) == cracked.e_iuu_cr
+    m_star = 100e6
+
+    # check section equilibirum for uncracked stress
+    uncr_stress = sec.calculate_uncracked_stress(n=nf, m_x=m_star)
+
+    assert pytest.approx(uncr_stress.sum_forces(), abs=1e-3) == nf
+    assert pytest.approx(uncr_stress.sum_moments()[2], rel=1e-3) == m_star
+
+    uncr_stresses = sec.calculate_uncracked_stresses(load_cases=[[nf, m_star, 0]])
+
+    assert pytest.approx(uncr_stresses.sum_forces(), abs=1e-3) == nf
+    assert pytest.approx(uncr_stresses.sum_moments()[2], rel=1e-3) == m_star
+
+    # check section equilibirum for cracked stress
+    cr_stress = sec.calculate_cracked_stress(cracked_results=cracked, n=nf, m=m_star)
+
+    assert pytest.approx(cr_stress.sum_forces(), abs=1e-3) == nf
+    assert pytest.approx(cr_stress.sum_moments()[2], rel=5e-3) == m_star
+
+    cr_stresses = sec.calculate_cracked_stresses(
+        cracked_results=cracked, m=m_star, n=nf
+    )
+
+    assert pytest.approx(cr_stresses.sum_forces(), abs=1e-3) == nf
+    assert pytest.approx(cr_stresses.sum_moments()[2], rel=5e-3) == m_star
+
+    # check section equilibirum for ultimate stress
+    ultimate = sec.ultimate_bending_capacity(n=nf)
+    ult_stress = sec.calculate_ultimate_stress(ultimate_results=ultimate)
+
+    assert pytest.approx(ult_stress.sum_forces(), abs=20) == nf
+    assert pytest.approx(ult_stress.sum_moments()[2], rel=1e-4) == ultimate.m_xy
+
+    # capacity matches the polygon bar model
+    ref_ultimate = ref_sec.ultimate_bending_capacity(n=nf)
+    assert pytest.approx(ultimate.m_xy, rel=1e-4) == ref_ultimate.m_xy
+
+
+def test_uncracked_stresses_superposition():
+    """Tests uncracked stresses for many load cases against single load cases."""
+    plate_steel = Steel(
+        name="300 MPa Steel",
+        density=7.85e-6,
+        stress_strain_profile=SteelElasticPlastic(
+            yield_strength=300,
+            elastic_modulus=200e3,
+            fracture_strain=0.05,
+        ),
+        colour="grey",
+    )
+    geom = sp_cs.concrete_tee_section(
+        b=450,
+        d=1200,
+        b_f=1800,
+        d_f=200,
+        dia_top=16,
+        n_top=12,
+        c_top=30,
+        dia_bot=24,
+        n_bot=4,
+        c_bot=30,
+        n_circle=4,
+        area_top=200,
+        area_bot=450,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    plate = sp_ps.rectangular_section(
+        d=10,
+        b=450,
+        material=plate_steel,  # pyright: ignore [reportArgumentType]
+    ).shift_section(x_offset=-225, y_offset=-10)
+    sec = ConcreteSection(geom + plate)
+
+    load_cases = np.array(
+        [
+            [0, 100e6, 0],
+            [-1e5, 50e6, 20e6],
+            [1e6, -30e6, -80e6],
+            [2e5, 0, 10e6],
+        ]
+    )
+    uncr_stresses = sec.calculate_uncracked_stresses(load_cases=load_cases)
+
+    # basis is calculated once per section
+    assert sec.uncracked_stress_basis is uncr_stresses.basis
+    assert len(uncr_stresses) == len(load_cases)
+    assert len(uncr_stresses.meshed_reinforcement_stresses) == 1
+
+    forces = uncr_stresses.sum_forces()
+    m_x, m_y, _ = uncr_stresses.sum_moments()
+    conc_min, conc_max = uncr_stresses.get_concrete_stress_limits()
+
+    for idx, (n, m_x_star, m_y_star) in enumerate(load_cases):
+        uncr_stress = sec.calculate_uncracked_stress(n=n, m_x=m_x_star, m_y=m_y_star)
+
+        assert pytest.approx(forces[idx], abs=1e-3) == n
+        assert pytest.approx(m_x[idx], rel=1e-4, abs=1e-3) == m_x_star
+        assert pytest.approx(m_y[idx], rel=1e-4, abs=1e-3) == m_y_star
+        assert pytest.approx(uncr_stress.get_concrete_stress_limits()) == (
+            conc_min[idx],
+            conc_max[idx],
+        )
+        assert (
+            pytest.approx(uncr_stresses.lumped_reinforcement_stresses[idx])
+            == uncr_stress.lumped_reinforcement_stresses
+        )
+
+        # single load case result
+        stress_result = uncr_stresses.get_stress_result(idx=idx)
+
+        assert pytest.approx(stress_result.sum_forces(), abs=1e-3) == n
+        assert pytest.approx(stress_result.sum_moments()[:2], rel=1e-4, abs=1e3) == (
+            m_x_star,
+            m_y_star,
+        )
+
+    with pytest.raises(ValueError, match="three columns"):
+        sec.calculate_uncracked_stresses(load_cases=np.zeros((2, 2)))
+
+
+def test_uncracked_stresses_pure_bending():
+    """Tests uncracked stress equilibrium for many load cases without axial force."""
+    sec = ConcreteSection(
+        sp_ps.rectangular_section(
+            d=600,
+            b=400,
+            material=concrete,  # pyright: ignore [reportArgumentType]
+        )
+    )
+    load_cases = np.array([[0, 1e8, 0], [0, 0, 1e8], [0, 1e8, 1e8]])
+    uncr_stresses = sec.calculate_uncracked_stresses(load_cases=load_cases)
+    m_x, m_y, _ = uncr_stresses.sum_moments()
+
+    assert pytest.approx(uncr_stresses.sum_forces(), abs=1e-3) == load_cases[:, 0]
+    assert pytest.approx(m_x, abs=1e-3) == load_cases[:, 1]
+    assert pytest.approx(m_y, abs=1e-3) == load_cases[:, 2]
+
+    # single load case results are split at the neutral axis
+    for idx, (_, m_x_star, m_y_star) in enumerate(load_cases):
+        stress_result = uncr_stresses.get_stress_result(idx=idx)
+
+        assert len(stress_result.concrete_analysis_sections) == 2
+        assert pytest.approx(stress_result.sum_moments()[:2], abs=1e-3) == (
+            m_x_star,
+            m_y_star,
+        )
+
+
+@pytest.mark.parametrize("theta", [0, -np.pi / 2, 0.4, np.pi])
+def test_cracked_stresses_superposition(theta):
+    """Tests cracked stresses for many moments against single load cases."""
+    geom = sp_cs.concrete_rectangular_section(
+        b=300,
+        d=900,
+        dia_top=16,
+        n_top=3,
+        c_top=30,
+        dia_bot=24,
+        n_bot=3,
+        c_bot=30,
+        n_circle=4,
+        area_top=200,
+        area_bot=450,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    sec = ConcreteSection(geom)
+    cracked = sec.calculate_cracked_properties(theta=theta)
+
+    moments = np.linspace(10e6, 200e6, 5)
+    cr_stresses = sec.calculate_cracked_stresses(
+        cracked_results=cracked, m=moments, n=1e3
+    )
+
+    # basis is cached on the cracked results
+    assert cracked.stress_basis is cr_stresses.basis
+    assert sec.get_cracked_stress_basis(cracked_results=cracked) is cracked.stress_basis
+
+    forces = cr_stresses.sum_forces()
+    _, _, m_xy = cr_stresses.sum_moments()
+    conc_min, conc_max = cr_stresses.get_concrete_stress_limits()
+
+    # internal actions are in equilibrium with the applied actions
+    assert pytest.approx(forces, abs=1e-3) == 1e3
+    assert pytest.approx(m_xy, rel=5e-3) == moments
+
+    for idx, m_star in enumerate(moments):
+        cr_stress = sec.calculate_cracked_stress(
+            cracked_results=cracked, n=1e3, m=m_star
+        )
+
+        assert pytest.approx(forces[idx], abs=1e-3) == cr_stress.sum_forces()
+        assert pytest.approx(m_xy[idx]) == cr_stress.sum_moments()[2]
+        assert pytest.approx(conc_min[idx]) == cr_stress.get_concrete_stress_limits()[0]
+        assert pytest.approx(conc_max[idx]) == cr_stress.get_concrete_stress_limits()[1]
+        assert (
+            pytest.approx(cr_stresses.lumped_reinforcement_stresses[idx])
+            == cr_stress.lumped_reinforcement_stresses
+        )
+
+
+def test_service_stresses_warm_start():
+    """Tests service stresses for many moments from a moment-curvature analysis."""
+    geom = sp_cs.concrete_rectangular_section(
+        b=300,
+        d=600,
+        dia_top=16,
+        n_top=3,
+        c_top=30,
+        dia_bot=24,
+        n_bot=3,
+        c_bot=30,
+        n_circle=4,
+        area_top=200,
+        area_bot=450,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    sec = ConcreteSection(geom)
+    mk = sec.moment_curvature_analysis(kappa_inc=1e-6, progress_bar=False)
+
+    # converged strains are stored for each step
+    assert len(mk.eps0) == len(mk.kappa)
+
+    moments = np.linspace(0.1, 0.9, 5) * max(mk.m_xy)
+    serv_stresses = sec.calculate_service_stresses(
+        moment_curvature_results=mk, m=moments
+    )
+
+    assert len(serv_stresses) == len(moments)
+    assert pytest.approx(serv_stresses.kappa) == mk.get_curvatures(moments=moments)
+    assert pytest.approx(serv_stresses.sum_forces(), abs=1e-2) == 0
+
+    for idx, m_star in enumerate(moments):
+        serv_stress = sec.calculate_service_stress(
+            moment_curvature_results=mk, m=m_star
+        )
+
+        assert (
+            pytest.approx(serv_stresses.sum_moments()[2][idx], rel=1e-6)
+            == serv_stress.sum_moments()[2]
+        )
+        assert (
+            pytest.approx(serv_stresses.lumped_reinforcement_stresses[idx])
+            == serv_stress.lumped_reinforcement_stresses
+        )
+
+    with pytest.raises(ValueError, match="m or kappa"):
+        sec.calculate_service_stresses(moment_curvature_results=mk)
+
+
+def test_moment_curvature_replay():
+    """Tests replaying the stored strain state of moment-curvature steps."""
+    geom = sp_cs.concrete_rectangular_section(
+        b=300,
+        d=600,
+        dia_top=16,
+        n_top=3,
+        c_top=30,
+        dia_bot=24,
+        n_bot=3,
+        c_bot=30,
+        n_circle=4,
+        area_top=200,
+        area_bot=450,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    sec = ConcreteSection(geom)
+    mk = sec.moment_curvature_analysis(n=1e5, kappa_inc=1e-6, progress_bar=False)
+
+    # strain states are stored as arrays
+    assert mk.eps0.shape == (len(mk.kappa),)
+    assert mk.failure_ratio.shape == (len(mk.kappa),)
+    assert pytest.approx(mk.failure_ratio[-1]) == 1
+    assert pytest.approx(mk.ecf[1]) == 600
+
+    for step in [1, len(mk.kappa) // 2, len(mk.kappa) - 1]:
+        stress = sec.get_moment_curvature_stress(moment_curvature_results=mk, step=step)
+
+        assert pytest.approx(stress.sum_forces(), abs=1e-2) == 1e5
+        assert pytest.approx(stress.sum_moments()[2], rel=1e-6) == mk.m_xy[step]
+
+    # stress at a curvature step replays the step without solving for equilibrium
+    step = len(mk.kappa) // 2
+    assert mk.get_step(kappa=mk.kappa[step]) == step
+    assert mk.get_step(kappa=mk.kappa[step] * 1.01) is None
+    assert (
+        sec.solve_service_eps0(moment_curvature_results=mk, kappa=mk.kappa[step])
+        == (mk.eps0[step])
+    )
+
+
+def test_compact_stress_results():
+    """Tests compact stress results, which only retain the meshes."""
+    geom = sp_cs.concrete_rectangular_section(
+        b=300,
+        d=600,
+        dia_top=16,
+        n_top=3,
+        c_top=30,
+        dia_bot=24,
+        n_bot=3,
+        c_bot=30,
+        n_circle=4,
+        area_top=200,
+        area_bot=450,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    sec = ConcreteSection(geom)
+
+    # identical meshes are shared between compacted stress results
+    uncr_stresses = sec.calculate_uncracked_stresses(
+        load_cases=[[0, 1e8, 0], [1e5, 5e7, 0]]
+    )
+    mesh_cache = {}
+    stresses = [uncr_stresses.get_stress_result(idx=idx) for idx in range(2)]
+
+    for stress in stresses:
+        stress.compact(mesh_cache=mesh_cache)
+
+    assert stresses[0].concrete_meshes[0] is stresses[1].concrete_meshes[0]
+    assert len(mesh_cache) == len(stresses[0].concrete_meshes)
+
+    # compact service stresses
+    mk = sec.moment_curvature_analysis(kappa_inc=1e-6, progress_bar=False)
+    moments = np.linspace(0.2, 0.8, 3) * max(mk.m_xy)
+    serv_stresses = sec.calculate_service_stresses(
+        moment_curvature_results=mk, m=moments
+    )
+    compact_stresses = sec.calculate_service_stresses(
+        moment_curvature_results=mk, m=moments, compact=True
+    )
+
+    assert (
+        pytest.approx(compact_stresses.sum_moments()[2])
+        == (serv_stresses.sum_moments()[2])
+    )
+
+    for stress, compact_stress in zip(serv_stresses, compact_stresses, strict=True):
+        assert compact_stress.__dict__["_concrete_analysis_sections"] is None
+
+        # analysis sections are rebuilt from the meshes on first access
+        for sec_a, sec_b in zip(
+            stress.concrete_analysis_sections,
+            compact_stress.concrete_analysis_sections,
+            strict=True,
+        ):
+            assert np.array_equal(sec_a.mesh_nodes, sec_b.mesh_nodes)
+            assert np.array_equal(sec_a.mesh_elements, sec_b.mesh_elements)
+            assert pytest.approx(sec_b.calculate_meshed_area()) == (
+                sec_a.calculate_meshed_area()
+            )
+            assert sec_b.material is sec_a.material
@@ -1,5 +1,6 @@
 """Tests for stress-strain profiles."""
 
+import numpy as np
 import pytest
 
 import concreteproperties.stress_strain_profile as ssp
@@ -20,6 +21,53 @@ def test_whitney():
     assert pytest.approx(profile.get_stress(0.001)) == 0.85 * 40
 
 
+def test_compiled_metadata():
+    """Tests the compiled stress-strain profile metadata."""
+    profile = ssp.StressStrainProfile(
+        [-0.05, -0.0025, 0, 0.0025, 0.05], [-600, -500, 0, 500, 600]
+    )
+    metadata = profile.get_metadata()
+
+    assert metadata is profile.get_metadata()
+    assert metadata.unique_strains == [-0.05, -0.0025, 0, 0.0025, 0.05]
+    assert pytest.approx(profile.get_ultimate_compressive_strain()) == 0.05
+    assert pytest.approx(profile.get_compressive_strength()) == 600
+    assert pytest.approx(profile.get_elastic_modulus()) == 200e3
+
+    # reassigning an attribute discards the compiled metadata
+    profile.stresses = [-300, -250, 0, 250, 300]
+    assert profile.get_metadata() is not metadata
+    assert pytest.approx(profile.get_compressive_strength()) == 300
+    assert pytest.approx(profile.get_stress(0.001)) == 100
+
+    # in place mutation requires an explicit recompile
+    profile.strains[-1] = 0.1
+    assert pytest.approx(profile.get_ultimate_compressive_strain()) == 0.05
+    profile.compile()
+    assert pytest.approx(profile.get_ultimate_compressive_strain()) == 0.1
+
+
+@pytest.mark.parametrize(
+    "profile",
+    [
+        ssp.RectangularStressBlock(40, 0.85, 0.77, 0.003),
+        ssp.StressStrainProfile([-0.05, 0, 0.0025, 0.05], [0, 0, 500, 600]),
+        ssp.SteelElasticPlastic(
+            yield_strength=500, elastic_modulus=200e3, fracture_strain=0.05
+        ),
+    ],
+)
+def test_get_stresses(profile):
+    """Tests array evaluation of stress-strain profiles."""
+    strains = np.linspace(-0.1, 0.1, 41).reshape(-1, 1)
+    stresses = profile.get_stresses(strains=strains)
+
+    assert stresses.shape == strains.shape
+    assert pytest.approx(stresses.ravel()) == [
+        profile.get_stress(strain=strain) for strain in strains.ravel()
+    ]
+
+
 def test_piecewise_linear():
     """Tests the piecewise linear profile."""
     with pytest.raises(ValueError, match="must be greater than 1"):